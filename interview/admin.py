@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Resume, Question, InterviewSession, Profile, Feedback
+from .models import Resume, Question, InterviewSession, Profile, Feedback, UserStatsRollup
 
 admin.site.site_title = "Nexora Admin Portal"
 admin.site.site_header = "Nexora Admin Portal"
@@ -74,4 +74,10 @@ class FeedbackAdmin(admin.ModelAdmin):
         ('Feedback Details', {
             'fields': ('rating', 'category', 'message', 'created_at')
         }),
-    )
\ No newline at end of file
+    )
+
+@admin.register(UserStatsRollup)
+class UserStatsRollupAdmin(admin.ModelAdmin):
+    list_display = ('username', 'session_count', 'pass_count', 'updated_at')
+    search_fields = ('username',)
+    readonly_fields = ('updated_at',)
@@ -2,24 +2,39 @@
 
 import re
 import string
+import sys
+import threading
+from collections import Counter, OrderedDict
 from typing import Dict, List, Tuple
 from difflib import SequenceMatcher
 from datetime import datetime
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+STOPWORDS = frozenset({
+    "a", "an", "the", "is", "and", "or", "of", "in", "to", "for", "on",
+    "with", "as", "by", "at", "it", "that", "this", "are", "was", "be",
+    "from", "if", "you", "your", "can", "will", "what", "how", "why",
+    "i", "we", "they", "he", "she"
+})
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_NON_WORD_RE = re.compile(r'\W+')
+_WORD_RE = re.compile(r"\w+")
+_KEYWORD_SPLIT_RE = re.compile(r"[\s\-/]+")
+
 
 def tokenize(text: str) -> List[str]:
     """Convert text to lowercase tokens without stopwords or punctuation."""
     if not text:
         return []
-    text = text.lower().translate(str.maketrans('', '', string.punctuation))
-    tokens = re.split(r'\W+', text)
-    stopwords = {
-        "a", "an", "the", "is", "and", "or", "of", "in", "to", "for", "on",
-        "with", "as", "by", "at", "it", "that", "this", "are", "was", "be",
-        "from", "if", "you", "your", "can", "will", "what", "how", "why",
-        "i", "we", "they", "he", "she"
-    }
-    return [t for t in tokens if t and t not in stopwords]
+    text = text.lower().translate(_PUNCT_TABLE)
+    tokens = _NON_WORD_RE.split(text)
+    return [t for t in tokens if t and t not in STOPWORDS]
 
 
 def keyword_match_score(user_ans: str, correct_keywords: List[str]) -> float:
@@ -38,8 +53,128 @@ def keyword_match_score(user_ans: str, correct_keywords: List[str]) -> float:
 # Composite scoring
 # ------------------------
 
-def _fuzzy_token_hit(user_tokens: List[str], term: str, threshold: float = 0.84) -> bool:
-    """Loose fuzzy contains: true if any user token is similar to term above threshold."""
+FUZZY_THRESHOLD = 0.84
+FUZZY_ENGINES = ("fast", "difflib")
+_fuzzy_engine = "fast"
+
+
+def set_fuzzy_engine(name: str) -> None:
+    """Select the fuzzy matcher: "fast" (default) or the reference "difflib" loop."""
+    global _fuzzy_engine
+    if name not in FUZZY_ENGINES:
+        raise ValueError(f"Unknown fuzzy engine {name!r}; expected one of {FUZZY_ENGINES}")
+    _fuzzy_engine = name
+
+
+def get_fuzzy_engine() -> str:
+    return _fuzzy_engine
+
+
+def _ratio_bound(matches: int, length: int) -> float:
+    # Same arithmetic as difflib's _calculate_ratio, so bounds compare exactly
+    return 2.0 * matches / length if length else 1.0
+
+
+class FuzzyTerm:
+    """An expected term prepared for repeated fuzzy lookups.
+
+    Holds a SequenceMatcher with the term as its (hashed) second sequence,
+    the term's character counts and the token lengths that can possibly
+    reach the threshold.
+    """
+
+    __slots__ = ('term', 'counts', 'lengths', 'matcher', 'threshold')
+
+    def __init__(self, term: str, threshold: float = FUZZY_THRESHOLD):
+        self.term = term
+        self.threshold = threshold
+        self.counts = Counter(term)
+        self.matcher = SequenceMatcher(None, '', term)
+        n = len(term)
+        # ratio <= 2*min(n, m)/(n + m); keep only lengths where that can pass
+        lo = n
+        while lo > 4 and _ratio_bound(lo - 1, n + lo - 1) >= threshold:
+            lo -= 1
+        if threshold <= 0:
+            # Every ratio passes, so no longer token can be ruled out
+            hi = sys.maxsize - 1
+        else:
+            hi = n
+            while _ratio_bound(n, n + hi + 1) >= threshold:
+                hi += 1
+        self.lengths = range(lo, hi + 1)
+
+
+class FuzzyTokens:
+    """Answer tokens bucketed by length, with lazily computed character counts."""
+
+    __slots__ = ('by_length', 'counts')
+
+    def __init__(self, user_tokens):
+        self.by_length = {}
+        for ut in set(user_tokens):
+            if len(ut) > 3:
+                self.by_length.setdefault(len(ut), []).append(ut)
+        self.counts = {}
+
+    def hit(self, fterm: FuzzyTerm, memo: dict = None) -> bool:
+        """True if any token is similar to the term at the term's threshold.
+
+        Length and character-count bounds prune candidates; survivors get the
+        exact SequenceMatcher ratio, so decisions match the difflib loop.
+        ``memo`` ((term, token) -> similar) lets a batch share those decisions
+        across answers.
+        """
+        term = fterm.term
+        n = len(term)
+        threshold = fterm.threshold
+        matcher = None
+        for m, bucket in self.by_length.items():
+            if m not in fterm.lengths:
+                continue
+            length = n + m
+            for ut in bucket:
+                if ut == term:
+                    return True
+                if memo is not None:
+                    similar = memo.get((term, ut))
+                    if similar is None:
+                        similar = memo[(term, ut)] = self._similar(fterm, ut, length)
+                    if similar:
+                        return True
+                    continue
+                ut_counts = self.counts.get(ut)
+                if ut_counts is None:
+                    ut_counts = self.counts[ut] = Counter(ut)
+                common = 0
+                for ch, k in ut_counts.items():
+                    tk = fterm.counts.get(ch)
+                    if tk:
+                        common += k if k < tk else tk
+                if _ratio_bound(common, length) < threshold:
+                    continue
+                if matcher is None:
+                    matcher = fterm.matcher
+                matcher.set_seq1(ut)
+                if matcher.ratio() >= threshold:
+                    return True
+        return False
+
+    def _similar(self, fterm: FuzzyTerm, ut: str, length: int) -> bool:
+        # hit()'s per-token decision, for memoized lookups
+        common = 0
+        for ch, k in Counter(ut).items():
+            tk = fterm.counts.get(ch)
+            if tk:
+                common += k if k < tk else tk
+        if _ratio_bound(common, length) < fterm.threshold:
+            return False
+        fterm.matcher.set_seq1(ut)
+        return fterm.matcher.ratio() >= fterm.threshold
+
+
+def _fuzzy_token_hit_difflib(user_tokens: List[str], term: str, threshold: float = FUZZY_THRESHOLD) -> bool:
+    """Reference matcher: pairwise SequenceMatcher ratio over every token."""
     if not term:
         return False
     term = term.lower().strip()
@@ -52,7 +187,217 @@ def _fuzzy_token_hit(user_tokens: List[str], term: str, threshold: float = 0.84)
     return False
 
 
-def _smart_keyword_score(user_ans: str, correct_keywords: List[str], pre_tokenized: List[str] = None) -> Tuple[float, dict]:
+def _fuzzy_token_hit(user_tokens: List[str], term: str, threshold: float = FUZZY_THRESHOLD) -> bool:
+    """Loose fuzzy contains: true if any user token is similar to term above threshold."""
+    if _fuzzy_engine == "difflib":
+        return _fuzzy_token_hit_difflib(user_tokens, term, threshold)
+    if not term:
+        return False
+    term = term.lower().strip()
+    if term in user_tokens:
+        return True
+    if len(term) <= 3:
+        return False
+    return FuzzyTokens(user_tokens).hit(FuzzyTerm(term, threshold))
+
+
+def fuzzy_parity_mismatches(user_tokens: List[str], terms: List[str],
+                            threshold: float = FUZZY_THRESHOLD) -> List[str]:
+    """Return the terms on which the fast engine disagrees with difflib (should be empty)."""
+    tokens = FuzzyTokens(user_tokens)
+    mismatches = []
+    for term in terms:
+        norm = term.lower().strip() if term else term
+        if norm and norm in user_tokens:
+            fast = True
+        elif norm and len(norm) > 3:
+            fast = tokens.hit(FuzzyTerm(norm, threshold))
+        else:
+            fast = False
+        if fast != _fuzzy_token_hit_difflib(user_tokens, term, threshold):
+            mismatches.append(term)
+    return mismatches
+
+
+def _profile_source(correct_keywords, pre_tokenized):
+    """Snapshot of the inputs a ScoringProfile was built from (for cache checks)."""
+    return (
+        list(correct_keywords) if isinstance(correct_keywords, list) else correct_keywords,
+        list(pre_tokenized) if isinstance(pre_tokenized, list) else pre_tokenized,
+    )
+
+
+class ScoringProfile:
+    """Precompiled expected terms for scoring answers to one question.
+
+    Build once per question (see get_scoring_profile) and call score() per
+    answer; results are identical to the original per-call implementation.
+    """
+
+    __slots__ = ('source', 'total', 'terms', 'fuzzy_terms')
+
+    def __init__(self, correct_keywords: List[str], pre_tokenized: List[str] = None):
+        self.source = _profile_source(correct_keywords, pre_tokenized)
+
+        # Get expected keywords (prefer pre-tokenized)
+        if pre_tokenized and isinstance(pre_tokenized, list):
+            wanted = [t.strip().lower() for t in pre_tokenized if isinstance(t, str) and t.strip()]
+        else:
+            wanted = []
+            for kw in correct_keywords or []:
+                if isinstance(kw, str) and kw.strip():
+                    parts = [p.strip().lower() for p in _KEYWORD_SPLIT_RE.split(kw) if p.strip()]
+                    wanted.extend(parts)
+            wanted = list(set(wanted))
+
+        # Duplicate terms each count towards matched/total, so keep multiplicity
+        counts = {}
+        for term in wanted:
+            term = term.lower().strip()
+            counts[term] = counts.get(term, 0) + 1
+        self.total = len(wanted)
+        self.terms = tuple(counts.items())
+        # Only terms longer than 3 chars are eligible for fuzzy matching
+        self.fuzzy_terms = {term: FuzzyTerm(term) for term in counts if len(term) > 3}
+
+    @classmethod
+    def from_compiled(cls, correct_keywords: List[str], pre_tokenized: List[str], compiled) -> 'ScoringProfile':
+        """Rebuild a profile from compile() output (e.g. stored in the question snapshot)."""
+        total, terms = compiled
+        profile = cls.__new__(cls)
+        profile.source = _profile_source(correct_keywords, pre_tokenized)
+        profile.total = total
+        profile.terms = tuple((term, count) for term, count in terms)
+        profile.fuzzy_terms = {term: FuzzyTerm(term) for term, _ in profile.terms if len(term) > 3}
+        return profile
+
+    def compile(self) -> list:
+        """JSON-serializable [total, [[term, count], ...]] that from_compiled() accepts."""
+        return [self.total, [[term, count] for term, count in self.terms]]
+
+    def score(self, user_ans: str) -> Tuple[float, dict]:
+        """Return (score, details_dict) for one answer."""
+        if not user_ans or not self.total:
+            return 0.0, {'matched': 0, 'total': 0, 'density': 0, 'quality': 0}
+
+        tokens = tokenize(user_ans)
+        word_count = len(_WORD_RE.findall(user_ans))
+        token_set = set(tokens)
+        if _fuzzy_engine == "difflib":
+            fuzzy_hit = lambda term: _fuzzy_token_hit_difflib(tokens, term)
+        else:
+            fuzzy_tokens = FuzzyTokens(token_set)
+            fuzzy_hit = lambda term: term in self.fuzzy_terms and fuzzy_tokens.hit(self.fuzzy_terms[term])
+
+        # 1. KEYWORD MATCHING (60% weight - primary but not overwhelming)
+        # Count fuzzy matches
+        matched = 0
+        for term, count in self.terms:
+            if term in token_set or (term and fuzzy_hit(term)):
+                matched += count
+        coverage_ratio = matched / self.total
+
+        # Apply bonus for high coverage to reward comprehensive answers
+        if coverage_ratio >= 0.8:  # 80%+ coverage gets a boost
+            coverage_score = min(1.0, coverage_ratio * 1.1)  # 10% bonus
+        else:
+            coverage_score = coverage_ratio
+
+        # 2. KEYWORD DENSITY (20% weight - very lenient)
+        # Rewards ANY reasonable answer length
+        if word_count > 0:
+            density_pct = (matched / word_count) * 100
+            # Ultra-wide acceptable range: 0.5-25 keywords per 100 words
+            if 0.5 <= density_pct <= 25:
+                density_score = 1.0  # Full credit for any reasonable density
+            elif density_pct > 25:
+                # Very keyword-stuffed, minimal penalty
+                density_score = max(0.9, 1.0 - (density_pct - 25) / 200)
+            else:
+                # Very sparse (< 0.5%), still generous
+                density_score = max(0.7, density_pct / 0.6)
+        else:
+            density_score = 0.0
+
+        # 3. TECHNICAL SUBSTANCE (20% weight - increased from 15%)
+        # Meaningful technical terms show depth - now weighted more
+        long_terms = sum(1 for t in token_set if len(t) >= 6)
+        # More lenient: expect 4-5 technical terms instead of 6
+        substance_score = min(1.0, long_terms / 5.0)
+
+        # Combined weighted score - optimized for fairness
+        final_score = (
+            0.60 * coverage_score +       # Keywords with bonus for high coverage
+            0.20 * density_score +         # Very lenient on answer length
+            0.20 * substance_score         # Technical depth now more valued
+        )
+
+        details = {
+            'matched': matched,
+            'total': self.total,
+            'density': round(density_pct if word_count > 0 else 0, 1),
+            'quality': round(substance_score * 100, 1),
+            'coverage_ratio': round(coverage_ratio, 3),
+            'density_score': round(density_score, 3),
+            'substance_score': round(substance_score, 3)
+        }
+
+        return max(0.0, min(1.0, final_score)), details
+
+
+SCORING_PROFILE_CACHE_SIZE = 4096
+_scoring_profiles = OrderedDict()
+# Guards the LRU's reordering/eviction across request threads; profiles are built outside it
+_scoring_profiles_lock = threading.Lock()
+# question_id -> (keywords, tokens, compiled profile) or None; see set_compiled_profile_lookup
+_compiled_profile_lookup = None
+
+
+def set_compiled_profile_lookup(lookup) -> None:
+    """Register where precompiled profiles come from (the question snapshot), or None."""
+    global _compiled_profile_lookup
+    _compiled_profile_lookup = lookup
+
+
+def _compiled_profile(question_id, correct_keywords, pre_tokenized):
+    """Profile from precompiled data, if there is any for exactly these inputs."""
+    if _compiled_profile_lookup is None:
+        return None
+    try:
+        compiled = _compiled_profile_lookup(question_id)
+    except Exception:
+        return None
+    if not compiled or not compiled[2]:
+        return None
+    keywords, tokens, scoring = compiled
+    if _profile_source(keywords, tokens) != _profile_source(correct_keywords, pre_tokenized):
+        return None
+    return ScoringProfile.from_compiled(correct_keywords, pre_tokenized, scoring)
+
+
+def get_scoring_profile(question_id, correct_keywords: List[str], pre_tokenized: List[str] = None) -> ScoringProfile:
+    """Return the cached ScoringProfile for a question, rebuilding it if its terms changed."""
+    if question_id is None:
+        return ScoringProfile(correct_keywords, pre_tokenized)
+    source = _profile_source(correct_keywords, pre_tokenized)
+    with _scoring_profiles_lock:
+        profile = _scoring_profiles.get(question_id)
+        if profile is not None and profile.source == source:
+            _scoring_profiles.move_to_end(question_id)
+            return profile
+    profile = _compiled_profile(question_id, correct_keywords, pre_tokenized)
+    if profile is None:
+        profile = ScoringProfile(correct_keywords, pre_tokenized)
+    with _scoring_profiles_lock:
+        _scoring_profiles[question_id] = profile
+        _scoring_profiles.move_to_end(question_id)
+        while len(_scoring_profiles) > SCORING_PROFILE_CACHE_SIZE:
+            _scoring_profiles.popitem(last=False)
+    return profile
+
+
+def _smart_keyword_score(user_ans: str, correct_keywords: List[str], pre_tokenized: List[str] = None,
+                         question_id=None) -> Tuple[float, dict]:
     """Unified smart scoring that combines keyword matching with answer quality metrics.
     
     Returns:
@@ -60,78 +405,149 @@ def _smart_keyword_score(user_ans: str, correct_keywords: List[str], pre_tokeniz
     """
     if not user_ans:
         return 0.0, {'matched': 0, 'total': 0, 'density': 0, 'quality': 0}
-    
-    tokens = tokenize(user_ans)
-    words = re.findall(r"\w+", user_ans)
-    word_count = len(words)
-    
-    # Get expected keywords (prefer pre-tokenized)
-    if pre_tokenized and isinstance(pre_tokenized, list):
-        wanted = [t.strip().lower() for t in pre_tokenized if isinstance(t, str) and t.strip()]
-    else:
-        if not correct_keywords:
-            return 0.0, {'matched': 0, 'total': 0, 'density': 0, 'quality': 0}
-        wanted = []
-        for kw in correct_keywords:
-            if isinstance(kw, str) and kw.strip():
-                parts = [p.strip().lower() for p in re.split(r"[\s\-/]+", kw) if p.strip()]
-                wanted.extend(parts)
-        wanted = list(set(wanted))
-    
-    if not wanted:
-        return 0.0, {'matched': 0, 'total': 0, 'density': 0, 'quality': 0}
-    
-    # 1. KEYWORD MATCHING (60% weight - primary but not overwhelming)
-    # Count fuzzy matches
-    matched = sum(1 for term in wanted if _fuzzy_token_hit(tokens, term))
-    coverage_ratio = matched / len(wanted)
-    
-    # Apply bonus for high coverage to reward comprehensive answers
-    if coverage_ratio >= 0.8:  # 80%+ coverage gets a boost
-        coverage_score = min(1.0, coverage_ratio * 1.1)  # 10% bonus
-    else:
-        coverage_score = coverage_ratio
-    
-    # 2. KEYWORD DENSITY (20% weight - very lenient)
-    # Rewards ANY reasonable answer length
-    if word_count > 0:
-        density_pct = (matched / word_count) * 100
-        # Ultra-wide acceptable range: 0.5-25 keywords per 100 words
-        if 0.5 <= density_pct <= 25:
-            density_score = 1.0  # Full credit for any reasonable density
-        elif density_pct > 25:
-            # Very keyword-stuffed, minimal penalty
-            density_score = max(0.9, 1.0 - (density_pct - 25) / 200)
+    return get_scoring_profile(question_id, correct_keywords, pre_tokenized).score(user_ans)
+
+
+def _empty_score_details() -> dict:
+    return {'matched': 0, 'total': 0, 'density': 0, 'quality': 0}
+
+
+def score_many(answers: List[str], questions: List[dict]) -> List[Tuple[float, dict]]:
+    """Score many answers at once; element i equals _smart_keyword_score for pair i.
+
+    ``questions[i]`` is the question ``answers[i]`` answers: a dict with
+    'keywords' and optionally 'tokens' (pre-tokenized) and 'id' (for the
+    ScoringProfile cache).
+
+    Each distinct answer text is tokenized once. Verbatim term presence for
+    every (answer, expected term) pair is read from one boolean answer x term
+    matrix, and coverage, density and substance are computed for all pairs
+    in a single NumPy pass. Fuzzy matching is still per term, and only for
+    terms that are not present verbatim.
+    """
+    if len(answers) != len(questions):
+        raise ValueError("score_many needs exactly one question per answer")
+    if not NUMPY_AVAILABLE:
+        return [
+            _smart_keyword_score(ans, q.get('keywords'), q.get('tokens'), question_id=q.get('id'))
+            for ans, q in zip(answers, questions)
+        ]
+
+    results = [(0.0, _empty_score_details()) for _ in answers]
+
+    # Pairs that need scoring, and each distinct answer text once
+    pairs = []        # (result index, profile, answer row)
+    answer_rows = {}  # text -> row
+    texts = []
+    profiles = {}     # questions without an id share profiles within the batch
+    for i, (ans, q) in enumerate(zip(answers, questions)):
+        if not ans:
+            continue
+        profile = None
+        if q.get('id') is None:
+            try:
+                key = (tuple(q.get('keywords') or ()), tuple(q['tokens']) if isinstance(q.get('tokens'), list) else None)
+                profile = profiles.get(key)
+            except TypeError:
+                key = None
+        if profile is None:
+            profile = get_scoring_profile(q.get('id'), q.get('keywords'), q.get('tokens'))
+            if q.get('id') is None and key is not None:
+                profiles[key] = profile
+        if not profile.total:
+            continue
+        row = answer_rows.get(ans)
+        if row is None:
+            row = answer_rows[ans] = len(texts)
+            texts.append(ans)
+        pairs.append((i, profile, row))
+    if not pairs:
+        return results
+
+    token_lists = []
+    token_sets = []
+    word_counts = np.empty(len(texts))
+    long_counts = np.empty(len(texts))
+    for row, text in enumerate(texts):
+        tokens = tokenize(text)
+        token_set = set(tokens)
+        token_lists.append(tokens)
+        token_sets.append(token_set)
+        word_counts[row] = len(_WORD_RE.findall(text))
+        long_counts[row] = sum(1 for t in token_set if len(t) >= 6)
+
+    # One row per (pair, expected term)
+    vocabulary = {}
+    term_pair, term_col, term_count, term_row = [], [], [], []
+    for p, (_, profile, row) in enumerate(pairs):
+        for term, count in profile.terms:
+            term_pair.append(p)
+            term_col.append(vocabulary.setdefault(term, len(vocabulary)))
+            term_count.append(count)
+            term_row.append(row)
+
+    presence = np.zeros((len(texts), len(vocabulary)), dtype=bool)
+    for row, token_set in enumerate(token_sets):
+        cols = [vocabulary[t] for t in token_set if t in vocabulary]
+        if cols:
+            presence[row, cols] = True
+    hits = presence[term_row, term_col]
+
+    # Fuzzy fallback for terms missing verbatim, same rules as ScoringProfile.score
+    terms = list(vocabulary)
+    fuzzy_tokens = {}
+    similar = {}
+    for k in np.flatnonzero(~hits).tolist():
+        term = terms[term_col[k]]
+        if not term:
+            continue
+        row = term_row[k]
+        if _fuzzy_engine == "difflib":
+            hit = _fuzzy_token_hit_difflib(token_lists[row], term)
         else:
-            # Very sparse (< 0.5%), still generous
-            density_score = max(0.7, density_pct / 0.6)
-    else:
-        density_score = 0.0
-    
-    # 3. TECHNICAL SUBSTANCE (20% weight - increased from 15%)
-    # Meaningful technical terms show depth - now weighted more
-    long_terms = {t for t in tokens if len(t) >= 6}
-    # More lenient: expect 4-5 technical terms instead of 6
-    substance_score = min(1.0, len(long_terms) / 5.0)
-    
-    # Combined weighted score - optimized for fairness
-    final_score = (
-        0.60 * coverage_score +       # Keywords with bonus for high coverage
-        0.20 * density_score +         # Very lenient on answer length
-        0.20 * substance_score         # Technical depth now more valued
-    )
-    
-    details = {
-        'matched': matched,
-        'total': len(wanted),
-        'density': round(density_pct if word_count > 0 else 0, 1),
-        'quality': round(substance_score * 100, 1),
-        'coverage_ratio': round(coverage_ratio, 3),
-        'density_score': round(density_score, 3),
-        'substance_score': round(substance_score, 3)
-    }
-    
-    return max(0.0, min(1.0, final_score)), details
+            fterm = pairs[term_pair[k]][1].fuzzy_terms.get(term)
+            if fterm is None:
+                continue
+            tokens = fuzzy_tokens.get(row)
+            if tokens is None:
+                tokens = fuzzy_tokens[row] = FuzzyTokens(token_sets[row])
+            hit = tokens.hit(fterm, similar)
+        if hit:
+            hits[k] = True
+
+    matched = np.bincount(term_pair, weights=np.asarray(term_count) * hits, minlength=len(pairs))
+    total = np.array([profile.total for _, profile, _ in pairs], dtype=float)
+    rows = np.array([row for _, _, row in pairs])
+    word_count = word_counts[rows]
+    long_terms = long_counts[rows]
+
+    # Same arithmetic, in the same order, as ScoringProfile.score
+    coverage_ratio = matched / total
+    coverage_score = np.where(coverage_ratio >= 0.8, np.minimum(1.0, coverage_ratio * 1.1), coverage_ratio)
+    has_words = word_count > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        density_pct = np.where(has_words, (matched / word_count) * 100, 0.0)
+    density_score = np.where(
+        (0.5 <= density_pct) & (density_pct <= 25), 1.0,
+        np.where(density_pct > 25,
+                 np.maximum(0.9, 1.0 - (density_pct - 25) / 200),
+                 np.maximum(0.7, density_pct / 0.6)))
+    density_score = np.where(has_words, density_score, 0.0)
+    substance_score = np.minimum(1.0, long_terms / 5.0)
+    final_score = 0.60 * coverage_score + 0.20 * density_score + 0.20 * substance_score
+    final_score = np.maximum(0.0, np.minimum(1.0, final_score))
+
+    for p, (i, profile, _) in enumerate(pairs):
+        results[i] = (float(final_score[p]), {
+            'matched': int(matched[p]),
+            'total': profile.total,
+            'density': round(float(density_pct[p]), 1) if has_words[p] else 0,
+            'quality': round(float(substance_score[p]) * 100, 1),
+            'coverage_ratio': round(float(coverage_ratio[p]), 3),
+            'density_score': round(float(density_score[p]), 3),
+            'substance_score': round(float(substance_score[p]), 3)
+        })
+    return results
 
 
 def _structure_features(user_ans: str) -> Tuple[float, float, float]:
@@ -246,7 +662,8 @@ def composite_answer_score(user_ans: str,
                            correct_keywords: List[str],
                            level: str = 'beginner',
                            reference_answer: str = None,
-                           pre_tokenized: List[str] = None) -> float:
+                           pre_tokenized: List[str] = None,
+                           question_id=None) -> float:
     """Unified smart scoring combining keyword matching with answer quality.
     
     Single algorithm that considers:
@@ -257,32 +674,53 @@ def composite_answer_score(user_ans: str,
     if not user_ans:
         return 0.0
     
-    score, _ = _smart_keyword_score(user_ans, correct_keywords, pre_tokenized=pre_tokenized)
+    score, _ = _smart_keyword_score(user_ans, correct_keywords, pre_tokenized=pre_tokenized, question_id=question_id)
     return score
 
 
 def composite_breakdown(user_ans: str,
                         correct_keywords: List[str],
                         level: str = 'beginner',
-                        pre_tokenized: List[str] = None) -> dict:
+                        pre_tokenized: List[str] = None,
+                        question_id=None) -> dict:
     """Return breakdown dict using unified smart scoring algorithm.
     
     Returns single score with detailed component breakdown.
     """
     if not user_ans:
-        return {
-            'final': 0.0,
-            'matched_keywords': 0,
-            'total_keywords': 0,
-            'keyword_density': 0.0,
-            'quality_score': 0.0,
-            # Keep legacy fields for backward compatibility
-            'coverage': 0.0,
-            'depth': 0.0
-        }
-    
-    score, details = _smart_keyword_score(user_ans, correct_keywords, pre_tokenized=pre_tokenized)
+        return _empty_breakdown()
     
+    score, details = _smart_keyword_score(user_ans, correct_keywords, pre_tokenized=pre_tokenized, question_id=question_id)
+    return _breakdown(score, details)
+
+
+def composite_scores_and_breakdowns(answers: List[str], questions: List[dict]) -> List[Tuple[float, dict]]:
+    """(composite_answer_score, composite_breakdown) per answer from one score_many pass."""
+    return [
+        (score, _breakdown(score, details)) if ans else (0.0, _empty_breakdown())
+        for ans, (score, details) in zip(answers, score_many(answers, questions))
+    ]
+
+
+def composite_breakdown_many(answers: List[str], questions: List[dict]) -> List[dict]:
+    """composite_breakdown for many answers in one score_many pass."""
+    return [bd for _, bd in composite_scores_and_breakdowns(answers, questions)]
+
+
+def _empty_breakdown() -> dict:
+    return {
+        'final': 0.0,
+        'matched_keywords': 0,
+        'total_keywords': 0,
+        'keyword_density': 0.0,
+        'quality_score': 0.0,
+        # Keep legacy fields for backward compatibility
+        'coverage': 0.0,
+        'depth': 0.0
+    }
+
+
+def _breakdown(score: float, details: dict) -> dict:
     return {
         'final': round(score, 3),
         'matched_keywords': details['matched'],
@@ -319,12 +757,17 @@ def evaluate_user_level(user_answers: Dict[str, str],
     total_score = 0.0
     count = 0
 
-    for qid, keywords in level_bank.items():
-        ans = user_answers.get(qid, "")
-        if use_composite:
-            score = composite_answer_score(ans, keywords, level=level)
-        else:
-            score = keyword_match_score(ans, keywords)
+    if use_composite:
+        # Whole level bank in one vectorized pass
+        scored = score_many(
+            [user_answers.get(qid, "") for qid in level_bank],
+            [{'keywords': keywords} for keywords in level_bank.values()],
+        )
+        scores = [score for score, _ in scored]
+    else:
+        scores = [keyword_match_score(user_answers.get(qid, ""), keywords) for qid, keywords in level_bank.items()]
+
+    for qid, score in zip(level_bank, scores):
         flag = flag_for_score(score, threshold_same, threshold_higher)
         per_question[qid] = {"score": round(score, 2), "flag": flag}
         total_score += score
@@ -4,3 +4,39 @@ from django.apps import AppConfig
 class InterviewConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview'
+
+    def ready(self):
+        from django.conf import settings
+        from .answer_evaluation import set_fuzzy_engine, set_compiled_profile_lookup
+        from .question_index import connect_signals, compiled_scoring
+
+        # Keep the in-process question index in step with Question saves/deletes
+        connect_signals()
+        # Scoring profiles come precompiled from the question snapshot when one is loaded
+        set_compiled_profile_lookup(compiled_scoring)
+        # Fold every saved InterviewSession into its user's UserStatsRollup
+        from .rollups import connect_signals as connect_rollup_signals
+        connect_rollup_signals()
+        # Drop cached request.nexora profiles/resumes when those rows change
+        from .request_context import connect_signals as connect_context_signals
+        connect_context_signals()
+        # "fast" (default) or "difflib" to fall back to the reference matcher
+        set_fuzzy_engine(getattr(settings, 'NEXORA_FUZZY_ENGINE', 'fast'))
+
+        # spaCy loads lazily on the first resume parse; optionally pay for it at startup
+        from . import resume_parser
+        resume_parser.configure_nlp(
+            model=getattr(settings, 'NEXORA_SPACY_MODEL', None),
+            disabled_components=getattr(settings, 'NEXORA_SPACY_DISABLED_COMPONENTS', None),
+        )
+        resume_parser.configure_ocr(
+            processes=getattr(settings, 'NEXORA_OCR_PROCESSES', None),
+            dpi=getattr(settings, 'NEXORA_OCR_DPI', None),
+        )
+        resume_parser.configure_pdf(
+            max_pages=getattr(settings, 'NEXORA_PDF_MAX_PAGES', None),
+            max_chars=getattr(settings, 'NEXORA_PDF_MAX_CHARS', None),
+            time_budget=getattr(settings, 'NEXORA_PDF_TIME_BUDGET', None),
+        )
+        if getattr(settings, 'NEXORA_WARM_NLP', False):
+            resume_parser.warm_up()
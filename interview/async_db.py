@@ -0,0 +1,194 @@
+# interview/async_db.py
+# Async MongoDB reads and bounded executors for the ASGI request path (async_views)
+
+import asyncio
+import datetime
+import logging
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db.models import DEFERRED
+
+from .models import InterviewSession, Profile, Resume, UserStatsRollup
+
+logger = logging.getLogger(__name__)
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    MOTOR_AVAILABLE = True
+except ImportError:
+    MOTOR_AVAILABLE = False
+
+DEFAULT_ASYNC_CONFIG = {
+    # Serve dashboard, interview_question and results with async_views (set by nexora/asgi.py)
+    'VIEWS': False,
+    # Use motor when it is installed; otherwise pymongo on a bounded thread pool
+    'MOTOR': True,
+    # Threads for blocking pymongo reads (and other sync helpers) off the event loop
+    'DB_THREADS': 32,
+    # Processes for CPU-bound scoring; 0 = run it on the thread pool instead
+    'CPU_WORKERS': 2,
+}
+
+
+def get_async_config():
+    config = dict(DEFAULT_ASYNC_CONFIG)
+    config.update(getattr(settings, 'NEXORA_ASYNC', {}))
+    return config
+
+
+_executor_lock = threading.Lock()
+_db_executor = None
+_cpu_executor = None
+# One motor client per event loop: motor clients cannot be shared across loops
+_motor_clients = weakref.WeakKeyDictionary()
+
+
+def get_db_executor():
+    global _db_executor
+    if _db_executor is None:
+        with _executor_lock:
+            if _db_executor is None:
+                _db_executor = ThreadPoolExecutor(
+                    max_workers=max(1, get_async_config()['DB_THREADS']),
+                    thread_name_prefix='nexora-db',
+                )
+    return _db_executor
+
+
+def get_cpu_executor():
+    """Process pool for scoring, or None when CPU_WORKERS is 0.
+
+    Created on first use, when the server already runs threads, so workers
+    are spawned rather than forked. They only import answer_evaluation.
+    """
+    global _cpu_executor
+    workers = get_async_config()['CPU_WORKERS']
+    if not workers:
+        return None
+    if _cpu_executor is None:
+        with _executor_lock:
+            if _cpu_executor is None:
+                from .answer_evaluation import get_fuzzy_engine, set_fuzzy_engine
+                _cpu_executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=set_fuzzy_engine,
+                    initargs=(get_fuzzy_engine(),),
+                )
+    return _cpu_executor
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """Run a blocking call on the bounded thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), partial(func, *args, **kwargs))
+
+
+async def run_cpu(func, *args, **kwargs):
+    """Run a CPU-bound, Django-free call in the process pool.
+
+    ``func`` and its arguments must be picklable. Falls back to the thread
+    pool when CPU_WORKERS is 0 or the pool has broken (e.g. a worker died).
+    """
+    executor = get_cpu_executor()
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+        except Exception as e:
+            if not _is_broken_pool(e):
+                raise
+            logger.error(f"Scoring process pool failed ({e}); scoring in a thread instead")
+            _reset_cpu_executor()
+    return await run_in_thread(func, *args, **kwargs)
+
+
+def _is_broken_pool(exc):
+    from concurrent.futures.process import BrokenProcessPool
+    return isinstance(exc, BrokenProcessPool)
+
+
+def _reset_cpu_executor():
+    global _cpu_executor
+    with _executor_lock:
+        executor, _cpu_executor = _cpu_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _db_name():
+    return settings.DATABASES['default']['NAME']
+
+
+def _motor_db():
+    loop = asyncio.get_running_loop()
+    client = _motor_clients.get(loop)
+    if client is None:
+        host = settings.DATABASES['default'].get('CLIENT', {}).get('host', 'localhost')
+        client = _motor_clients[loop] = AsyncIOMotorClient(host)
+    return client[_db_name()]
+
+
+def _use_motor():
+    return MOTOR_AVAILABLE and get_async_config()['MOTOR']
+
+
+async def find_one(model, query, sort=None):
+    """Raw document of ``model``'s collection matching ``query`` (None if none)."""
+    collection = model._meta.db_table
+    if _use_motor():
+        return await _motor_db()[collection].find_one(query, sort=sort)
+    from .db_operations import get_mongo_db
+    return await run_in_thread(lambda: get_mongo_db()[collection].find_one(query, sort=sort))
+
+
+def _to_instance(model, doc):
+    """Model instance from a raw djongo document, as the ORM would load it."""
+    if doc is None:
+        return None
+    names, values = [], []
+    for field in model._meta.concrete_fields:
+        names.append(field.attname)
+        value = doc.get(field.column, DEFERRED)
+        if (settings.USE_TZ and isinstance(value, datetime.datetime)
+                and value.tzinfo is None):
+            # pymongo hands back naive UTC datetimes
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        values.append(value)
+    return model.from_db('default', names, values)
+
+
+async def get_session_data(session_id):
+    """Async db_operations.get_session_data."""
+    session = _to_instance(InterviewSession, await find_one(InterviewSession, {'session_id': session_id}))
+    if session is None:
+        return None
+    return {
+        "username": session.username,
+        "skills": session.skills,
+        "answers": session.answers,
+        "score": session.score,
+        "current_level": session.current_level,
+        "recommended_next_level": session.recommended_next_level,
+        "evaluation_flag": session.evaluation_flag,
+    }
+
+
+async def get_profile(user_id):
+    """The user's Profile (newest first, as Profile.Meta.ordering), or None."""
+    return _to_instance(Profile, await find_one(Profile, {'user_id': user_id}, sort=[('created_at', -1)]))
+
+
+async def get_latest_resume(username):
+    """The user's latest Resume, or None."""
+    return _to_instance(Resume, await find_one(Resume, {'username': username}, sort=[('uploaded_at', -1)]))
+
+
+async def get_stats_rollup(username):
+    """The user's UserStatsRollup, or None when it has not been built yet."""
+    return _to_instance(UserStatsRollup, await find_one(UserStatsRollup, {'username': username}))
@@ -0,0 +1,134 @@
+# interview/async_views.py
+# Async versions of the interview flow's hot views, served under ASGI (see nexora/asgi.py)
+#
+# Reads go through async_db (motor, or pymongo on a bounded thread pool),
+# answer scoring runs in async_db's process pool, and anything that still
+# needs the synchronous djongo ORM (saving a finished interview, creating a
+# missing profile or rollup) is handed to sync_to_async. The session and
+# question-selection steps and the template contexts are the sync views'
+# own helpers.
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.shortcuts import render, redirect
+
+from .answer_evaluation import composite_answer_score, composite_scores_and_breakdowns
+from .async_db import get_session_data, get_stats_rollup, run_cpu, run_in_thread
+from .question_index import get_question_index
+from .rollups import get_user_rollup
+from .utils import get_question, skill_category_map
+from . import views
+
+
+def _resolve_user_and_session(request):
+    # Both are lazy database reads; touching them here keeps them off the event loop
+    request.session.keys()
+    return request.user.is_authenticated
+
+
+def async_login_required(view):
+    """login_required(login_url='/login/') for async views."""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if not await sync_to_async(_resolve_user_and_session)(request):
+            return redirect_to_login(request.get_full_path(), '/login/')
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+async def _render(request, template_name, context):
+    return await run_in_thread(render, request, template_name, context)
+
+
+@async_login_required
+async def dashboard(request):
+    try:
+        profile = await request.nexora.aprofile()
+        latest_resume = await request.nexora.alatest_resume()
+        rollup = await get_stats_rollup(request.user.username)
+        if rollup is None:
+            # First visit: the rollup is built from history through the ORM
+            rollup = await sync_to_async(get_user_rollup)(request.user.username)
+        context = views._dashboard_context(profile, latest_resume, rollup)
+        return await _render(request, 'interview/dashboard_new.html', context)
+    except Exception:
+        return redirect('upload_resume')
+
+
+@async_login_required
+async def interview_question_view(request):
+    response = views._interview_gate(request)
+    if response is not None:
+        return response
+    # Question lookups below are served from the loaded index; (re)loading it may query the bank
+    await run_in_thread(get_question_index)
+
+    # Adaptive mode branch
+    if request.session.get('interview_mode', 'fixed') == 'adaptive':
+        state = await run_in_thread(views._load_adaptive_interview, request)
+        if state is None:
+            return redirect('interview_dashboard')
+
+        # Handle submission
+        if request.method == 'POST':
+            answer_text = request.POST.get('answer', '')
+            try:
+                score = await run_cpu(composite_answer_score, answer_text, **views._scoring_kwargs(state['current_q']))
+            except Exception:
+                score = 0.0
+            if views._record_adaptive_answer(request, state, answer_text, score):
+                # Load request.nexora through async_db; saving the session needs the ORM
+                await request.nexora.aprofile()
+                await request.nexora.alatest_resume()
+                return await sync_to_async(views._complete_adaptive_interview)(
+                    request, state['skills'], state['base_level'], state['answered_entries'])
+            await run_in_thread(views._next_adaptive_question, request, state)
+            return redirect('interview_question')
+
+        return await _render(request, 'interview/question_page.html', views._adaptive_question_context(state))
+
+    # Fixed mode (legacy path)
+    state = views._load_fixed_interview(request)
+    if state is None:
+        return redirect('interview_dashboard')
+
+    if request.method == 'POST':
+        if views._record_fixed_answer(request, state, request.POST.get('answer', '')):
+            # Load request.nexora through async_db; saving the session needs the ORM
+            await request.nexora.aprofile()
+            await request.nexora.alatest_resume()
+            return await sync_to_async(views._complete_fixed_interview)(
+                request, state['question_ids'], state['user_answers'], state['interview_level'])
+        return redirect('interview_question')
+
+    question = await run_in_thread(get_question, state['question_ids'][state['current_index']]) or {}
+    return await _render(request, 'interview/question_page.html', views._fixed_question_context(state, question))
+
+
+@async_login_required
+async def results_view(request, session_id):
+    session_data = await get_session_data(session_id)
+
+    if not session_data:
+        return redirect('interview_dashboard')
+
+    # Verify it's the current user's session
+    if session_data['username'] != request.user.username:
+        return redirect('interview_dashboard')
+
+    answers = session_data['answers'] if isinstance(session_data.get('answers'), dict) else {}
+    # Only sessions saved before breakdowns were stored at submission need scoring here
+    legacy = views._legacy_answers(answers)
+    if legacy:
+        skill_to_category = {}
+        try:
+            skill_to_category = skill_category_map(await request.nexora.alatest_resume())
+        except Exception as e:
+            print(f"Error loading skill categories: {e}")
+        scored = await run_cpu(composite_scores_and_breakdowns, *views._legacy_scoring_inputs(legacy))
+        views._apply_legacy_analytics(legacy, scored, skill_to_category)
+
+    context = views._results_context(session_id, session_data, answers)
+    return await _render(request, 'interview/results_page.html', context)
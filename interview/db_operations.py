@@ -3,10 +3,27 @@
 from .models import Resume, Question, InterviewSession, Profile
 from django.contrib.auth.models import User
 from django.utils.crypto import get_random_string
+from .question_index import get_question_index
+from .rollups import PASS_THRESHOLD
+from collections import namedtuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+_mongo_client = None
+
+
+def get_mongo_db():
+    """Return a raw pymongo handle on the Django database (one client per process)."""
+    global _mongo_client
+    from django.conf import settings
+    db_settings = settings.DATABASES['default']
+    if _mongo_client is None:
+        from pymongo import MongoClient
+        _mongo_client = MongoClient(db_settings.get('CLIENT', {}).get('host', 'localhost'))
+    return _mongo_client[db_settings['NAME']]
+
+
 #  Insert Resume + Show User ID
 def insert_resume(resume_data):
     username = resume_data.get("username")
@@ -45,32 +62,15 @@ def insert_resume(resume_data):
 
 # Fetch Questions Based on Skills
 def get_questions_by_skills(skills, limit=10):
+    """Return up to ``limit`` question dicts whose keywords overlap the skills.
+
+    Matching is served from the shared in-process keyword index (see
+    question_index.py) instead of scanning the whole collection per call.
+    """
     if not skills:
         skills = []
-    
-    lower_skills = [s.lower() for s in skills]
-    matched_questions = []
-
-    for q in Question.objects.all():
-        # Handle None keywords
-        if not q.keywords:
-            continue
-            
-        question_keywords = [k.lower() for k in q.keywords if k]
-        
-        # Match skills with keywords
-        if any(skill in k or k in skill for k in question_keywords for skill in lower_skills):
-            matched_questions.append({
-                "keywords": q.keywords,
-                "tokens": q.tokens if hasattr(q, 'tokens') else [],  # Include pre-tokenized keywords
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            })
-            if len(matched_questions) >= limit:
-                break
-
-    return matched_questions
+
+    return get_question_index().match(skills, limit=limit)
 
 
 # Save Interview Answers
@@ -96,11 +96,58 @@ def get_session_data(session_id):
             "skills": session.skills,
             "answers": session.answers,
             "score": session.score,
+            "current_level": session.current_level,
+            "recommended_next_level": session.recommended_next_level,
+            "evaluation_flag": session.evaluation_flag,
         }
     except InterviewSession.DoesNotExist:
         return None
 
 
+# Slim per-session rows for list views; `answers` is only loaded by get_session_data
+SessionSummary = namedtuple('SessionSummary', ['session_id', 'score', 'created_at', 'skills', 'current_level'])
+
+
+def get_session_page(username, page_size, offset=0, after=None, before=None):
+    """One newest-first page of SessionSummary rows.
+
+    Pages are addressed either by offset or, for O(page_size) deep pages, by a
+    (created_at, id) keyset cursor: ``after`` returns the sessions older than
+    it (next page), ``before`` the sessions newer than it (previous page).
+    The id breaks ties between sessions saved in the same instant, so none is
+    skipped or repeated at a page boundary. One extra row is fetched to tell
+    whether anything lies beyond the page, so no count query is needed.
+
+    Returns:
+        dict: {'rows': [SessionSummary], 'has_more': bool,
+               'first_key': (created_at, id) of the first row, 'last_key': of the last (None when empty)}
+    """
+    from django.db.models import Q
+    fields = SessionSummary._fields + ('id',)
+    sessions = InterviewSession.objects.filter(username=username)
+    if before is not None:
+        created_at, pk = before
+        rows = list(sessions.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+                    .order_by('created_at', 'id')
+                    .values_list(*fields)[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = list(reversed(rows[:page_size]))
+    else:
+        if after is not None:
+            created_at, pk = after
+            sessions = sessions.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+            offset = 0
+        rows = list(sessions.order_by('-created_at', '-id')
+                    .values_list(*fields)[offset:offset + page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+    return {
+        'rows': [SessionSummary(*row[:-1]) for row in rows],
+        'has_more': has_more,
+        'first_key': (rows[0][2], rows[0][-1]) if rows else None,
+        'last_key': (rows[-1][2], rows[-1][-1]) if rows else None,
+    }
+
 
 logger = logging.getLogger(__name__)
 def get_user_profile(user):
@@ -217,3 +264,88 @@ def update_session_results(session_id, score, evaluation_data, profile_updates):
     except Exception as e:
         logger.error(f" Error updating session '{session_id}': {str(e)}")
         return {"success": False, "message": str(e)}
+
+
+# ------------------------------------------------------------
+# Session aggregation (native MongoDB pipelines)
+# ------------------------------------------------------------
+# Reports only need a handful of scalar fields per session, so these queries
+# run on interview_interviewsession directly and never load `answers`.
+
+SESSION_COLLECTION = 'interview_interviewsession'
+SESSION_SUMMARY_FIELDS = SessionSummary._fields
+
+
+def range_cutoff(range_param):
+    """Map a reports range ('7', '30', 'all') to a created_at cutoff (None = all time)."""
+    from datetime import timedelta
+    from django.utils import timezone
+    if range_param in ('7', '30'):
+        return timezone.now() - timedelta(days=int(range_param))
+    return None
+
+
+def _session_match(username, since=None):
+    match = {'username': username}
+    if since is not None:
+        match['created_at'] = {'$gte': since}
+    return {'$match': match}
+
+
+def get_session_stats(username, since=None):
+    """Count, average score (0-100) and pass rate (0-100) of a user's sessions.
+
+    Args:
+        username: session owner
+        since: optional aware datetime; only sessions created at/after it count
+
+    Returns:
+        dict: {'total_interviews', 'avg_score', 'pass_rate'}
+    """
+    pipeline = [
+        _session_match(username, since),
+        {'$group': {
+            '_id': None,
+            'total': {'$sum': 1},
+            'score_sum': {'$sum': '$score'},
+            'passed': {'$sum': {'$cond': [{'$gte': ['$score', PASS_THRESHOLD]}, 1, 0]}},
+        }},
+    ]
+    try:
+        result = next(get_mongo_db()[SESSION_COLLECTION].aggregate(pipeline), None)
+    except Exception as e:
+        logger.error(f" Error aggregating sessions for {username}: {str(e)}")
+        result = None
+    if not result or not result['total']:
+        return {'total_interviews': 0, 'avg_score': 0, 'pass_rate': 0}
+    return {
+        'total_interviews': result['total'],
+        'avg_score': (result['score_sum'] / result['total']) * 100,
+        'pass_rate': (result['passed'] / result['total']) * 100,
+    }
+
+
+def get_session_series(username, since=None, limit=None):
+    """Newest-first session summaries (no answers) for charts and report tables.
+
+    Returns:
+        list[dict]: {'session_id','score','created_at','skills','current_level'}
+    """
+    from datetime import timezone as dt_timezone
+    from django.conf import settings
+    from django.utils import timezone
+    pipeline = [_session_match(username, since), {'$sort': {'created_at': -1}}]
+    if limit:
+        pipeline.append({'$limit': limit})
+    pipeline.append({'$project': dict({'_id': 0}, **{f: 1 for f in SESSION_SUMMARY_FIELDS})})
+    try:
+        rows = list(get_mongo_db()[SESSION_COLLECTION].aggregate(pipeline))
+    except Exception as e:
+        logger.error(f" Error loading session series for {username}: {str(e)}")
+        return []
+    for row in rows:
+        created = row.get('created_at')
+        # pymongo hands back naive UTC datetimes
+        if created is not None and settings.USE_TZ and timezone.is_naive(created):
+            row['created_at'] = created.replace(tzinfo=dt_timezone.utc)
+    return rows
@@ -0,0 +1,70 @@
+"""
+Django management command to compile the question bank into its snapshot file.
+
+import_questions and tokenize_questions rebuild the snapshot themselves. Run
+this to create it, after questions were edited in the admin (which marks the
+snapshot stale, sending workers back to the database), after raw MongoDB
+writes, or with --info to inspect the file. On Windows, stop the web workers
+first: a file they have mapped cannot be replaced.
+
+Usage:
+    python manage.py build_question_snapshot [--path PATH] [--info]
+"""
+
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from interview.question_index import get_snapshot_path, write_question_snapshot
+from interview.question_snapshot import QuestionSnapshot, SnapshotError, SNAPSHOT_VERSION
+
+
+class Command(BaseCommand):
+    help = 'Compile the question bank into the mmap-able snapshot workers load at startup'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=None,
+            help='Snapshot file (default: NEXORA_QUESTION_SNAPSHOT)'
+        )
+        parser.add_argument(
+            '--info',
+            action='store_true',
+            help='Describe the existing snapshot instead of rebuilding it'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path'] or get_snapshot_path()
+        if not path:
+            raise CommandError('No snapshot path: set NEXORA_QUESTION_SNAPSHOT or pass --path')
+
+        if options['info']:
+            self.describe(path)
+            return
+
+        started = time.monotonic()
+        count = write_question_snapshot(path)
+        size = os.path.getsize(path)
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {count} questions to {path} ({size / 1024:.1f} KiB, '
+            f'version {SNAPSHOT_VERSION}) in {time.monotonic() - started:.1f}s'
+        ))
+
+    def describe(self, path):
+        try:
+            snapshot = QuestionSnapshot(path)
+        except FileNotFoundError:
+            raise CommandError(f'No snapshot at {path}')
+        except (SnapshotError, ValueError) as e:
+            raise CommandError(f'Unusable snapshot: {e}')
+
+        levels = {}
+        for level in snapshot.levels:
+            levels[level] = levels.get(level, 0) + 1
+        self.stdout.write(f'Snapshot: {path}')
+        self.stdout.write(f'Version:  {SNAPSHOT_VERSION}')
+        self.stdout.write(f'Size:     {os.path.getsize(path) / 1024:.1f} KiB')
+        self.stdout.write(f'Questions: {len(snapshot)}')
+        for level, n in sorted(levels.items(), key=lambda x: str(x[0])):
+            self.stdout.write(f'  {level}: {n}')
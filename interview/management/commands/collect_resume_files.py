@@ -0,0 +1,50 @@
+"""
+Django management command to delete stored resume files nothing refers to.
+
+Uploads are stored under their content hash (NEXORA_RESUME_STORE PATH) and
+their parses cached per hash (CACHE_PATH). This removes uploads and cache
+entries whose hash no Resume records, cache entries from older parser
+versions, and temp files left by interrupted uploads. Files younger than
+--min-age are kept so queued parses never lose their file.
+
+Usage:
+    python manage.py collect_resume_files [--min-age 24] [--dry-run] [--include-legacy]
+"""
+
+from django.core.management.base import BaseCommand
+from interview.resume_store import collect_resume_files
+
+
+class Command(BaseCommand):
+    help = 'Remove orphaned resume uploads and stale parse-cache entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age',
+            type=float,
+            default=24,
+            help='Only remove files older than this many hours (default: 24)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be removed without deleting anything'
+        )
+        parser.add_argument(
+            '--include-legacy',
+            action='store_true',
+            help='Also remove uploads stored under their original filename (before content addressing)'
+        )
+
+    def handle(self, *args, **options):
+        removed = collect_resume_files(
+            min_age=options['min_age'] * 3600,
+            dry_run=options['dry_run'],
+            include_legacy=options['include_legacy'],
+        )
+        verb = 'Would remove' if options['dry_run'] else 'Removed'
+        for kind, totals in removed.items():
+            self.stdout.write(f"{kind}: {totals['files']} files ({totals['bytes'] / 1024:.1f} KiB)")
+        files = sum(totals['files'] for totals in removed.values())
+        size = sum(totals['bytes'] for totals in removed.values())
+        self.stdout.write(self.style.SUCCESS(f'{verb} {files} files ({size / 1024:.1f} KiB)'))
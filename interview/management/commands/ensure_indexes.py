@@ -0,0 +1,121 @@
+"""
+Django management command to create and verify MongoDB indexes on hot query paths.
+
+Indexes declared in model Meta.indexes are created by migrations; this command
+checks they exist (creating any that are missing) and adds the ones djongo
+cannot express, such as the hashed index behind import_questions' exact
+question_text lookups. With --stats it prints per-index usage from $indexStats.
+It exits non-zero when an index is missing or could not be created, so
+`ensure_indexes --check` works as a deploy or CI check.
+
+Usage:
+    python manage.py ensure_indexes [--check] [--stats]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from pymongo import ASCENDING, HASHED
+from interview.db_operations import get_mongo_db
+
+
+# (collection, key pattern, options). An index counts as present when any
+# index on the collection has the same key pattern, whatever its name.
+HOT_QUERY_INDEXES = [
+    # InterviewSession.objects.filter(username=...).order_by('-created_at')
+    ('interview_interviewsession', [('username', ASCENDING), ('created_at', ASCENDING)],
+     {'name': 'session_user_created_idx'}),
+    # Resume.objects.filter(username=...).order_by('-uploaded_at').first()
+    ('interview_resume', [('username', ASCENDING), ('uploaded_at', ASCENDING)],
+     {'name': 'resume_user_uploaded_idx'}),
+    # Question.objects.filter(level=...)
+    ('interview_question', [('level', ASCENDING)],
+     {'name': 'question_level_idx'}),
+    # Question.objects.filter(question_text=...) in import_questions
+    ('interview_question', [('question_text', HASHED)],
+     {'name': 'question_text_hashed_idx'}),
+    # Profile.objects.filter(user=...)
+    ('interview_profile', [('user_id', ASCENDING)],
+     {'name': 'profile_user_idx'}),
+    # UserStatsRollup lookups by username
+    ('interview_userstatsrollup', [('username', ASCENDING)],
+     {'name': 'rollup_username_idx', 'unique': True}),
+    # Resume job queue (mongo backend): claim the oldest pending job
+    ('interview_resumejob', [('status', ASCENDING), ('created_at', ASCENDING)],
+     {'name': 'resumejob_status_created_idx'}),
+]
+
+# Collections that only exist when an optional feature is enabled
+OPTIONAL_COLLECTIONS = {'interview_resumejob'}
+
+
+class Command(BaseCommand):
+    help = 'Create and verify MongoDB indexes for hot query paths'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report missing indexes (exit status 1 if any), do not create them'
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Print index usage statistics ($indexStats) per collection'
+        )
+
+    def handle(self, *args, **options):
+        db = get_mongo_db()
+        existing_collections = set(db.list_collection_names())
+
+        created = 0
+        missing = 0
+        for collection_name, keys, index_options in HOT_QUERY_INDEXES:
+            label = f"{collection_name} {dict(keys)}"
+            if collection_name not in existing_collections and collection_name in OPTIONAL_COLLECTIONS:
+                self.stdout.write(f'Skipping {label}: collection not in use')
+                continue
+
+            collection = db[collection_name]
+            present = [
+                name for name, info in collection.index_information().items()
+                if list(info.get('key', [])) == keys
+            ]
+            if present:
+                self.stdout.write(f'OK       {label} ({present[0]})')
+                continue
+
+            if options['check']:
+                missing += 1
+                self.stdout.write(self.style.WARNING(f'MISSING  {label}'))
+                continue
+
+            try:
+                name = collection.create_index(keys, **index_options)
+                created += 1
+                self.stdout.write(self.style.SUCCESS(f'CREATED  {label} ({name})'))
+            except Exception as e:
+                missing += 1
+                self.stdout.write(self.style.ERROR(f'FAILED   {label}: {e}'))
+
+        if options['stats']:
+            self.print_index_stats(db, sorted({c for c, _, _ in HOT_QUERY_INDEXES} & existing_collections))
+
+        summary = f'{created} indexes created, {missing} missing'
+        if missing:
+            # Non-zero exit, so --check can gate a deploy or CI run
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
+
+    def print_index_stats(self, db, collection_names):
+        self.stdout.write('\nIndex usage ($indexStats, since each index was created or the server started):')
+        for collection_name in collection_names:
+            self.stdout.write(f'\n{collection_name}')
+            try:
+                stats = list(db[collection_name].aggregate([{'$indexStats': {}}]))
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'  Could not read $indexStats: {e}'))
+                continue
+            for entry in sorted(stats, key=lambda x: x['name']):
+                accesses = entry.get('accesses', {})
+                self.stdout.write(
+                    f"  {entry['name']:<34} ops={accesses.get('ops', 0):<8} since={accesses.get('since', '')}"
+                )
@@ -2,7 +2,8 @@
 Django management command to import questions from JSON with pre-tokenized keywords.
 
 Usage:
-    python manage.py import_questions <json_file_path> [--clear]
+    python manage.py import_questions <json_file_path> [--clear] [--bulk [--chunk-size N]]
+                                      [--format auto|json|jsonl] [--resume]
 
 Expected JSON format:
 [
@@ -17,12 +18,39 @@ Expected JSON format:
     },
     ...
 ]
+
+JSON Lines (one such object per line, .jsonl/.ndjson) is accepted too. Both
+formats are streamed: items are parsed, validated and written as the file
+is read, so bank size is not limited by memory.
+
+--bulk loads every existing question text once, then writes in chunks:
+new questions with bulk_create, updates with a single pymongo bulk_write
+per chunk. Use it for large banks; the default mode writes one question
+at a time and prints a line per question.
+
+After every written chunk the byte offset reached is saved to
+<json_file>.checkpoint; --resume continues an interrupted import from
+there. The checkpoint is removed when the import completes.
+
+When NEXORA_QUESTION_SNAPSHOT is set the question-bank snapshot is rebuilt
+at the end, so workers pick up the new bank without querying the database.
 """
 
+import codecs
 import json
+import os
 import re
+import time
 from django.core.management.base import BaseCommand, CommandError
 from interview.models import Question
+from interview.question_index import invalidate_question_index, write_question_snapshot
+
+
+VALID_LEVELS = ['beginner', 'intermediate', 'hard']
+READ_CHUNK_BYTES = 1 << 16
+# Largest single question accepted in a JSON array (characters). A malformed
+# item never parses, so without a cap the rest of the file would be buffered.
+MAX_ITEM_CHARS = 1 << 22
 
 
 class Command(BaseCommand):
@@ -55,22 +83,48 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing questions before importing'
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Preload existing questions and write in batches (large banks)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Questions per batch in --bulk mode, and between checkpoints (default: 1000)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['auto', 'json', 'jsonl'],
+            default='auto',
+            help='Input format: a JSON array or JSON Lines (default: from extension/content)'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue from the checkpoint left by an interrupted import'
+        )
 
     def handle(self, *args, **options):
         json_file = options['json_file']
         clear_existing = options['clear']
+        chunk_size = max(1, options['chunk_size'])
 
         # Validate file exists
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except FileNotFoundError:
+        if not os.path.isfile(json_file):
             raise CommandError(f'File not found: {json_file}')
-        except json.JSONDecodeError as e:
-            raise CommandError(f'Invalid JSON: {e}')
+        fmt = options['format']
+        if fmt == 'auto':
+            fmt = self.detect_format(json_file)
 
-        if not isinstance(data, list):
-            raise CommandError('JSON must contain a list of questions')
+        self.checkpoint_path = f'{json_file}.checkpoint'
+        offset, start_idx = 0, 0
+        if options['resume']:
+            offset, start_idx = self.load_checkpoint(json_file)
+            if clear_existing:
+                self.stdout.write(self.style.WARNING('Ignoring --clear when resuming'))
+                clear_existing = False
 
         # Clear existing questions if requested
         if clear_existing:
@@ -78,67 +132,254 @@ class Command(BaseCommand):
             Question.objects.all().delete()
             self.stdout.write(self.style.WARNING(f'Cleared {count} existing questions'))
 
-        # Import questions
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
+        self.json_file = json_file
+        self.skipped_count = 0
+        started = time.monotonic()
+        try:
+            with open(json_file, 'rb') as f:
+                items = self.iter_items(f, fmt, offset, start_idx)
+                records = self.iter_records(items)
+                if options['bulk']:
+                    created_count, updated_count = self.import_bulk(records, chunk_size, started)
+                else:
+                    created_count, updated_count = self.import_one_by_one(records, chunk_size)
+        finally:
+            # Bulk writes bypass model signals
+            invalidate_question_index()
+
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+        snapshot_count = write_question_snapshot()
+        if snapshot_count is not None:
+            self.stdout.write(f'Question snapshot rebuilt ({snapshot_count} questions)')
+
+        # Summary
+        elapsed = time.monotonic() - started
+        processed = created_count + updated_count
+        rate = processed / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'\nImport complete: {created_count} created, {updated_count} updated, {self.skipped_count} skipped '
+            f'in {elapsed:.1f}s ({rate:.0f} questions/s)'
+        ))
+
+    # ------------------------------------------------------------
+    # Streaming input
+    # ------------------------------------------------------------
+
+    def detect_format(self, json_file):
+        if json_file.lower().endswith(('.jsonl', '.ndjson')):
+            return 'jsonl'
+        with open(json_file, 'rb') as f:
+            head = f.read(READ_CHUNK_BYTES).decode('utf-8', errors='ignore').lstrip('\ufeff \t\r\n')
+        return 'json' if head.startswith('[') else 'jsonl'
+
+    def iter_items(self, f, fmt, offset=0, start_idx=0):
+        """Yield (idx, item, end_offset) from the input, starting at a byte offset."""
+        if fmt == 'jsonl':
+            return self.iter_json_lines(f, offset, start_idx)
+        return self.iter_json_array(f, offset, start_idx)
 
-        for idx, item in enumerate(data, 1):
+    def iter_json_lines(self, f, offset, idx):
+        f.seek(offset)
+        position = offset
+        for raw in f:
+            position += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            idx += 1
             try:
-                # Extract fields
-                question_text = item.get('question', '').strip()
-                level = item.get('level', 'beginner').lower()
-                answer_obj = item.get('answer', {})
-
-                if not question_text:
-                    self.stdout.write(self.style.WARNING(f'Skipping item {idx}: missing question text'))
-                    skipped_count += 1
-                    continue
-
-                # Extract keywords and tokens
-                if isinstance(answer_obj, dict):
-                    keywords = answer_obj.get('keywords', [])
-                    tokens = answer_obj.get('tokens', [])
-                    reference_answer = answer_obj.get('text', '')  # optional reference answer
-                else:
-                    # Fallback if answer is just a list of keywords
-                    keywords = answer_obj if isinstance(answer_obj, list) else []
-                    tokens = []
-                    reference_answer = ''
-
-                # Validate data types
-                if not isinstance(keywords, list):
-                    self.stdout.write(self.style.WARNING(f'Skipping item {idx}: keywords must be a list'))
-                    skipped_count += 1
-                    continue
-
-                if tokens and not isinstance(tokens, list):
-                    self.stdout.write(self.style.WARNING(f'Skipping item {idx}: tokens must be a list'))
-                    skipped_count += 1
-                    continue
-                
-                # Auto-generate tokens if missing
-                if not tokens and keywords:
-                    tokens = self.tokenize_keywords(keywords)
-
-                # Normalize level
-                valid_levels = ['beginner', 'intermediate', 'hard']
-                if level not in valid_levels:
-                    self.stdout.write(self.style.WARNING(
-                        f'Item {idx}: invalid level "{level}", defaulting to "beginner"'
-                    ))
-                    level = 'beginner'
+                item = json.loads(line)
+            except ValueError as e:
+                self.stdout.write(self.style.WARNING(f'Skipping item {idx}: invalid JSON ({e})'))
+                self.skipped_count += 1
+                continue
+            yield idx, item, position
+
+    def iter_json_array(self, f, offset, idx):
+        """Parse a top-level JSON array item by item with raw_decode.
+
+        Only the current item (plus one read chunk) is held in memory; an
+        item still unparsed after MAX_ITEM_CHARS is reported as invalid
+        rather than read to the end of the file. A non-zero offset is a checkpoint taken just after an item, i.e. inside
+        the array.
+        """
+        decoder = json.JSONDecoder()
+        utf8 = codecs.getincrementaldecoder('utf-8')()
+        in_array = offset > 0
+        f.seek(offset)
+        if offset == 0 and f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+            offset = len(codecs.BOM_UTF8)
+        f.seek(offset)
+        buf = ''
+        k = 0  # parse cursor into buf
+        position = offset  # byte offset of buf[k]
+        eof = False
+
+        while True:
+            # Drop whitespace (and, inside the array, separators) before the next token
+            start = k
+            while k < len(buf) and (buf[k].isspace() or (in_array and buf[k] == ',')):
+                k += 1
+            if k > start:
+                position += len(buf[start:k].encode('utf-8'))
+
+            if k == len(buf):
+                if eof:
+                    raise CommandError('Invalid JSON: unexpected end of file')
+                chunk = f.read(READ_CHUNK_BYTES)
+                eof = not chunk
+                buf = buf[k:] + utf8.decode(chunk, final=eof)
+                k = 0
+                continue
+
+            if not in_array:
+                if buf[k] != '[':
+                    raise CommandError('JSON must contain a list of questions')
+                in_array = True
+                k += 1
+                position += 1
+                continue
+            if buf[k] == ']':
+                return
 
+            try:
+                item, end = decoder.raw_decode(buf, k)
+                if end == len(buf) and not eof:
+                    raise ValueError('item may continue in the next chunk')
+            except ValueError as e:
+                if eof:
+                    raise CommandError(f'Invalid JSON: {e}')
+                if len(buf) - k > MAX_ITEM_CHARS:
+                    raise CommandError(
+                        f'Invalid JSON: item {idx + 1} at byte {position} is not valid within '
+                        f'{MAX_ITEM_CHARS} characters ({e})'
+                    )
+                # Item spans the read boundary: read more and retry
+                chunk = f.read(READ_CHUNK_BYTES)
+                eof = not chunk
+                buf = buf[k:] + utf8.decode(chunk, final=eof)
+                k = 0
+                continue
+
+            idx += 1
+            position += len(buf[k:end].encode('utf-8'))
+            k = end
+            yield idx, item, position
+
+    # ------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------
+
+    def load_checkpoint(self, json_file):
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            self.stdout.write(self.style.WARNING('No checkpoint found, starting from the beginning'))
+            return 0, 0
+        except ValueError as e:
+            raise CommandError(f'Unreadable checkpoint {self.checkpoint_path}: {e}')
+        if checkpoint.get('offset', 0) > os.path.getsize(json_file):
+            raise CommandError('Checkpoint is past the end of the file; was the file replaced?')
+        self.stdout.write(f"Resuming after item {checkpoint.get('items', 0)} (byte {checkpoint['offset']})")
+        return checkpoint['offset'], checkpoint.get('items', 0)
+
+    def save_checkpoint(self, record):
+        """Record that everything up to and including ``record`` has been written."""
+        if record is None:
+            return
+        tmp = f'{self.checkpoint_path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'file': os.path.abspath(self.json_file), 'offset': record['offset'], 'items': record['idx']}, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def parse_item(self, idx, item):
+        """Validate one JSON item and return a question record, or None to skip it."""
+        # Extract fields
+        question_text = item.get('question', '').strip()
+        level = item.get('level', 'beginner').lower()
+        answer_obj = item.get('answer', {})
+
+        if not question_text:
+            self.stdout.write(self.style.WARNING(f'Skipping item {idx}: missing question text'))
+            return None
+
+        # Extract keywords and tokens
+        if isinstance(answer_obj, dict):
+            keywords = answer_obj.get('keywords', [])
+            tokens = answer_obj.get('tokens', [])
+            reference_answer = answer_obj.get('text', '')  # optional reference answer
+        else:
+            # Fallback if answer is just a list of keywords
+            keywords = answer_obj if isinstance(answer_obj, list) else []
+            tokens = []
+            reference_answer = ''
+
+        # Validate data types
+        if not isinstance(keywords, list):
+            self.stdout.write(self.style.WARNING(f'Skipping item {idx}: keywords must be a list'))
+            return None
+
+        if tokens and not isinstance(tokens, list):
+            self.stdout.write(self.style.WARNING(f'Skipping item {idx}: tokens must be a list'))
+            return None
+
+        # Auto-generate tokens if missing
+        if not tokens and keywords:
+            tokens = self.tokenize_keywords(keywords)
+
+        # Normalize level
+        if level not in VALID_LEVELS:
+            self.stdout.write(self.style.WARNING(
+                f'Item {idx}: invalid level "{level}", defaulting to "beginner"'
+            ))
+            level = 'beginner'
+
+        return {
+            'question_text': question_text,
+            'keywords': keywords,
+            'tokens': tokens if tokens else [],
+            'level': level,
+            'answer': reference_answer,
+        }
+
+    def iter_records(self, items):
+        """Yield validated records for (idx, item, offset) triples, counting skipped items."""
+        for idx, item, offset in items:
+            try:
+                record = self.parse_item(idx, item)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Error processing item {idx}: {e}'))
+                record = None
+            if record is None:
+                self.skipped_count += 1
+                continue
+            record['idx'] = idx
+            record['offset'] = offset
+            yield record
+
+    def import_one_by_one(self, records, chunk_size):
+        created_count = 0
+        updated_count = 0
+        last_record = None
+        for n, record in enumerate(records, 1):
+            if n % chunk_size == 0:
+                self.save_checkpoint(last_record)
+            last_record = record
+            question_text = record['question_text']
+            try:
                 # Check if question already exists
                 existing = Question.objects.filter(question_text=question_text).first()
 
                 if existing:
                     # Update existing question
-                    existing.keywords = keywords
-                    existing.tokens = tokens if tokens else []
-                    existing.level = level
-                    if reference_answer:
-                        existing.answer = reference_answer
+                    existing.keywords = record['keywords']
+                    existing.tokens = record['tokens']
+                    existing.level = record['level']
+                    if record['answer']:
+                        existing.answer = record['answer']
                     existing.save()
                     updated_count += 1
                     self.stdout.write(f'Updated: {question_text[:50]}...')
@@ -146,20 +387,96 @@ class Command(BaseCommand):
                     # Create new question
                     Question.objects.create(
                         question_text=question_text,
-                        keywords=keywords,
-                        tokens=tokens if tokens else [],
-                        level=level,
-                        answer=reference_answer or ''
+                        keywords=record['keywords'],
+                        tokens=record['tokens'],
+                        level=record['level'],
+                        answer=record['answer'] or ''
                     )
                     created_count += 1
                     self.stdout.write(f'Created: {question_text[:50]}...')
 
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error processing item {idx}: {e}'))
-                skipped_count += 1
+                self.stdout.write(self.style.ERROR(f'Error processing "{question_text[:50]}": {e}'))
+                self.skipped_count += 1
                 continue
+        return created_count, updated_count
 
-        # Summary
-        self.stdout.write(self.style.SUCCESS(
-            f'\nImport complete: {created_count} created, {updated_count} updated, {skipped_count} skipped'
-        ))
+    def import_bulk(self, records, chunk_size, started):
+        """Upsert records in chunks against a one-off map of existing question texts."""
+        # One query for every existing text -> id
+        existing = dict(Question.objects.values_list('question_text', 'id'))
+        self.stdout.write(f'Loaded {len(existing)} existing questions')
+
+        created_count = 0
+        updated_count = 0
+        # Both keyed by question_text, so a text repeated within a chunk keeps its last version
+        to_create = {}  # question_text -> record
+        to_update = {}  # question_text -> (id, record)
+        last_record = None
+        for record in records:
+            last_record = record
+            text = record['question_text']
+            if text in existing:
+                to_update[text] = (existing[text], record)
+            else:
+                to_create[text] = record
+
+            if len(to_create) + len(to_update) >= chunk_size:
+                created_count += self.flush_creates(to_create, existing)
+                updated_count += self.flush_updates(to_update)
+                self.save_checkpoint(last_record)
+                self.report_progress(created_count, updated_count, started)
+
+        created_count += self.flush_creates(to_create, existing)
+        updated_count += self.flush_updates(to_update)
+        return created_count, updated_count
+
+    def flush_creates(self, to_create, existing):
+        if not to_create:
+            return 0
+        created = Question.objects.bulk_create([
+            Question(
+                question_text=r['question_text'],
+                keywords=r['keywords'],
+                tokens=r['tokens'],
+                level=r['level'],
+                answer=r['answer'] or '',
+            )
+            for r in to_create.values()
+        ], batch_size=len(to_create))
+        for q in created:
+            # Later chunks repeating this text become updates; pk is None when
+            # the backend does not return ids from bulk inserts
+            existing[q.question_text] = q.pk
+        count = len(to_create)
+        to_create.clear()
+        return count
+
+    def flush_updates(self, to_update):
+        """Apply a chunk of updates with one pymongo bulk_write.
+
+        djongo cannot translate bulk_update's CASE expressions, so updates go
+        to the collection directly, matched on the integer id djongo keeps (or
+        on the text for questions created earlier in this run without an id).
+        """
+        if not to_update:
+            return 0
+        from pymongo import UpdateOne
+        from interview.db_operations import get_mongo_db
+        operations = []
+        for text, (qid, r) in to_update.items():
+            fields = {'keywords': r['keywords'], 'tokens': r['tokens'], 'level': r['level']}
+            if r['answer']:
+                fields['answer'] = r['answer']
+            match = {'id': qid} if qid is not None else {'question_text': text}
+            operations.append(UpdateOne(match, {'$set': fields}))
+        get_mongo_db()[Question._meta.db_table].bulk_write(operations, ordered=False)
+        count = len(to_update)
+        to_update.clear()
+        return count
+
+    def report_progress(self, created_count, updated_count, started):
+        done = created_count + updated_count
+        elapsed = time.monotonic() - started
+        rate = done / elapsed if elapsed > 0 else 0
+        self.stdout.write(f'{done} questions written ({created_count} created, {updated_count} updated), {rate:.0f}/s')
@@ -0,0 +1,77 @@
+"""
+Django management command that works through the resume parsing queue.
+
+Run it with NEXORA_RESUME_QUEUE['AUTOSTART'] = False, when web processes only
+enqueue, or to pick up jobs left pending by a restarted web process. Done and failed jobs older than KEEP_FINISHED
+seconds are removed at start and then hourly.
+
+Usage:
+    python manage.py process_resume_jobs [--once] [--processes N] [--ocr-processes N] [--poll 2]
+                                         [--requeue-stale 600] [--keep-finished 86400]
+"""
+
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from django.core.management.base import BaseCommand
+from interview.resume_jobs import get_job_queue, get_queue_config, dispatch_resume_job, new_parse_executor
+
+PRUNE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = 'Parse queued resume uploads in a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Exit once the queue is empty instead of polling')
+        parser.add_argument('--processes', type=int, default=None,
+                            help='Parser processes (default: NEXORA_RESUME_QUEUE PROCESSES)')
+        parser.add_argument('--ocr-processes', type=int, default=None,
+                            help='OCR workers per parser process (default: NEXORA_RESUME_QUEUE OCR_PROCESSES)')
+        parser.add_argument('--poll', type=float, default=2.0,
+                            help='Seconds between queue polls when idle')
+        parser.add_argument('--requeue-stale', type=int, default=0,
+                            help='Return jobs running longer than this many seconds to pending first')
+        parser.add_argument('--keep-finished', type=int, default=None,
+                            help='Seconds to keep done/failed jobs, 0 to keep them all '
+                                 '(default: NEXORA_RESUME_QUEUE KEEP_FINISHED)')
+
+    def handle(self, *args, **options):
+        queue = get_job_queue()
+        config = get_queue_config()
+        processes = options['processes'] or config['PROCESSES']
+        keep_finished = config['KEEP_FINISHED'] if options['keep_finished'] is None else options['keep_finished']
+        last_prune = None
+
+        if options['requeue_stale']:
+            requeued = queue.requeue_stale(options['requeue_stale'])
+            self.stdout.write(f'Requeued {requeued} stale jobs')
+
+        processed = 0
+        in_flight = set()
+        with new_parse_executor(processes, options['ocr_processes']) as executor:
+            self.stdout.write(f'Resume worker started with {processes} processes')
+            while True:
+                if keep_finished and (last_prune is None or time.monotonic() - last_prune >= PRUNE_INTERVAL):
+                    pruned = queue.prune_finished(keep_finished)
+                    last_prune = time.monotonic()
+                    if pruned:
+                        self.stdout.write(f'Removed {pruned} finished jobs')
+
+                while len(in_flight) < processes:
+                    job = queue.claim()
+                    if job is None:
+                        break
+                    self.stdout.write(f"Parsing {job['file_path']} for {job['username']} (job {job['id']})")
+                    in_flight.add(dispatch_resume_job(queue, job, executor=executor))
+
+                if in_flight:
+                    done, in_flight = wait(in_flight, timeout=options['poll'], return_when=FIRST_COMPLETED)
+                    processed += len(done)
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} resume jobs'))
@@ -0,0 +1,35 @@
+"""
+Django management command to rebuild per-user analytics rollups from history.
+
+Rollups are kept up to date as interview sessions are saved; run this after
+bulk imports or raw MongoDB edits that bypass Django signals.
+
+Usage:
+    python manage.py rebuild_stats_rollups [--username USER]
+"""
+
+from django.core.management.base import BaseCommand
+from interview.models import InterviewSession
+from interview.rollups import rebuild_user_rollup
+
+
+class Command(BaseCommand):
+    help = 'Rebuild UserStatsRollup documents from InterviewSession history'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            help='Only rebuild this user (default: every user with sessions)'
+        )
+
+    def handle(self, *args, **options):
+        if options['username']:
+            usernames = [options['username']]
+        else:
+            usernames = sorted(set(InterviewSession.objects.values_list('username', flat=True)))
+
+        for username in usernames:
+            rollup = rebuild_user_rollup(username)
+            self.stdout.write(f'{username}: {rollup.session_count} sessions')
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(usernames)} rollups'))
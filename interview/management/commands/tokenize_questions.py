@@ -4,14 +4,62 @@ Django management command to tokenize existing questions in the database.
 This script updates the 'tokens' field for all questions that have keywords
 but no pre-tokenized tokens. Uses the same tokenization logic from answer_evaluation.
 
+Questions are streamed in id order in batches (only id, keywords and tokens
+are loaded), tokenized across a process pool when the bank is large, and
+written back with one bulk update per batch. Only token lists that actually
+change are written. The question-bank snapshot (NEXORA_QUESTION_SNAPSHOT)
+is rebuilt afterwards when any tokens changed.
+
 Usage:
-    python manage.py tokenize_questions [--force]
+    python manage.py tokenize_questions [--force] [--dry-run] [--batch-size N] [--processes N]
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import re
+import time
+
 from django.core.management.base import BaseCommand
 from interview.models import Question
-from interview.answer_evaluation import tokenize
-import re
+from interview.question_index import write_question_snapshot
+
+# Below this many questions a process pool costs more than it saves
+PARALLEL_THRESHOLD = 5000
+
+
+def tokenize_keywords(keywords):
+    """Split keyword phrases into unique, lowercased word tokens (order preserved)."""
+    tokens = []
+    for kw in keywords:
+        if isinstance(kw, str) and kw.strip():
+            # Split phrases into words and tokenize
+            parts = [p.strip().lower() for p in re.split(r"[\s\-/]+", kw) if p.strip()]
+            tokens.extend(parts)
+
+    # Remove duplicates while preserving order
+    seen = set()
+    unique_tokens = []
+    for t in tokens:
+        if t not in seen:
+            seen.add(t)
+            unique_tokens.append(t)
+    return unique_tokens
+
+
+def tokenize_batch(rows):
+    """Tokenize (id, keywords, tokens) rows; return [(id, new_tokens)] for rows whose tokens change.
+
+    Rows without keywords are left alone (iter_batches counts them as skipped).
+    """
+    changes = []
+    for qid, keywords, tokens in rows:
+        if not keywords:
+            continue
+        new_tokens = tokenize_keywords(keywords)
+        if new_tokens != (tokens or []):
+            changes.append((qid, new_tokens))
+    return changes
 
 
 class Command(BaseCommand):
@@ -23,68 +71,119 @@ class Command(BaseCommand):
             action='store_true',
             help='Re-tokenize all questions, even if tokens already exist'
         )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many token lists would change'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Questions loaded, tokenized and written per batch (default: 1000)'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count() or 1,
+            help=f'Tokenizer processes for banks over {PARALLEL_THRESHOLD} questions (default: CPU count)'
+        )
 
     def handle(self, *args, **options):
         force = options['force']
+        dry_run = options['dry_run']
+        batch_size = max(1, options['batch_size'])
+        self.verbose = options['verbosity'] > 1
 
         # Get questions that need tokenization
         if force:
             questions = Question.objects.all()
-            self.stdout.write(f'Force mode: processing all {questions.count()} questions')
+            total = questions.count()
+            self.stdout.write(f'Force mode: processing all {total} questions')
         else:
             questions = Question.objects.filter(tokens=[])
-            self.stdout.write(f'Processing {questions.count()} questions without tokens')
+            total = questions.count()
+            self.stdout.write(f'Processing {total} questions without tokens')
 
-        if not questions.exists():
+        if not total:
             self.stdout.write(self.style.SUCCESS('No questions to process'))
             return
 
-        updated_count = 0
-        error_count = 0
-
-        for q in questions:
-            try:
-                keywords = q.keywords if q.keywords else []
-                
-                if not keywords:
-                    self.stdout.write(self.style.WARNING(
-                        f'Skipping question "{q.question_text[:50]}..." - no keywords'
-                    ))
-                    continue
-
-                # Tokenize all keywords
-                tokens = []
-                for kw in keywords:
-                    if isinstance(kw, str) and kw.strip():
-                        # Split phrases into words and tokenize
-                        parts = [p.strip().lower() for p in re.split(r"[\s\-/]+", kw) if p.strip()]
-                        tokens.extend(parts)
-                
-                # Remove duplicates while preserving order
-                seen = set()
-                unique_tokens = []
-                for t in tokens:
-                    if t not in seen:
-                        seen.add(t)
-                        unique_tokens.append(t)
-                
-                # Update question
-                q.tokens = unique_tokens
-                q.save()
-                
-                updated_count += 1
-                self.stdout.write(
-                    f'Tokenized: {q.question_text[:40]}... '
-                    f'({len(keywords)} keywords → {len(unique_tokens)} tokens)'
-                )
-
-            except Exception as e:
-                error_count += 1
-                self.stdout.write(self.style.ERROR(
-                    f'Error processing question "{q.question_text[:50]}...": {e}'
-                ))
+        started = time.monotonic()
+        self.skipped_count = 0
+        batches = self.iter_batches(questions, batch_size)
+        processes = max(1, options['processes'])
+        if processes > 1 and total > PARALLEL_THRESHOLD:
+            self.stdout.write(f'Tokenizing across {processes} processes')
+            changes = self.tokenize_parallel(batches, processes)
+        else:
+            changes = (tokenize_batch(rows) for rows in batches)
+
+        changed_count = 0
+        for batch_changes in changes:
+            changed_count += len(batch_changes)
+            if batch_changes and not dry_run:
+                self.write_tokens(batch_changes)
+
+        elapsed = time.monotonic() - started
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f'\nDry run: {changed_count} of {total} token lists would change '
+                f'({self.skipped_count} without keywords) in {elapsed:.1f}s'
+            ))
+            return
+
+        if changed_count:
+            # Tokens feed the precompiled scoring data, so the snapshot is rebuilt too
+            snapshot_count = write_question_snapshot()
+            if snapshot_count is not None:
+                self.stdout.write(f'Question snapshot rebuilt ({snapshot_count} questions)')
 
         # Summary
         self.stdout.write(self.style.SUCCESS(
-            f'\nTokenization complete: {updated_count} updated, {error_count} errors'
+            f'\nTokenization complete: {changed_count} updated, {total - changed_count} unchanged '
+            f'({self.skipped_count} without keywords) in {elapsed:.1f}s'
         ))
+
+    def iter_batches(self, questions, batch_size):
+        """Yield lists of (id, keywords, tokens) in id order, one keyset query per batch."""
+        last_id = None
+        while True:
+            page = questions.order_by('id')
+            if last_id is not None:
+                page = page.filter(id__gt=last_id)
+            rows = list(page.values_list('id', 'keywords', 'tokens')[:batch_size])
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            self.skipped_count += sum(1 for _, keywords, _ in rows if not keywords)
+            yield rows
+
+    def tokenize_parallel(self, batches, processes):
+        """Tokenize batches in a process pool, yielding results in order.
+
+        At most two batches per process are in flight, so memory stays
+        bounded however large the bank is.
+        """
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = deque()
+            for rows in batches:
+                pending.append(executor.submit(tokenize_batch, rows))
+                if len(pending) >= processes * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def write_tokens(self, changes):
+        """Write one batch of changed token lists with a single pymongo bulk_write.
+
+        djongo cannot translate bulk_update, so the update goes to the
+        collection directly, matched on the integer id djongo keeps.
+        """
+        from pymongo import UpdateOne
+        from interview.db_operations import get_mongo_db
+        operations = [UpdateOne({'id': qid}, {'$set': {'tokens': tokens}}) for qid, tokens in changes]
+        get_mongo_db()[Question._meta.db_table].bulk_write(operations, ordered=False)
+        if self.verbose:
+            for qid, tokens in changes:
+                self.stdout.write(f'Tokenized question {qid}: {len(tokens)} tokens')
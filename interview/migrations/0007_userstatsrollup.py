@@ -0,0 +1,32 @@
+# Generated migration for UserStatsRollup model
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0006_feedback'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStatsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(max_length=100, unique=True)),
+                ('session_count', models.IntegerField(default=0)),
+                ('score_sum', models.FloatField(default=0)),
+                ('pass_count', models.IntegerField(default=0)),
+                ('answer_count', models.IntegerField(default=0)),
+                ('answer_score_sum', models.FloatField(default=0)),
+                ('daily_counts', models.JSONField(default=dict)),
+                ('recent_sessions', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User Stats Rollup',
+                'verbose_name_plural': 'User Stats Rollups',
+            },
+        ),
+    ]
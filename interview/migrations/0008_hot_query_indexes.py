@@ -0,0 +1,25 @@
+# Generated migration for indexes on hot query paths
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0007_userstatsrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['username', 'uploaded_at'], name='resume_user_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['level'], name='question_level_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(fields=['username', 'created_at'], name='session_user_created_idx'),
+        ),
+    ]
@@ -45,6 +45,7 @@ class Resume(models.Model):
     skill_categories = models.JSONField(default=dict)
     experience = models.TextField(blank=True, null=True)
     education = models.TextField(blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True, null=True)  # SHA-256 of the stored upload (resume_store)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -54,6 +55,9 @@ class Resume(models.Model):
         verbose_name = "Resume"
         verbose_name_plural = "Resumes"
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['username', 'uploaded_at'], name='resume_user_uploaded_idx'),
+        ]
 
 
 #  Question Storage Model
@@ -72,6 +76,11 @@ class Question(models.Model):
     class Meta:
         verbose_name = "Question"
         verbose_name_plural = "Questions"
+        # question_text lookups use a hashed index from `manage.py ensure_indexes`
+        # (long texts can exceed the key size of a regular index)
+        indexes = [
+            models.Index(fields=['level'], name='question_level_idx'),
+        ]
 
 
 #  Interview (Session) Model
@@ -95,6 +104,9 @@ class InterviewSession(models.Model):
         verbose_name = "Interview Session"
         verbose_name_plural = "Interview Sessions"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['username', 'created_at'], name='session_user_created_idx'),
+        ]
 
 
 #  Profile Model (Authenticated User)
@@ -117,3 +129,23 @@ class Profile(models.Model):
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
         ordering = ['-created_at']
+
+
+#  Per-user Analytics Rollup (maintained incrementally, see rollups.py)
+class UserStatsRollup(models.Model):
+    username = models.CharField(max_length=100, unique=True)
+    session_count = models.IntegerField(default=0)
+    score_sum = models.FloatField(default=0)
+    pass_count = models.IntegerField(default=0)  # sessions scoring >= 0.7
+    answer_count = models.IntegerField(default=0)
+    answer_score_sum = models.FloatField(default=0)
+    daily_counts = models.JSONField(default=dict)  # 'YYYY-MM-DD' -> sessions that day (recent days only)
+    recent_sessions = models.JSONField(default=list)  # newest-first ring of session summaries
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats rollup of {self.username}"
+
+    class Meta:
+        verbose_name = "User Stats Rollup"
+        verbose_name_plural = "User Stats Rollups"
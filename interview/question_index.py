@@ -0,0 +1,304 @@
+# interview/question_index.py
+# In-process inverted index over the Question bank for skill matching
+
+import logging
+import os
+import threading
+import time
+
+from django.db.models.signals import post_save, post_delete
+
+from .models import Question
+from .question_snapshot import QuestionSnapshot, SnapshotError, snapshot_signature, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a worker re-reads the bank even without a local save/delete
+# signal (other workers or raw Mongo writes don't fire signals here).
+INDEX_TTL_SECONDS = 300
+
+
+def question_to_dict(q):
+    """Shape a Question row exactly like get_questions_by_skills always has."""
+    return {
+        "keywords": q.keywords,
+        "tokens": q.tokens if hasattr(q, 'tokens') else [],  # Include pre-tokenized keywords
+        "question_text": q.question_text,
+        "level": q.level,
+        "answer": q.answer,
+    }
+
+
+class QuestionIndex:
+    """Inverted index from normalized keywords (and their substrings) to questions.
+
+    The legacy matcher accepts a question when, for any keyword ``k`` and any
+    skill ``s`` (both lowercased), ``s in k or k in s``. The index answers both
+    halves with dict lookups:
+
+    - ``s in k``: every substring of every distinct keyword maps to the keywords
+      containing it, so the skill itself is the lookup key.
+    - ``k in s``: every substring of the skill is looked up as a whole keyword.
+
+    Substrings are stored per *distinct* keyword, not per question, so memory
+    grows with the keyword vocabulary rather than the size of the bank.
+    """
+
+    def __init__(self):
+        self.ids = []                  # question ids in collection order
+        self.records = {}              # id -> question dict
+        self.positions = {}            # id -> position in collection order
+        self.keyword_to_positions = {}  # normalized keyword -> [positions]
+        self.substring_to_keywords = {}  # substring -> {normalized keywords}
+        self.keyworded_positions = []  # positions of questions with any usable keyword
+        self.snapshot = None           # QuestionSnapshot the records come from, if any
+        self.built_at = 0.0
+
+    @classmethod
+    def build(cls, questions=None):
+        index = cls()
+        if questions is None:
+            questions = Question.objects.all()
+        for q in questions:
+            index.add(q.pk, question_to_dict(q))
+        index.built_at = time.monotonic()
+        return index
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Index a QuestionSnapshot; records stay in the mapped file until used."""
+        index = cls()
+        index.snapshot = snapshot
+        index.records = snapshot
+        for qid, keywords in zip(snapshot.ids, snapshot.keywords):
+            index._index_keywords(qid, keywords)
+        index.built_at = time.monotonic()
+        return index
+
+    def add(self, qid, record):
+        self.records[qid] = record
+        self._index_keywords(qid, record.get("keywords"))
+
+    def _index_keywords(self, qid, keywords):
+        pos = len(self.ids)
+        self.ids.append(qid)
+        self.positions[qid] = pos
+
+        if not keywords:
+            return
+        normalized = {k.lower() for k in keywords if k}
+        if not normalized:
+            return
+        self.keyworded_positions.append(pos)
+        for kw in normalized:
+            bucket = self.keyword_to_positions.get(kw)
+            if bucket is None:
+                bucket = self.keyword_to_positions[kw] = []
+                self._index_substrings(kw)
+            bucket.append(pos)
+
+    def _index_substrings(self, kw):
+        n = len(kw)
+        for i in range(n):
+            for j in range(i + 1, n + 1):
+                self.substring_to_keywords.setdefault(kw[i:j], set()).add(kw)
+
+    def get(self, qid):
+        return self.records.get(qid)
+
+    def level(self, qid):
+        """A question's level without decoding the whole record."""
+        if self.snapshot is not None:
+            return self.snapshot.level(qid)
+        record = self.records.get(qid)
+        return record.get("level") if record is not None else None
+
+    def match_positions(self, skills):
+        """Return sorted collection positions of questions matching any skill."""
+        lower_skills = {s.lower() for s in skills}
+        if "" in lower_skills:
+            # An empty skill is a substring of every keyword
+            return list(self.keyworded_positions)
+
+        keywords = set()
+        for skill in lower_skills:
+            # skill in k
+            keywords.update(self.substring_to_keywords.get(skill, ()))
+            # k in skill
+            n = len(skill)
+            for i in range(n):
+                for j in range(i + 1, n + 1):
+                    if skill[i:j] in self.keyword_to_positions:
+                        keywords.add(skill[i:j])
+
+        positions = set()
+        for kw in keywords:
+            positions.update(self.keyword_to_positions[kw])
+        return sorted(positions)
+
+    def match_ids(self, skills, limit=None):
+        positions = self.match_positions(skills)
+        if limit is not None:
+            positions = positions[:limit]
+        return [self.ids[p] for p in positions]
+
+    def match(self, skills, limit=10):
+        """Return copies of matching question dicts in collection order."""
+        return [dict(self.records[qid]) for qid in self.match_ids(skills, limit)]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_snapshot_path():
+    """Path of the question-bank snapshot, or None when snapshots are disabled."""
+    from django.conf import settings
+    path = getattr(settings, 'NEXORA_QUESTION_SNAPSHOT', None)
+    return os.fspath(path) if path else None
+
+
+def _stale_marker_path(snapshot_path):
+    return f'{snapshot_path}.stale'
+
+
+def _marked_stale(snapshot_path, snapshot_mtime_ns):
+    """True when a Question changed since the snapshot was compiled.
+
+    A change touches the ``.stale`` marker next to the snapshot; the
+    snapshot's mtime is its compile start, so a marker at least as new means
+    the file may be missing that change.
+    """
+    try:
+        return os.stat(_stale_marker_path(snapshot_path)).st_mtime_ns >= snapshot_mtime_ns
+    except OSError:
+        return False
+
+
+def _snapshot_usable(snapshot_path):
+    """True when the snapshot exists and is not marked stale."""
+    signature = snapshot_signature(snapshot_path)
+    return signature is not None and not _marked_stale(snapshot_path, signature[2])
+
+
+def write_question_snapshot(path=None):
+    """Compile the bank into the snapshot file and drop this worker's index.
+
+    Only the management commands call this; workers never write or remove
+    the file (a mapped file cannot be replaced on Windows). Other workers
+    notice the new file on their next lookup. Returns the number of
+    questions written (None when snapshots are disabled).
+    """
+    path = path or get_snapshot_path()
+    if not path:
+        return None
+    count = _write_snapshot_file(path)
+    _drop_index()
+    return count
+
+
+def _write_snapshot_file(path):
+    from .answer_evaluation import ScoringProfile
+    started = time.monotonic()
+    started_ns = time.time_ns()
+    rows = (
+        (q.pk, question_to_dict(q), ScoringProfile(q.keywords, q.tokens).compile())
+        for q in Question.objects.all()
+    )
+    count = write_snapshot(path, rows)
+    # Date the file from before the bank was read, so a change made while it
+    # was being written still leaves it stale
+    os.utime(path, ns=(started_ns, started_ns))
+    logger.info(f"Question snapshot written: {count} questions to {path} in {time.monotonic() - started:.3f}s")
+    return count
+
+
+def _is_current(index, snapshot_path):
+    if index is None:
+        return False
+    if index.snapshot is not None:
+        # Snapshots never expire; they are replaced by a rebuild or marked stale by a change
+        signature = snapshot_signature(index.snapshot.path)
+        return signature == index.snapshot.signature and not _marked_stale(index.snapshot.path, signature[2])
+    if snapshot_path and _snapshot_usable(snapshot_path):
+        return False
+    return time.monotonic() - index.built_at < INDEX_TTL_SECONDS
+
+
+def _load_index(snapshot_path):
+    """Index from the snapshot when it is usable, otherwise from the database."""
+    if snapshot_path and _snapshot_usable(snapshot_path):
+        try:
+            return QuestionIndex.from_snapshot(QuestionSnapshot(snapshot_path))
+        except FileNotFoundError:
+            pass
+        except (SnapshotError, ValueError) as e:
+            logger.warning(f"Ignoring question snapshot: {e}")
+    return QuestionIndex.build()
+
+
+def get_question_index():
+    """Return the shared index, loading it on first use or after invalidation.
+
+    With NEXORA_QUESTION_SNAPSHOT set the index is built from the mmapped
+    snapshot (no database query) and reloaded when the file is replaced.
+    Without one, or while the snapshot is missing or stale, it is built
+    from the database and re-read every INDEX_TTL_SECONDS.
+    """
+    global _index
+    snapshot_path = get_snapshot_path()
+    index = _index
+    if _is_current(index, snapshot_path):
+        return index
+    with _index_lock:
+        index = _index
+        if not _is_current(index, snapshot_path):
+            started = time.monotonic()
+            index = _load_index(snapshot_path)
+            _index = index
+            source = "snapshot" if index.snapshot is not None else "database"
+            logger.info(
+                f"Question index built from {source}: {len(index.ids)} questions, "
+                f"{len(index.keyword_to_positions)} keywords in {time.monotonic() - started:.3f}s"
+            )
+    return index
+
+
+def compiled_scoring(qid):
+    """(keywords, tokens, compiled profile) from the loaded snapshot, or None.
+
+    Never triggers a load: scoring falls back to compiling the profile itself.
+    """
+    index = _index
+    if index is None or index.snapshot is None:
+        return None
+    return index.snapshot.compiled_scoring(qid)
+
+
+def _drop_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def invalidate_question_index(**kwargs):
+    """Drop the shared index and mark the snapshot stale.
+
+    Until a management command rebuilds the snapshot, every worker serves
+    questions from the database index instead.
+    """
+    path = get_snapshot_path()
+    if path:
+        marker = _stale_marker_path(path)
+        try:
+            with open(marker, 'a'):
+                pass
+            os.utime(marker)
+        except OSError as e:
+            logger.error(f"Could not mark question snapshot {path} stale: {e}")
+    _drop_index()
+
+
+def connect_signals():
+    post_save.connect(invalidate_question_index, sender=Question, dispatch_uid="question_index_save")
+    post_delete.connect(invalidate_question_index, sender=Question, dispatch_uid="question_index_delete")
@@ -0,0 +1,160 @@
+# interview/question_snapshot.py
+# Compiled, versioned question-bank snapshot that workers share through mmap
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+SNAPSHOT_MAGIC = b'NXQB'
+# Bump whenever the layout or the record shape changes; older files are rebuilt
+SNAPSHOT_VERSION = 1
+
+# magic, format version, question count, directory bytes, record bytes
+_HEADER = struct.Struct('<4sHxxIQQ')
+_OFFSET_TYPECODE = 'Q'
+
+
+class SnapshotError(Exception):
+    """The snapshot file is missing pieces, from another version or not a snapshot."""
+
+
+def _encode(value):
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_snapshot(path, rows):
+    """Write a snapshot atomically from (question id, record, compiled scoring) rows.
+
+    Layout (all little-endian):
+
+    - header: magic, version, count, directory length, records length
+    - offsets: count + 1 uint64 record offsets, relative to the records section
+    - directory: JSON {"ids", "levels", "keywords"} in collection order, which
+      is all a worker needs to build the keyword index
+    - records: one compact JSON object per question (the question dict plus
+      its compiled scoring profile), decoded only when a question is used
+
+    Returns the number of questions written.
+    """
+    ids, levels, keywords = [], [], []
+    offsets = array(_OFFSET_TYPECODE, [0])
+    chunks = []
+    size = 0
+    for qid, record, scoring in rows:
+        ids.append(qid)
+        levels.append(record.get('level'))
+        keywords.append(record.get('keywords') or [])
+        data = _encode(dict(record, scoring=scoring))
+        chunks.append(data)
+        size += len(data)
+        offsets.append(size)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    directory = _encode({'ids': ids, 'levels': levels, 'keywords': keywords})
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(ids), len(directory), size)
+
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(offsets.tobytes())
+            f.write(directory)
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        # Readers keep their mapping of the old file; new loads see the new one
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(ids)
+
+
+def snapshot_signature(path):
+    """Identity of the file currently at ``path`` (None if there is none)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class QuestionSnapshot:
+    """Read-only view of a snapshot file.
+
+    The file is memory-mapped, so record bodies stay in the OS page cache and
+    are shared by every worker on the host; only the directory is parsed
+    into process memory. Records are decoded on access and each call returns
+    a fresh dict.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            self.signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+            if st.st_size < _HEADER.size:
+                raise SnapshotError(f'{self.path} is too short to be a question snapshot')
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, directory_length, records_length = _HEADER.unpack_from(self.buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f'{self.path} is not a question snapshot')
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f'{self.path} is snapshot version {version}, expected {SNAPSHOT_VERSION}')
+
+        offsets_start = _HEADER.size
+        directory_start = offsets_start + (count + 1) * array(_OFFSET_TYPECODE).itemsize
+        self.records_start = directory_start + directory_length
+        if self.records_start + records_length != len(self.buffer):
+            raise SnapshotError(f'{self.path} is truncated')
+
+        self.offsets = array(_OFFSET_TYPECODE)
+        self.offsets.frombytes(self.buffer[offsets_start:directory_start])
+        if sys.byteorder != 'little':
+            self.offsets.byteswap()
+        directory = json.loads(self.buffer[directory_start:self.records_start])
+        self.ids = directory['ids']
+        self.levels = directory['levels']
+        self.keywords = directory['keywords']
+        self.positions = {qid: pos for pos, qid in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _load(self, pos):
+        start = self.records_start + self.offsets[pos]
+        end = self.records_start + self.offsets[pos + 1]
+        return json.loads(self.buffer[start:end])
+
+    def get(self, qid, default=None):
+        pos = self.positions.get(qid)
+        if pos is None:
+            return default
+        record = self._load(pos)
+        record.pop('scoring', None)
+        return record
+
+    def __getitem__(self, qid):
+        record = self.get(qid)
+        if record is None:
+            raise KeyError(qid)
+        return record
+
+    def level(self, qid):
+        pos = self.positions.get(qid)
+        return self.levels[pos] if pos is not None else None
+
+    def compiled_scoring(self, qid):
+        """(keywords, tokens, compiled profile) for a question, or None."""
+        pos = self.positions.get(qid)
+        if pos is None:
+            return None
+        record = self._load(pos)
+        return record.get('keywords'), record.get('tokens'), record.get('scoring')
@@ -0,0 +1,216 @@
+# interview/request_context.py
+# Lazy per-request access to the user's Profile and latest Resume (request.nexora)
+
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.utils.functional import cached_property
+
+from .models import Profile, Resume
+
+logger = logging.getLogger(__name__)
+
+# Seconds a profile / latest resume is reused across requests. Saves and
+# deletes invalidate it straight away in this process; with a per-process
+# cache (the default LocMemCache) other processes catch up within the TTL.
+CONTEXT_CACHE_TTL = 30
+
+_MISSING = object()
+
+
+# Helper to ensure a single Profile per user (merging duplicates)
+def get_single_profile(user):
+
+    try:
+        # first we try to get user profile from db
+        profile = Profile.objects.filter(user=user).first()
+        if profile:
+            return profile
+    except Exception as e:
+        print(f"DEBUG: Error getting profile: {e}")
+
+    # Create new if none exists
+    try:
+        profile = Profile.objects.create(
+            user=user,
+            unique_user_id=f"U{user.id}",
+            name=user.username,
+            email=user.email or "",
+        )
+        return profile
+    except Exception as e:
+        print(f"DEBUG: Error creating profile: {e}")
+        # Last resort - return any existing profile
+        return Profile.objects.filter(user=user).first()
+
+
+def _load_latest_resume(username):
+    # Plain query: db_operations.get_latest_resume logs a warning for every user without one
+    return Resume.objects.filter(username=username).order_by('-uploaded_at').first()
+
+
+def _profile_key(user_id):
+    return f"nexora:profile:{user_id}"
+
+
+def _latest_resume_key(username):
+    return f"nexora:latest_resume:{username}"
+
+
+def _cache_ttl():
+    return getattr(settings, 'NEXORA_CONTEXT_CACHE_TTL', CONTEXT_CACHE_TTL)
+
+
+def _cached(key, load, cache_none=True):
+    """Value from the cross-request cache, loading and storing it on a miss."""
+    ttl = _cache_ttl()
+    if not ttl:
+        return load()
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = load()
+        if value is not None or cache_none:
+            cache.set(key, value, ttl)
+    return value
+
+
+async def _acached(key, aload, cache_none=True):
+    """_cached for async loaders."""
+    ttl = _cache_ttl()
+    if not ttl:
+        return await aload()
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = await aload()
+        if value is not None or cache_none:
+            cache.set(key, value, ttl)
+    return value
+
+
+async def _aload_profile(user):
+    from .async_db import get_profile
+    profile = await get_profile(user.pk)
+    if profile is None:
+        # Creating the profile (or recovering from a failed read) goes through the ORM
+        profile = await sync_to_async(get_single_profile)(user)
+    return profile
+
+
+async def _aload_latest_resume(username):
+    from .async_db import get_latest_resume
+    return await get_latest_resume(username)
+
+
+def invalidate_user_context(user_id=None, username=None):
+    """Drop cached profile (by user id) and/or latest resume (by username)."""
+    keys = []
+    if user_id is not None:
+        keys.append(_profile_key(user_id))
+    if username:
+        keys.append(_latest_resume_key(username))
+    if keys:
+        cache.delete_many(keys)
+
+
+class NexoraContext:
+    """Per-request accessors; each value is resolved at most once per request."""
+
+    def __init__(self, request):
+        self.request = request
+
+    @cached_property
+    def profile(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return None
+        # A failed lookup/create is retried on the next request rather than cached
+        return _cached(_profile_key(user.pk), lambda: get_single_profile(user), cache_none=False)
+
+    @cached_property
+    def latest_resume(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return None
+        return _cached(_latest_resume_key(user.username), lambda: _load_latest_resume(user.username))
+
+    # Async counterparts for async views. They fill the same per-request and
+    # cross-request caches; request.user must already be resolved (see
+    # async_views.async_login_required).
+
+    async def aprofile(self):
+        if 'profile' not in self.__dict__:
+            user = self.request.user
+            profile = None
+            if user.is_authenticated:
+                profile = await _acached(_profile_key(user.pk), lambda: _aload_profile(user), cache_none=False)
+            self.__dict__['profile'] = profile
+        return self.__dict__['profile']
+
+    async def alatest_resume(self):
+        if 'latest_resume' not in self.__dict__:
+            user = self.request.user
+            resume = None
+            if user.is_authenticated:
+                resume = await _acached(_latest_resume_key(user.username),
+                                        lambda: _aload_latest_resume(user.username))
+            self.__dict__['latest_resume'] = resume
+        return self.__dict__['latest_resume']
+
+    def invalidate(self, profile=True, latest_resume=True):
+        """Forget the user's profile and/or latest resume, for this and later requests."""
+        user = self.request.user
+        if profile:
+            self.__dict__.pop('profile', None)
+        if latest_resume:
+            self.__dict__.pop('latest_resume', None)
+        if user.is_authenticated:
+            invalidate_user_context(
+                user_id=user.pk if profile else None,
+                username=user.username if latest_resume else None,
+            )
+
+
+class NexoraContextMiddleware:
+    """Attach a NexoraContext as ``request.nexora`` (after AuthenticationMiddleware).
+
+    Runs in either mode: under ASGI ``get_response`` is a coroutine function
+    and ``__call__`` simply hands back its awaitable, so async views are not
+    pushed through a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Mark instances as coroutine functions, as Django's MiddlewareMixin does
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        request.nexora = NexoraContext(request)
+        return self.get_response(request)
+
+
+def _on_profile_changed(sender, instance, **kwargs):
+    try:
+        invalidate_user_context(user_id=instance.user_id)
+    except Exception as e:
+        logger.error(f"Could not invalidate cached profile for user {instance.user_id}: {e}")
+
+
+def _on_resume_changed(sender, instance, **kwargs):
+    try:
+        invalidate_user_context(username=instance.username)
+    except Exception as e:
+        logger.error(f"Could not invalidate cached resume for {instance.username}: {e}")
+
+
+def connect_signals():
+    post_save.connect(_on_profile_changed, sender=Profile, dispatch_uid="request_context_profile_save")
+    post_delete.connect(_on_profile_changed, sender=Profile, dispatch_uid="request_context_profile_delete")
+    post_save.connect(_on_resume_changed, sender=Resume, dispatch_uid="request_context_resume_save")
+    post_delete.connect(_on_resume_changed, sender=Resume, dispatch_uid="request_context_resume_delete")
@@ -0,0 +1,353 @@
+# interview/resume_jobs.py
+# Background job queue for resume parsing (text extraction, OCR and NLP)
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .db_operations import insert_resume
+from .resume_store import load_cached_parse, parse_resume_cached
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = 'pending'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+# A job pending this long (seconds) probably has no worker to pick it up
+PENDING_NOTICE_SECONDS = 30
+
+DEFAULT_QUEUE_CONFIG = {
+    'BACKEND': 'filesystem',  # 'filesystem', 'mongo' or 'inline'
+    'PATH': os.path.join(settings.MEDIA_ROOT, 'resume_jobs'),
+    'COLLECTION': 'interview_resumejob',
+    'PROCESSES': 2,
+    # OCR pool size inside each parser process (overrides NEXORA_OCR_PROCESSES
+    # there), so a busy queue runs at most PROCESSES * OCR_PROCESSES OCR workers.
+    # 1 reads scanned pages in the parser process itself.
+    'OCR_PROCESSES': 1,
+    # Start parsing in a pool owned by the web process as soon as a job is
+    # queued, so `runserver` alone handles uploads. Deployments running
+    # `manage.py process_resume_jobs` turn this off.
+    'AUTOSTART': True,
+    # `process_resume_jobs` removes done/failed jobs older than this (seconds)
+    'KEEP_FINISHED': 86400,
+}
+
+
+def get_queue_config():
+    config = dict(DEFAULT_QUEUE_CONFIG)
+    config.update(getattr(settings, 'NEXORA_RESUME_QUEUE', {}))
+    return config
+
+
+def _new_job(username, email, file_path, content_hash=None):
+    return {
+        'id': uuid.uuid4().hex,
+        'status': JOB_PENDING,
+        'username': username,
+        'email': email or '',
+        'file_path': str(file_path),
+        'content_hash': content_hash,
+        'created_at': time.time(),
+        'started_at': None,
+        'finished_at': None,
+        'message': '',
+        'error': '',
+    }
+
+
+class FileJobQueue:
+    """Jobs stored as one JSON file each under a directory.
+
+    Claiming a job is an atomic rename of ``<id>.pending`` to ``<id>.running``,
+    so several web processes and workers can share the directory safely.
+    """
+
+    def __init__(self, root):
+        self.root = str(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, job_id, status):
+        return os.path.join(self.root, f"{job_id}.{status}")
+
+    def _write(self, job):
+        path = self._path(job['id'], job['status'])
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(job, f)
+        os.replace(tmp, path)
+
+    def enqueue(self, job):
+        self._write(job)
+        return job['id']
+
+    def get(self, job_id):
+        for status in (JOB_DONE, JOB_FAILED, JOB_RUNNING, JOB_PENDING):
+            try:
+                with open(self._path(job_id, status), 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (FileNotFoundError, ValueError):
+                continue
+        return None
+
+    def pending_ids(self):
+        entries = []
+        for name in os.listdir(self.root):
+            if name.endswith('.' + JOB_PENDING):
+                path = os.path.join(self.root, name)
+                try:
+                    entries.append((os.path.getmtime(path), name[:-len(JOB_PENDING) - 1]))
+                except OSError:
+                    continue
+        return [job_id for _, job_id in sorted(entries)]
+
+    def claim(self, job_id=None):
+        """Move a pending job (the given one, or the oldest) to running and return it."""
+        candidates = [job_id] if job_id else self.pending_ids()
+        for cid in candidates:
+            pending, running = self._path(cid, JOB_PENDING), self._path(cid, JOB_RUNNING)
+            try:
+                os.rename(pending, running)
+            except OSError:
+                continue  # claimed elsewhere
+            with open(running, 'r', encoding='utf-8') as f:
+                job = json.load(f)
+            job['status'] = JOB_RUNNING
+            job['started_at'] = time.time()
+            self._write(job)
+            return job
+        return None
+
+    def finish(self, job, status, message='', error=''):
+        job.update(status=status, message=message, error=error, finished_at=time.time())
+        self._write(job)
+        try:
+            os.remove(self._path(job['id'], JOB_RUNNING))
+        except OSError:
+            pass
+
+    def requeue_stale(self, older_than):
+        """Return running jobs older than ``older_than`` seconds to pending (crashed workers)."""
+        cutoff = time.time() - older_than
+        count = 0
+        for name in os.listdir(self.root):
+            if not name.endswith('.' + JOB_RUNNING):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.rename(path, path[:-len(JOB_RUNNING)] + JOB_PENDING)
+                    count += 1
+            except OSError:
+                continue
+        return count
+
+    def prune_finished(self, older_than):
+        """Remove done and failed jobs that finished more than ``older_than`` seconds ago."""
+        cutoff = time.time() - older_than
+        count = 0
+        for name in os.listdir(self.root):
+            if not name.endswith(('.' + JOB_DONE, '.' + JOB_FAILED)):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    count += 1
+            except OSError:
+                continue
+        return count
+
+
+class MongoJobQueue:
+    """Jobs stored as documents in a MongoDB collection; claiming is find_one_and_update."""
+
+    def __init__(self, collection_name):
+        from .db_operations import get_mongo_db
+        self.collection = get_mongo_db()[collection_name]
+
+    def enqueue(self, job):
+        doc = dict(job, _id=job['id'])
+        self.collection.insert_one(doc)
+        return job['id']
+
+    def get(self, job_id):
+        return self.collection.find_one({'_id': job_id}, {'_id': 0})
+
+    def claim(self, job_id=None):
+        from pymongo import ReturnDocument
+        query = {'status': JOB_PENDING}
+        if job_id:
+            query['_id'] = job_id
+        return self.collection.find_one_and_update(
+            query,
+            {'$set': {'status': JOB_RUNNING, 'started_at': time.time()}},
+            projection={'_id': 0},
+            sort=[('created_at', 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def finish(self, job, status, message='', error=''):
+        job.update(status=status, message=message, error=error, finished_at=time.time())
+        self.collection.update_one(
+            {'_id': job['id']},
+            {'$set': {'status': status, 'message': message, 'error': error, 'finished_at': job['finished_at']}},
+        )
+
+    def requeue_stale(self, older_than):
+        result = self.collection.update_many(
+            {'status': JOB_RUNNING, 'started_at': {'$lt': time.time() - older_than}},
+            {'$set': {'status': JOB_PENDING}},
+        )
+        return result.modified_count
+
+    def prune_finished(self, older_than):
+        result = self.collection.delete_many(
+            {'status': {'$in': [JOB_DONE, JOB_FAILED]}, 'finished_at': {'$lt': time.time() - older_than}},
+        )
+        return result.deleted_count
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """Return the configured job queue backend ('inline' stores jobs on disk too)."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                config = get_queue_config()
+                if config['BACKEND'] == 'mongo':
+                    _queue = MongoJobQueue(config['COLLECTION'])
+                else:
+                    _queue = FileJobQueue(config['PATH'])
+    return _queue
+
+
+def build_resume_data(parsed, username, email, content_hash=None):
+    """Map parse_resume_complete output onto Resume fields."""
+    return {
+        'username': username,
+        'content_hash': content_hash,
+        'email': parsed.get('contact_info', {}).get('email') or email or '',
+        'phone': parsed.get('contact_info', {}).get('phone') or '',
+        'skills': parsed.get('skills', []),
+        'skill_categories': parsed.get('skill_categories', {}),
+        'experience': parsed.get('text', '')[:2000],
+        'education': '\n'.join(parsed.get('education', {}).get('degrees', [])),
+    }
+
+
+def complete_resume_job(queue, job, parsed):
+    """Store a finished parse as the user's Resume and mark the job done or failed."""
+    try:
+        if parsed.get('error'):
+            queue.finish(job, JOB_FAILED, error=parsed['error'])
+            return job
+        resume_data = build_resume_data(parsed, job['username'], job['email'], job.get('content_hash'))
+        result = insert_resume(resume_data)
+        message = result.get('message') or f"Resume uploaded successfully! Extracted {len(resume_data['skills'])} skills."
+        if parsed.get('text_truncated'):
+            message += " Only the first part of your resume was read; shorten it to have all of it analysed."
+        queue.finish(job, JOB_DONE, message=message)
+    except Exception as e:
+        logger.error(f"Resume job {job['id']} failed: {e}")
+        queue.finish(job, JOB_FAILED, error=f'Error processing resume: {e}')
+    return job
+
+
+def _init_parse_worker(ocr_processes):
+    # Spawned workers start blank: load settings and run InterviewConfig.ready()
+    import django
+    django.setup()
+    from . import resume_parser
+    resume_parser.configure_ocr(processes=ocr_processes)
+
+
+def new_parse_executor(processes, ocr_processes=None):
+    """Process pool for resume parsing.
+
+    Workers are spawned rather than forked (the parent may be a web process
+    with threads running), configure themselves from settings and OCR with
+    at most ``ocr_processes`` (default: the queue's OCR_PROCESSES) each.
+    """
+    ocr_processes = ocr_processes or get_queue_config()['OCR_PROCESSES']
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=_init_parse_worker, initargs=(ocr_processes,))
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(processes=None):
+    """This process's pool, used with AUTOSTART."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = new_parse_executor(processes or get_queue_config()['PROCESSES'])
+    return _executor
+
+
+def dispatch_resume_job(queue, job, executor=None):
+    """Parse a claimed job in the process pool; the Resume is written when it finishes."""
+    executor = executor or get_executor()
+    future = executor.submit(parse_resume_cached, job['file_path'], job.get('content_hash'))
+
+    def _done(fut):
+        # Runs on an executor management thread, outside any request
+        close_old_connections()
+        try:
+            parsed = fut.result()
+        except Exception as e:
+            parsed = {'error': f'Error processing resume: {e}'}
+        complete_resume_job(queue, job, parsed)
+        close_old_connections()
+
+    future.add_done_callback(_done)
+    return future
+
+
+def submit_resume_job(username, email, file_path, content_hash=None):
+    """Queue a stored upload for parsing and return the job record.
+
+    A file whose content (``content_hash``) was already parsed by this
+    parser version completes at once from the parse cache. With the
+    'inline' backend the parse runs before returning (the old synchronous
+    behaviour); otherwise the job is left for `manage.py process_resume_jobs`
+    or, with AUTOSTART, handed to this process's pool.
+    """
+    config = get_queue_config()
+    queue = get_job_queue()
+    job = _new_job(username, email, file_path, content_hash)
+    queue.enqueue(job)
+    cached = load_cached_parse(content_hash) if content_hash else None
+    if cached is not None:
+        claimed = queue.claim(job['id'])
+        # Unclaimable means a worker already has it (and will hit the same cache)
+        return complete_resume_job(queue, claimed, cached) if claimed else job
+    if config['BACKEND'] == 'inline':
+        job = queue.claim(job['id'])
+        return complete_resume_job(queue, job, parse_resume_cached(job['file_path'], content_hash))
+    if config['AUTOSTART']:
+        claimed = queue.claim(job['id'])
+        if claimed:
+            dispatch_resume_job(queue, claimed)
+    return job
+
+
+def get_resume_job(job_id):
+    return get_job_queue().get(job_id)
@@ -4,12 +4,14 @@ import pdfplumber
 import docx
 import os
 import re
+import json
+import subprocess
+import sys
+import threading
+import time
 from PIL import Image
 import io
 
-import spacy
-from spacy.matcher import PhraseMatcher
-
 try:
     import pytesseract
     OCR_AVAILABLE = True
@@ -17,64 +19,267 @@ except ImportError:
     OCR_AVAILABLE = False
     print("Warning: pytesseract not installed. OCR for scanned PDFs will not be available.")
 
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' model. This might take a moment...")
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+# spaCy and its model are loaded on first use (see get_nlp), so importing this
+# module stays cheap for workers that never parse a resume.
+SPACY_MODEL = "en_core_web_sm"
+# Components excluded when the model is loaded; nothing here reads them.
+SPACY_DISABLED_COMPONENTS = ("tagger", "parser", "attribute_ruler", "lemmatizer")
 
+_nlp = None
+_nlp_lock = threading.Lock()
 
-def extract_text_from_resume(file_path):
+
+def configure_nlp(model=None, disabled_components=None):
+    """Override the spaCy model and excluded components before first use."""
+    global SPACY_MODEL, SPACY_DISABLED_COMPONENTS
+    if model:
+        SPACY_MODEL = model
+    if disabled_components is not None:
+        SPACY_DISABLED_COMPONENTS = tuple(disabled_components)
+
+
+def get_nlp():
+    """Return the shared spaCy pipeline, loading (and if needed downloading) it once."""
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                import spacy
+                try:
+                    _nlp = spacy.load(SPACY_MODEL, exclude=list(SPACY_DISABLED_COMPONENTS))
+                except OSError:
+                    print(f"Downloading '{SPACY_MODEL}' model. This might take a moment...")
+                    subprocess.run([sys.executable, "-m", "spacy", "download", SPACY_MODEL], check=False)
+                    _nlp = spacy.load(SPACY_MODEL, exclude=list(SPACY_DISABLED_COMPONENTS))
+    return _nlp
+
+
+def warm_up():
+    """Load the model and build the skill matcher ahead of the first upload."""
+    get_nlp()
+    get_skill_catalogue().matcher()
+
+
+# Limits on PDF text extraction; see configure_pdf. Pages are extracted one at
+# a time and the text is joined once, so a huge or slow upload stops at
+# whichever limit it reaches first and the parse carries on with what was
+# read. 0 disables a limit. The time budget is checked between pages (and
+# covers the OCR fallback too), so one very slow page can overrun it.
+PDF_MAX_PAGES = 20
+PDF_MAX_CHARS = 200000
+PDF_TIME_BUDGET = 30.0
+
+TRUNCATED_MAX_PAGES = "max_pages"
+TRUNCATED_MAX_CHARS = "max_chars"
+TRUNCATED_TIME_BUDGET = "time_budget"
+
+
+def configure_pdf(max_pages=None, max_chars=None, time_budget=None):
+    """Override the PDF page, character and wall-clock limits (0 = unlimited)."""
+    global PDF_MAX_PAGES, PDF_MAX_CHARS, PDF_TIME_BUDGET
+    if max_pages is not None:
+        PDF_MAX_PAGES = max(0, int(max_pages))
+    if max_chars is not None:
+        PDF_MAX_CHARS = max(0, int(max_chars))
+    if time_budget is not None:
+        PDF_TIME_BUDGET = max(0.0, float(time_budget))
+
+
+def iter_pdf_page_text(pdf):
+    """Yield the text of each page of an open pdfplumber PDF, one page at a time."""
+    for page in pdf.pages:
+        try:
+            yield page.extract_text() or ""
+        finally:
+            # Drop the page's parsed layout objects before moving on
+            close = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+            if close:
+                close()
+
+
+def _text_result(parts, reason, pages_read, page_count, failed=False):
+    return {
+        'text': "".join(parts),
+        'truncated': reason is not None,
+        'truncated_by': reason,
+        'pages_read': pages_read,
+        'page_count': page_count,
+        'failed': failed,
+    }
+
+
+def extract_pdf_text(file_path, max_pages=None, max_chars=None, time_budget=None):
+    """Extract a PDF's text within the page, character and time limits.
+
+    Limits default to PDF_MAX_PAGES / PDF_MAX_CHARS / PDF_TIME_BUDGET. Scanned
+    PDFs (no text layer) fall back to OCR with the same limits and whatever
+    is left of the time budget.
+
+    Returns:
+        dict: text, truncated, truncated_by (None, "max_pages", "max_chars"
+        or "time_budget"), pages_read, page_count, failed (OCR could not run;
+        the text is the reason)
+    """
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    max_chars = PDF_MAX_CHARS if max_chars is None else max_chars
+    time_budget = PDF_TIME_BUDGET if time_budget is None else time_budget
+    deadline = time.monotonic() + time_budget if time_budget else None
+
+    parts = []
+    size = 0
+    reason = None
+    pages_read = 0
+    with pdfplumber.open(file_path) as pdf:
+        page_count = len(pdf.pages)
+        pages = iter_pdf_page_text(pdf)
+        try:
+            for page_text in pages:
+                pages_read += 1
+                if max_chars and size + len(page_text) > max_chars:
+                    parts.append(page_text[:max_chars - size])
+                    size = max_chars
+                    reason = TRUNCATED_MAX_CHARS
+                    break
+                parts.append(page_text)
+                size += len(page_text)
+                if pages_read == page_count:
+                    break
+                if max_pages and pages_read >= max_pages:
+                    reason = TRUNCATED_MAX_PAGES
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    reason = TRUNCATED_TIME_BUDGET
+                    break
+        finally:
+            pages.close()
+
+    result = _text_result(parts, reason, pages_read, page_count)
+    if not result['text'].strip() and OCR_AVAILABLE:
+        print("PDF appears to be scanned. Attempting OCR...")
+        result = _ocr_pdf(file_path, max_pages=max_pages, max_chars=max_chars, deadline=deadline)
+    if result['truncated']:
+        print(f"PDF text truncated ({result['truncated_by']}) after "
+              f"{result['pages_read']} of {result['page_count']} pages: {file_path}")
+    return result
+
+
+def extract_resume_text(file_path):
+    """Extract a resume's text; see extract_pdf_text for the returned dict.
+
+    Errors and unsupported types come back as the text ("Error ..." /
+    "Unsupported ..."), as extract_text_from_resume has always returned them.
+    """
     _, extension = os.path.splitext(file_path)
-    text = ""
-    
+
     try:
         if extension == '.pdf':
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += page_text
-                
-                if not text.strip() and OCR_AVAILABLE:
-                    print("PDF appears to be scanned. Attempting OCR...")
-                    text = extract_text_with_ocr(file_path)
-            return text
-        
+            return extract_pdf_text(file_path)
+
         elif extension == '.docx':
             doc = docx.Document(file_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
-            return text
-            
+            return _text_result([para.text + "\n" for para in doc.paragraphs], None, None, None)
+
         else:
-            return f"Unsupported file type: {extension}"
-            
+            return _text_result([f"Unsupported file type: {extension}"], None, None, None)
+
     except Exception as e:
         print(f"Error extracting text from {file_path}: {e}")
-        return f"Error reading file: {e}"
+        return _text_result([f"Error reading file: {e}"], None, None, None)
+
+
+def extract_text_from_resume(file_path):
+    return extract_resume_text(file_path)['text']
+
+
+# OCR settings; see configure_ocr. Each worker renders and reads one page at a
+# time, so memory stays bounded by OCR_PROCESSES pages whatever the scan length.
+OCR_PROCESSES = min(4, os.cpu_count() or 1)
+OCR_DPI = 200
 
 
-def extract_text_with_ocr(pdf_path):
+def configure_ocr(processes=None, dpi=None):
+    """Override the OCR pool size and render resolution."""
+    global OCR_PROCESSES, OCR_DPI
+    if processes:
+        OCR_PROCESSES = max(1, int(processes))
+    if dpi:
+        OCR_DPI = int(dpi)
+
+
+def _ocr_page(pdf_path, page_number, dpi):
+    """Render a single PDF page and OCR it (runs in a pool worker)."""
+    import pdf2image
+    images = pdf2image.convert_from_path(pdf_path, dpi=dpi, first_page=page_number, last_page=page_number)
+    text = "".join(pytesseract.image_to_string(image) for image in images)
+    print(f"OCR processed page {page_number}")
+    return text
+
+
+def extract_text_with_ocr(pdf_path, processes=None):
     if not OCR_AVAILABLE:
         return "OCR not available. Install pytesseract to process scanned PDFs."
-    
-    text = ""
+    return _ocr_pdf(pdf_path, processes=processes)['text']
+
+
+def _ocr_pdf(pdf_path, processes=None, max_pages=0, max_chars=0, deadline=None):
+    """OCR up to max_pages pages, in page order, until the deadline (time.monotonic)."""
     try:
         import pdf2image
-        images = pdf2image.convert_from_path(pdf_path)
-        
-        for i, image in enumerate(images):
-            page_text = pytesseract.image_to_string(image)
-            text += page_text + "\n"
-            print(f"OCR processed page {i+1}/{len(images)}")
-        
-        return text
+        page_count = pdf2image.pdfinfo_from_path(pdf_path).get("Pages", 0)
+        last_page = min(page_count, max_pages) if max_pages else page_count
+        pages = range(1, last_page + 1)
+        processes = min(processes or OCR_PROCESSES, last_page) if last_page else 1
+
+        page_texts = []
+        reason = TRUNCATED_MAX_PAGES if last_page < page_count else None
+        if processes <= 1:
+            for n in pages:
+                if deadline is not None and time.monotonic() >= deadline:
+                    reason = TRUNCATED_TIME_BUDGET
+                    break
+                page_texts.append(_ocr_page(pdf_path, n, OCR_DPI) + "\n")
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, TimeoutError
+            # Spawned, not forked: this can run in a web process with threads running
+            executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+            try:
+                futures = [executor.submit(_ocr_page, pdf_path, n, OCR_DPI) for n in pages]
+                # Collected in page order regardless of which worker finishes first
+                for future in futures:
+                    timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                    try:
+                        page_texts.append(future.result(timeout=timeout) + "\n")
+                    except TimeoutError:
+                        reason = TRUNCATED_TIME_BUDGET
+                        break
+            finally:
+                # Pages not started yet are dropped; ones in progress finish in the background
+                executor.shutdown(wait=reason != TRUNCATED_TIME_BUDGET, cancel_futures=True)
+
+        text = "".join(page_texts)
+        if max_chars and len(text) > max_chars:
+            text = text[:max_chars]
+            reason = TRUNCATED_MAX_CHARS
+        return _text_result([text], reason, len(page_texts), page_count)
     except ImportError:
-        return "pdf2image not installed. Cannot perform OCR on scanned PDFs."
+        return _text_result(["pdf2image not installed. Cannot perform OCR on scanned PDFs."], None, None, None,
+                            failed=True)
     except Exception as e:
         print(f"OCR error: {e}")
-        return f"OCR failed: {e}"
+        return _text_result([f"OCR failed: {e}"], None, None, None, failed=True)
+
+
+def parse_resume_doc(text):
+    """Run spaCy once over the resume text with unused components disabled.
+
+    NER (for institutions) and the tokenizer (for skill matching) are all a
+    parse needs. SPACY_DISABLED_COMPONENTS are normally excluded at load; any
+    still in the pipeline (a model loaded before configure_nlp) are skipped here.
+    """
+    nlp = get_nlp()
+    disabled = [name for name in SPACY_DISABLED_COMPONENTS if name in nlp.pipe_names]
+    return nlp(text, disable=disabled)
 
 
 def extract_contact_info(text):
@@ -115,7 +320,6 @@ def extract_contact_info(text):
 
 
 def extract_experience_years(text):
-    doc = nlp(text)
     total_years = 0
     experience_entries = []
     
@@ -152,7 +356,7 @@ def extract_experience_years(text):
     }
 
 
-def extract_education(text):
+def extract_education(text, doc=None):
     education_info = {
         'degrees': [],
         'institutions': [],
@@ -171,7 +375,8 @@ def extract_education(text):
         matches = re.findall(pattern, text, re.IGNORECASE)
         education_info['degrees'].extend(matches)
     
-    doc = nlp(text)
+    if doc is None:
+        doc = parse_resume_doc(text)
     for ent in doc.ents:
         if ent.label_ == "ORG":
             org_text = ent.text.lower()
@@ -193,23 +398,74 @@ def extract_education(text):
     return education_info
 
 
+SKILL_CATALOGUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_catalogue.json')
+
+
+class SkillCatalogue:
+    """Skill categories loaded from a JSON data file.
+
+    The flattened skill list and the spaCy PhraseMatcher are built once per
+    catalogue (the matcher lazily, on first use) and shared by
+    extract_skills and categorize_skills.
+    """
+
+    def __init__(self, categories, path=None, mtime=None):
+        self.categories = categories
+        self.path = path
+        self.mtime = mtime
+        self.skill_list = [skill.lower() for skills in categories.values() for skill in skills]
+        self._matcher = None
+        self._matcher_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            categories = json.load(f)
+        return cls(categories, path=path, mtime=os.path.getmtime(path))
+
+    def matcher(self):
+        if self._matcher is None:
+            with self._matcher_lock:
+                if self._matcher is None:
+                    from spacy.matcher import PhraseMatcher
+                    nlp = get_nlp()
+                    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                    matcher.add("SKILL_MATCHER", [nlp.make_doc(skill) for skill in self.skill_list])
+                    self._matcher = matcher
+        return self._matcher
+
+
+_skill_catalogue = None
+_skill_catalogue_lock = threading.Lock()
+
+
+def reload_skill_catalogue(path=None):
+    """(Re)load the skill catalogue from a data file and make it the shared one."""
+    global _skill_catalogue
+    catalogue = SkillCatalogue.load(path or SKILL_CATALOGUE_PATH)
+    with _skill_catalogue_lock:
+        _skill_catalogue = catalogue
+    return catalogue
+
+
+def get_skill_catalogue():
+    """Return the shared skill catalogue, reloading it if its data file changed on disk."""
+    catalogue = _skill_catalogue
+    if catalogue is None:
+        return reload_skill_catalogue()
+    try:
+        if os.path.getmtime(catalogue.path) != catalogue.mtime:
+            return reload_skill_catalogue(catalogue.path)
+    except OSError:
+        pass
+    return catalogue
+
+
 def categorize_skills(skills_list):
-    SKILL_CATEGORIES = {
-        "Core CS": ["Algorithms", "C", "C++", "C#", "F#", "Compiler Design", "Concurrency", "Computer Networks", "Data Structures", "Distributed Systems", "DNS", "Dynamic Programming", "Functional Programming", "Go", "Golang", "Greedy Algorithms", "Graphs", "Hash Tables", "Heaps", "HTTP", "HTTPS", "Java", "JavaScript", "Kernel", "Kotlin", "Linux", "Linked Lists", "Load Balancing", "Memory Management", "Microservices", "Multithreading", "Object-Oriented Programming", "OOPS", "Operating Systems", "OS", "Parallelism", "Perl", "PHP", "Processes", "Python", "R", "Recursion", "Ruby", "Rust", "Scala", "Searching", "Shell", "Bash", "Sockets", "Sorting", "SQL", "Swift", "System Design", "TCP/IP", "Threads", "Trees", "Unix", "Virtualization", "Windows", "Actor Model", "Assembly", "A* Search", "B-Tree", "Elixir", "Emacs", "Erlang", "Vim", "Vi", "Design Patterns", "Breadth-First Search", "BFS", "Depth-First Search", "DFS", "Dijkstra's Algorithm", "Trie", "OSI Model", "MATLAB", "File Systems", "Garbage Collection", "RPC", "Remote Procedure Call", "Scheduling", "Semaphores", "Mutex", "Deadlock", "Lisp", "Haskell", "Clojure", "Scheme", "Prolog", "Imperative Programming", "Declarative Programming", "Logic Programming", "Solidity", "Smart Contracts", "Cryptography", "Bit manipulation", "POSIX", "Message Queues", "Queuing Theory", "Finite Automata", "Turing Machine"],
-        "Web Dev": [".NET", ".NET Core", "Angular", "Angular.js", "ASP.NET", "Bootstrap", "Client-Side Rendering", "CSR", "CSS", "Cypress", "Django", "DOM", "ES6", "Express.js", "FastAPI", "Flask", "Gatsby", "GraphQL", "gRPC", "HTML", "JavaScript", "JS", "jQuery", "Jest", "Jinja", "JWT", "JSON Web Token", "Laravel", "LESS", "Material UI", "MUI", "Meteor", "Next.js", "Nginx", "Node.js", "Nuxt.js", "OAuth", "PHP", "Playwright", "PostCSS", "React", "React.js", "React Testing Library", "Redux", "Remix", "REST API", "RESTful APIs", "Ruby on Rails", "Rails", "SASS", "Selenium", "Server-Side Rendering", "SSR", "SolidJS", "Spring", "Spring Boot", "Static Site Generation", "SSG", "Styled-Components", "Svelte", "SvelteKit", "Tailwind", "Tailwind CSS", "TypeScript", "TS", "Vite", "Vitest", "Vue.js", "WebAssembly", "WASM", "WebRTC", "WebSockets", "Webpack", "Accessibility", "a11y", "Apache", "Apache Tomcat", "Tomcat", "Astro", "Babel", "Backbone.js", "CakePHP", "CDN", "CGI", "Chakra UI", "Chrome Extensions", "CodeIgniter", "Cookies", "D3.js", "Ember.js", "EJS", "ESLint", "Fastify", "Handlebars", "Hapi", "Hono", "HTTP/2", "HTTP/3", "IIS", "Koa", "Local Storage", "Session Storage", "Micro-frontends", "Monorepo", "NestJS", "Phoenix", "Polymer", "Preact", "Prettier", "Progressive Web App", "PWA", "Puppeteer", "Qwik", "Serverless Functions", "Service Workers", "Socket.io", "Storybook", "Symfony", "Three.js", "Turborepo", "WebGL", "Wordpress", "Yii"],
-        "AI/ML/DS": ["A/B Testing", "Accuracy", "AI", "Analytics", "ARIMA", "Artificial Intelligence", "BERT", "Business Intelligence", "BI", "CatBoost", "Classification", "Clustering", "CNN", "Computer Vision", "CV", "Convolutional Neural Networks", "Data Cleaning", "Data Mining", "Data Science", "Data Visualization", "Data Wrangling", "Deep Learning", "DL", "EDA", "Exploratory Data Analysis", "F1-score", "Feature Engineering", "GAN", "Generative AI", "GenAI", "Generative Adversarial Networks", "GPT", "Hugging Face", "Hyperparameter Tuning", "Image Segmentation", "JAX", "Jupyter", "Keras", "LangChain", "LightGBM", "LlamaIndex", "Large Language Models", "LLM", "Machine Learning", "ML", "Matplotlib", "Metrics", "MLOps", "Model Evaluation", "Model Training", "Natural Language Processing", "NLP", "Neural Networks", "NN", "NLTK", "NumPy", "Object Detection", "OpenAI", "OpenCV", "Overfitting", "Pandas", "Power BI", "Precision", "PyTorch", "Recall", "Regression", "Reinforcement Learning", "RL", "Retrieval-Augmented Generation", "RAG", "RNN", "Recurrent Neural Networks", "Scikit-learn", "SciPy", "Seaborn", "Sentiment Analysis", "spaCy", "SQL", "Statsmodels", "Supervised Learning", "Tableau", "TensorFlow", "Tokenization", "Transfer Learning", "Transformers", "Underfitting", "Unsupervised Learning", "Vector Database", "XGBoost", "YOLO", "Activation Function", "Adam", "Autoencoder", "AutoML", "Backpropagation", "Bayesian", "Bias-Variance Tradeoff", "BigQuery", "ChromaDB", "Data Augmentation", "Data Governance", "Data Lake", "Data Warehouse", "Decision Trees", "Embeddings", "ETL", "Fine-tuning", "Gradio", "Gradient Descent", "Hidden Markov Model", "HMM", "ImageNet", "K-Means", "KNN", "Kubeflow", "Linear Regression", "Logistic Regression", "Looker", "Loss Function", "LSTM", "MILVUS", "MLflow", "Naive Bayes", "Pinecone", "Plotly", "Qdrant", "Quantization", "Random Forest", "ResNet", "Semi-Supervised Learning", "Streamlit", "Support Vector Machine", "SVM", "t-SNE", "VGG", "Weaviate"],
-        "Cyber Security": ["Access Control", "Application Security", "AppSec", "Attack Vectors", "Authentication", "Authorization", "Blue Team", "Brute Force", "Burp Suite", "CASB", "Cloud Security", "Compliance", "Cryptography", "Cross-Site Scripting", "XSS", "CSPM", "CWPP", "Cybersecurity", "Data Encryption", "Data Loss Prevention", "DLP", "Denial of Service", "DoS", "Distributed Denial of Service", "DDoS", "DevSecOps", "Ethical Hacking", "Firewalls", "GDPR", "Hashcat", "HIPAA", "Identity and Access Management", "IAM", "Incident Response", "IR", "Information Security", "Intrusion Detection System", "IDS", "Intrusion Prevention System", "IPS", "ISO 27001", "John the Ripper", "Malware Analysis", "Man-in-the-Middle", "MITM", "Metasploit", "Multi-Factor Authentication", "MFA", "Nessus", "Network Security", "Nmap", "NIST", "OWASP", "PCI-DSS", "Penetration Testing", "Pen Test", "Phishing", "Purple Team", "Ransomware", "Red Team", "Risk Assessment", "SIEM", "Security Information and Event Management", "Snort", "SOC", "Security Operations Center", "SOC 2", "Social Engineering", "SOAR", "Splunk", "SQL Injection", "Threat Intelligence", "Threat Modeling", "Vulnerability Assessment", "Wireshark", "Zero Trust", "Zero Trust Architecture", "ZTA", "AES", "Antivirus", "BCP", "Business Continuity Planning", "CISSP", "CMMC", "CompTIA Security+", "Security+", "CSA", "CISA", "CEH", "Cross-Site Request Forgery", "CSRF", "Directory Traversal", "Digital Forensics", "DRP", "Disaster Recovery Plan", "EASM", "Endpoint Security", "FedRAMP", "Forensics", "Ghidra", "GVM", "Homomorphic Encryption", "Honeypot", "Insecure Deserialization", "Key Management", "LDAP", "Mobile Security", "Okta", "OpenVAS", "OSINT", "PKI", "Public Key Infrastructure", "Principle of Least Privilege", "Radare2", "Reverse Engineering", "RSA", "SAST", "DAST", "IAST", "Sandboxing", "Security Audits", "Shodan", "SSO", "Single Sign-On", "SSL", "TLS", "TTPs", "WAF", "Web Application Firewall", "XDR", "Zero-Knowledge Proof", "ZKP"],
-        "DB/Cloud/DevOps": ["Agile", "Amazon Web Services", "AWS", "Ansible", "Apache Kafka", "Kafka", "Azure", "Azure DevOps", "Azure Functions", "Bitbucket", "Cassandra", "Chef", "CI/CD", "CircleCI", "Cloud Computing", "CloudFormation", "Configuration Management", "Containerization", "Continuous Deployment", "Continuous Integration", "Datadog", "DB2", "DigitalOcean", "Docker", "DynamoDB", "EC2", "Elasticsearch", "ELK Stack", "Firebase", "Firestore", "GCP", "Google Cloud", "Git", "GitHub", "GitLab", "GitLab CI", "Gitflow", "Google Cloud Functions", "Grafana", "Heroku", "IaC", "Infrastructure as Code", "IAM", "Jenkins", "Jira", "Kanban", "Kubernetes", "K8s", "Lambda", "AWS Lambda", "Linode", "MariaDB", "Microsoft SQL Server", "SQL Server", "MongoDB", "Monitoring", "MySQL", "NoSQL", "Observability", "Oracle", "Oracle SQL", "Packer", "PostgreSQL", "Postgres", "Prometheus", "Pulumi", "Puppet", "RabbitMQ", "RDS", "Redis", "S3", "Scrum", "Serverless", "Site Reliability Engineering", "SRE", "Snowflake", "SQLite", "Terraform", "Travis CI", "Vagrant", "VPC", "Version Control", "Active Directory", "ArgoCD", "AKS", "Azure Kubernetes Service", "BASH Scripting", "ClickHouse", "Cloudflare", "Cloud Run", "CloudWatch", "CockroachDB", "Couchbase", "CouchDB", "DataDog", "Databricks", "EKS", "Elastic Kubernetes Service", "ECS", "FinOps", "Flux", "GKE", "Google Kubernetes Engine", "GitOps", "GitHub Actions", "Helm", "InfluxDB", "Istio", "Linkerd", "Memcached", "New Relic", "Oracle Cloud", "OCI", "PlanetScale", "Powershell", "Rancher", "Redshift", "Route 53", "SaltStack", "Service Mesh", "SLI", "SLO", "Spinnaker", "Supabase", "TeamCity", "Terraform Cloud", "TimescaleDB", "Vault", "HashiCorp Vault", "VMware", "Vercel"],
-        "Mobile Development": ["Mobile Development", "iOS", "Android", "Swift", "SwiftUI", "UIKit", "Objective-C", "ObjC", "Kotlin", "Java", "Android SDK", "Android NDK", "Xcode", "Android Studio", "React Native", "Flutter", "Dart", "Xamarin", ".NET MAUI", "NativeScript", "Ionic", "Capacitor", "Apache Cordova", "Cordova", "PhoneGap", "Core Data", "SQLite", "Realm", "Firebase", "Fastlane", "App Store Connect", "Google Play Console", "TestFlight", "APK", "App Bundle", "AAB", "CocoaPods", "Swift Package Manager", "SPM", "Gradle", "ARKit", "Core ML", "ML Kit", "Jetpack Compose", "Jetpack", "LiveData", "ViewModel", "Room", "RxJava", "RxKotlin", "RxSwift", "Combine", "Grand Central Dispatch", "GCD", "Coroutines", "Kotlin Coroutines", "AlamoFire", "Kingfisher", "Push Notifications", "APNS", "FCM", "WidgetKit", "WatchOS", "TVOS", "Accessibility", "App Clips", "Core Animation", "Core Audio", "Core Graphics", "Core Location", "MapKit", "Metal", "SceneKit", "SpriteKit", "KMM", "Kotlin Multiplatform", "Ktor", "LeakCanary", "ProGuard", "R8", "Android App Bundle", "Material Design", "ConstraintLayout", "Fragments", "Intents", "Services", "Broadcast Receivers", "Content Providers", "Dagger", "Hilt", "Koin", "MVI", "MVVM", "MVC", "VIPER", "Redux", "MobX", "BLoC", "GetX", "Provider", "Riverpod", "SwiftData", "Viper", "Texture", "AsyncDisplayKit", "SnapKit", "Vapor", "Perfect", "Kitura", "Bugsnag", "Sentry", "Crashlytics"],
-        "Game Development": ["Game Development", "Game Dev", "Unreal Engine", "UE4", "UE5", "Unity", "Unity3D", "C#", "C++", "Blueprints", "UnrealScript", "CryEngine", "Godot", "Lumberyard", "GameMaker", "RPG Maker", "Twine", "Blender", "Maya", "3ds Max", "ZBrush", "Autodesk", "Cinema 4D", "Houdini", "Modo", "Substance Painter", "Substance Designer", "Quixel", "Megascans", "HLSL", "GLSL", "Shader", "DirectX", "OpenGL", "Vulkan", "Metal", "WebGL", "Physics Engine", "Havok", "PhysX", "Bullet", "Box2D", "Gameplay Programming", "Game AI", "Level Design", "Game Design", "3D Modeling", "Texturing", "Rigging", "Animation", "Real-Time Rendering", "Ray Tracing", "Game Physics", "Multiplayer", "Networking", "VR", "Virtual Reality", "AR", "Augmented Reality", "Mixed Reality", "MR", "XR", "Steam", "Epic Games Store", "Mobile Games", "Console Development", "2D", "3D", "AAA", "Asset Pipeline", "Artificial Intelligence", "AI", "Asset Store", "Audio Programming", "Cocos2d-x", "Compute Shaders", "DOTS", "ECS", "Entity Component System", "Game Feel", "Juice", "Game Loop", "Game State Management", "Gaffer", "GIMP", "Krita", "Level Editor", "Lighting", "LOD", "Level of Detail", "Materials", "NavMesh", "Pathfinding", "A*", "Particle Systems", "Photon", "PlayFab", "Procedural Generation", "PBR", "Physically Based Rendering", "Pygame", "Render Pipeline", "URP", "HDRP", "Scriptable Objects", "Shaders", "Sprite", "Tilemap", "UI/UX", "User Interface", "Vector Math", "Quaternion", "VFX", "Visual Effects", "Wwise", "FMOD"],
-        "Design/UI/UX": ["UI", "User Interface", "UX", "User Experience", "UI/UX", "Figma", "Sketch", "Adobe XD", "InVision", "Axure", "Balsamiq", "Zeplin", "Framer", "Principle", "Photoshop", "Illustrator", "After Effects", "Adobe Creative Suite", "Interaction Design", "IxD", "User Research", "User Testing", "Usability", "Usability Testing", "Accessibility", "a11y", "WCAG", "Wireframing", "Prototyping", "Mockups", "High-Fidelity", "Hi-Fi", "Low-Fidelity", "Lo-Fi", "Design Systems", "Atomic Design", "User Personas", "Personas", "Journey Mapping", "User Flows", "Empathy Maps", "Heuristic Evaluation", "Card Sorting", "Information Architecture", "IA", "Visual Design", "Typography", "Color Theory", "Responsive Design", "Mobile-First Design", "Human-Computer Interaction", "HCI", "Storyboarding", "A/B Testing", "User-Centered Design", "UCD", "Design Thinking", "Marvel", "Abstract", "User Interviews", "Surveys", "Affinity Diagram", "Canva", "CorelDRAW", "Webflow", "Maze", "UserZoom", "Hotjar"],
-        "Embedded Systems/IoT": ["Embedded Systems", "Embedded C", "Embedded C++", "Internet of Things", "IoT", "M2M", "Machine-to-Machine", "Real-Time Operating System", "RTOS", "FreeRTOS", "Zephyr", "VxWorks", "QNX", "Firmware", "Microcontroller", "MCU", "Microprocessor", "MPU", "SoC", "System-on-a-Chip", "FPGA", "ASIC", "Arduino", "Raspberry Pi", "ESP8266", "ESP32", "STM32", "ARM", "ARM Cortex", "RISC-V", "PIC", "BeagleBone", "Jetson Nano", "MQTT", "CoAP", "AMQP", "SPI", "I2C", "UART", "CAN Bus", "Modbus", "Zigbee", "Z-Wave", "Bluetooth", "BLE", "LoRa", "LoRaWAN", "6LoWPAN", "VHDL", "Verilog", "SystemVerilog", "LabVIEW", "MATLAB", "Simulink", "Keil", "IAR", "Eclipse IoT", "PlatformIO", "Yocto", "Buildroot", "Sensors", "Actuators", "GPIO", "ADC", "DAC", "PWM", "JTAG", "SWD", "OTA", "Over-the-Air", "Edge Computing", "IIoT", "Industrial IoT", "TinyML", "Bare Metal"]
-    }
-    
     categorized = {}
-    skills_lower = [s.lower() for s in skills_list]
+    skills_lower = {s.lower() for s in skills_list}
     
-    for category, category_skills in SKILL_CATEGORIES.items():
+    for category, category_skills in get_skill_catalogue().categories.items():
         matched = []
         for skill in category_skills:
             if skill.lower() in skills_lower:
@@ -219,47 +475,45 @@ def categorize_skills(skills_list):
     
     return categorized
 
-def extract_skills(text):
-    SKILL_CATEGORIES = {
-        "Core CS": ["Algorithms", "Big O Notation", "C", "C++", "C#", "F#", "Compiler Design", "Concurrency", "Computer Networks", "Data Structures", "Distributed Systems", "DNS", "Dynamic Programming", "Functional Programming", "Go", "Golang", "Greedy Algorithms", "Graphs", "Hash Tables", "Heaps", "HTTP", "HTTPS", "Java", "JavaScript", "Kernel", "Kotlin", "Linux", "Linked Lists", "Load Balancing", "Memory Management", "Microservices", "Multithreading", "Object-Oriented Programming", "OOP", "Operating Systems", "OS", "Parallelism", "Perl", "PHP", "Processes", "Python", "R", "Recursion", "Ruby", "Rust", "Scala", "Searching", "Shell", "Bash", "Sockets", "Sorting", "SQL", "Swift", "System Design", "TCP/IP", "Threads", "Trees", "Unix", "Virtualization", "Windows", "Actor Model", "Assembly", "A* Search", "B-Tree", "Elixir", "Emacs", "Erlang", "Vim", "Vi", "Design Patterns", "Breadth-First Search", "BFS", "Depth-First Search", "DFS", "Dijkstra's Algorithm", "Trie", "OSI Model", "MATLAB", "File Systems", "Garbage Collection", "RPC", "Remote Procedure Call", "Scheduling", "Semaphores", "Mutex", "Deadlock", "Lisp", "Haskell", "Clojure", "Scheme", "Prolog", "Imperative Programming", "Declarative Programming", "Logic Programming", "Solidity", "Smart Contracts", "Cryptography", "Bit manipulation", "POSIX", "Message Queues", "Queuing Theory", "Finite Automata", "Turing Machine"],
-        "Web Dev": [".NET", ".NET Core", "Angular", "Angular.js", "ASP.NET", "Bootstrap", "Client-Side Rendering", "CSR", "CSS", "Cypress", "Django", "DOM", "ES6", "Express.js", "FastAPI", "Flask", "Gatsby", "GraphQL", "gRPC", "HTML", "JavaScript", "JS", "jQuery", "Jest", "Jinja", "JWT", "JSON Web Token", "Laravel", "LESS", "Material UI", "MUI", "Meteor", "Next.js", "Nginx", "Node.js", "Nuxt.js", "OAuth", "PHP", "Playwright", "PostCSS", "React", "React.js", "React Testing Library", "Redux", "Remix", "REST API", "RESTful APIs", "Ruby on Rails", "Rails", "SASS", "Selenium", "Server-Side Rendering", "SSR", "SolidJS", "Spring", "Spring Boot", "Static Site Generation", "SSG", "Styled-Components", "Svelte", "SvelteKit", "Tailwind", "Tailwind CSS", "TypeScript", "TS", "Vite", "Vitest", "Vue.js", "WebAssembly", "WASM", "WebRTC", "WebSockets", "Webpack", "Accessibility", "a11y", "Apache", "Apache Tomcat", "Tomcat", "Astro", "Babel", "Backbone.js", "CakePHP", "CDN", "CGI", "Chakra UI", "Chrome Extensions", "CodeIgniter", "Cookies", "D3.js", "Ember.js", "EJS", "ESLint", "Fastify", "Handlebars", "Hapi", "Hono", "HTTP/2", "HTTP/3", "IIS", "Koa", "Local Storage", "Session Storage", "Micro-frontends", "Monorepo", "NestJS", "Phoenix", "Polymer", "Preact", "Prettier", "Progressive Web App", "PWA", "Puppeteer", "Qwik", "Serverless Functions", "Service Workers", "Socket.io", "Storybook", "Symfony", "Three.js", "Turborepo", "WebGL", "Wordpress", "Yii"],
-        "AI/ML/DS": ["A/B Testing", "Accuracy", "AI", "Analytics", "ARIMA", "Artificial Intelligence", "BERT", "Business Intelligence", "BI", "CatBoost", "Classification", "Clustering", "CNN", "Computer Vision", "CV", "Convolutional Neural Networks", "Data Cleaning", "Data Mining", "Data Science", "Data Visualization", "Data Wrangling", "Deep Learning", "DL", "EDA", "Exploratory Data Analysis", "F1-score", "Feature Engineering", "GAN", "Generative AI", "GenAI", "Generative Adversarial Networks", "GPT", "Hugging Face", "Hyperparameter Tuning", "Image Segmentation", "JAX", "Jupyter", "Keras", "LangChain", "LightGBM", "LlamaIndex", "Large Language Models", "LLM", "Machine Learning", "ML", "Matplotlib", "Metrics", "MLOps", "Model Evaluation", "Model Training", "Natural Language Processing", "NLP", "Neural Networks", "NN", "NLTK", "NumPy", "Object Detection", "OpenAI", "OpenCV", "Overfitting", "Pandas", "Power BI", "Precision", "PyTorch", "Recall", "Regression", "Reinforcement Learning", "RL", "Retrieval-Augmented Generation", "RAG", "RNN", "Recurrent Neural Networks", "Scikit-learn", "SciPy", "Seaborn", "Sentiment Analysis", "spaCy", "SQL", "Statsmodels", "Supervised Learning", "Tableau", "TensorFlow", "Tokenization", "Transfer Learning", "Transformers", "Underfitting", "Unsupervised Learning", "Vector Database", "XGBoost", "YOLO", "Activation Function", "Adam", "Autoencoder", "AutoML", "Backpropagation", "Bayesian", "Bias-Variance Tradeoff", "BigQuery", "ChromaDB", "Data Augmentation", "Data Governance", "Data Lake", "Data Warehouse", "Decision Trees", "Embeddings", "ETL", "Fine-tuning", "Gradio", "Gradient Descent", "Hidden Markov Model", "HMM", "ImageNet", "K-Means", "KNN", "Kubeflow", "Linear Regression", "Logistic Regression", "Looker", "Loss Function", "LSTM", "MILVUS", "MLflow", "Naive Bayes", "Pinecone", "Plotly", "Qdrant", "Quantization", "Random Forest", "ResNet", "Semi-Supervised Learning", "Streamlit", "Support Vector Machine", "SVM", "t-SNE", "VGG", "Weaviate"],
-        "Cyber Security": ["Access Control", "Application Security", "AppSec", "Attack Vectors", "Authentication", "Authorization", "Blue Team", "Brute Force", "Burp Suite", "CASB", "Cloud Security", "Compliance", "Cryptography", "Cross-Site Scripting", "XSS", "CSPM", "CWPP", "Cybersecurity", "Data Encryption", "Data Loss Prevention", "DLP", "Denial of Service", "DoS", "Distributed Denial of Service", "DDoS", "DevSecOps", "Ethical Hacking", "Firewalls", "GDPR", "Hashcat", "HIPAA", "Identity and Access Management", "IAM", "Incident Response", "IR", "Information Security", "Intrusion Detection System", "IDS", "Intrusion Prevention System", "IPS", "ISO 27001", "John the Ripper", "Malware Analysis", "Man-in-the-Middle", "MITM", "Metasploit", "Multi-Factor Authentication", "MFA", "Nessus", "Network Security", "Nmap", "NIST", "OWASP", "PCI-DSS", "Penetration Testing", "Pen Test", "Phishing", "Purple Team", "Ransomware", "Red Team", "Risk Assessment", "SIEM", "Security Information and Event Management", "Snort", "SOC", "Security Operations Center", "SOC 2", "Social Engineering", "SOAR", "Splunk", "SQL Injection", "Threat Intelligence", "Threat Modeling", "Vulnerability Assessment", "Wireshark", "Zero Trust", "Zero Trust Architecture", "ZTA", "AES", "Antivirus", "BCP", "Business Continuity Planning", "CISSP", "CMMC", "CompTIA Security+", "Security+", "CSA", "CISA", "CEH", "Cross-Site Request Forgery", "CSRF", "Directory Traversal", "Digital Forensics", "DRP", "Disaster Recovery Plan", "EASM", "Endpoint Security", "FedRAMP", "Forensics", "Ghidra", "GVM", "Homomorphic Encryption", "Honeypot", "Insecure Deserialization", "Key Management", "LDAP", "Mobile Security", "Okta", "OpenVAS", "OSINT", "PKI", "Public Key Infrastructure", "Principle of Least Privilege", "Radare2", "Reverse Engineering", "RSA", "SAST", "DAST", "IAST", "Sandboxing", "Security Audits", "Shodan", "SSO", "Single Sign-On", "SSL", "TLS", "TTPs", "WAF", "Web Application Firewall", "XDR", "Zero-Knowledge Proof", "ZKP"],
-        "DB/Cloud/DevOps": ["Agile", "Amazon Web Services", "AWS", "Ansible", "Apache Kafka", "Kafka", "Azure", "Azure DevOps", "Azure Functions", "Bitbucket", "Cassandra", "Chef", "CI/CD", "CircleCI", "Cloud Computing", "CloudFormation", "Configuration Management", "Containerization", "Continuous Deployment", "Continuous Integration", "Datadog", "DB2", "DigitalOcean", "Docker", "DynamoDB", "EC2", "Elasticsearch", "ELK Stack", "Firebase", "Firestore", "GCP", "Google Cloud", "Git", "GitHub", "GitLab", "GitLab CI", "Gitflow", "Google Cloud Functions", "Grafana", "Heroku", "IaC", "Infrastructure as Code", "IAM", "Jenkins", "Jira", "Kanban", "Kubernetes", "K8s", "Lambda", "AWS Lambda", "Linode", "MariaDB", "Microsoft SQL Server", "SQL Server", "MongoDB", "Monitoring", "MySQL", "NoSQL", "Observability", "Oracle", "Oracle SQL", "Packer", "PostgreSQL", "Postgres", "Prometheus", "Pulumi", "Puppet", "RabbitMQ", "RDS", "Redis", "S3", "Scrum", "Serverless", "Site Reliability Engineering", "SRE", "Snowflake", "SQLite", "Terraform", "Travis CI", "Vagrant", "VPC", "Version Control", "Active Directory", "ArgoCD", "AKS", "Azure Kubernetes Service", "BASH Scripting", "ClickHouse", "Cloudflare", "Cloud Run", "CloudWatch", "CockroachDB", "Couchbase", "CouchDB", "DataDog", "Databricks", "EKS", "Elastic Kubernetes Service", "ECS", "FinOps", "Flux", "GKE", "Google Kubernetes Engine", "GitOps", "GitHub Actions", "Helm", "InfluxDB", "Istio", "Linkerd", "Memcached", "New Relic", "Oracle Cloud", "OCI", "PlanetScale", "Powershell", "Rancher", "Redshift", "Route 53", "SaltStack", "Service Mesh", "SLI", "SLO", "Spinnaker", "Supabase", "TeamCity", "Terraform Cloud", "TimescaleDB", "Vault", "HashiCorp Vault", "VMware", "Vercel"],
-        "Mobile Development": ["Mobile Development", "iOS", "Android", "Swift", "SwiftUI", "UIKit", "Objective-C", "ObjC", "Kotlin", "Java", "Android SDK", "Android NDK", "Xcode", "Android Studio", "React Native", "Flutter", "Dart", "Xamarin", ".NET MAUI", "NativeScript", "Ionic", "Capacitor", "Apache Cordova", "Cordova", "PhoneGap", "Core Data", "SQLite", "Realm", "Firebase", "Fastlane", "App Store Connect", "Google Play Console", "TestFlight", "APK", "App Bundle", "AAB", "CocoaPods", "Swift Package Manager", "SPM", "Gradle", "ARKit", "Core ML", "ML Kit", "Jetpack Compose", "Jetpack", "LiveData", "ViewModel", "Room", "RxJava", "RxKotlin", "RxSwift", "Combine", "Grand Central Dispatch", "GCD", "Coroutines", "Kotlin Coroutines", "AlamoFire", "Kingfisher", "Push Notifications", "APNS", "FCM", "WidgetKit", "WatchOS", "TVOS", "Accessibility", "App Clips", "Core Animation", "Core Audio", "Core Graphics", "Core Location", "MapKit", "Metal", "SceneKit", "SpriteKit", "KMM", "Kotlin Multiplatform", "Ktor", "LeakCanary", "ProGuard", "R8", "Android App Bundle", "Material Design", "ConstraintLayout", "Fragments", "Intents", "Services", "Broadcast Receivers", "Content Providers", "Dagger", "Hilt", "Koin", "MVI", "MVVM", "MVC", "VIPER", "Redux", "MobX", "BLoC", "GetX", "Provider", "Riverpod", "SwiftData", "Viper", "Texture", "AsyncDisplayKit", "SnapKit", "Vapor", "Perfect", "Kitura", "Bugsnag", "Sentry", "Crashlytics"],
-        "Game Development": ["Game Development", "Game Dev", "Unreal Engine", "UE4", "UE5", "Unity", "Unity3D", "C#", "C++", "Blueprints", "UnrealScript", "CryEngine", "Godot", "Lumberyard", "GameMaker", "RPG Maker", "Twine", "Blender", "Maya", "3ds Max", "ZBrush", "Autodesk", "Cinema 4D", "Houdini", "Modo", "Substance Painter", "Substance Designer", "Quixel", "Megascans", "HLSL", "GLSL", "Shader", "DirectX", "OpenGL", "Vulkan", "Metal", "WebGL", "Physics Engine", "Havok", "PhysX", "Bullet", "Box2D", "Gameplay Programming", "Game AI", "Level Design", "Game Design", "3D Modeling", "Texturing", "Rigging", "Animation", "Real-Time Rendering", "Ray Tracing", "Game Physics", "Multiplayer", "Networking", "VR", "Virtual Reality", "AR", "Augmented Reality", "Mixed Reality", "MR", "XR", "Steam", "Epic Games Store", "Mobile Games", "Console Development", "2D", "3D", "AAA", "Asset Pipeline", "Artificial Intelligence", "AI", "Asset Store", "Audio Programming", "Cocos2d-x", "Compute Shaders", "DOTS", "ECS", "Entity Component System", "Game Feel", "Juice", "Game Loop", "Game State Management", "Gaffer", "GIMP", "Krita", "Level Editor", "Lighting", "LOD", "Level of Detail", "Materials", "NavMesh", "Pathfinding", "A*", "Particle Systems", "Photon", "PlayFab", "Procedural Generation", "PBR", "Physically Based Rendering", "Pygame", "Render Pipeline", "URP", "HDRP", "Scriptable Objects", "Shaders", "Sprite", "Tilemap", "UI/UX", "User Interface", "Vector Math", "Quaternion", "VFX", "Visual Effects", "Wwise", "FMOD"],
-        "Design/UI/UX": ["UI", "User Interface", "UX", "User Experience", "UI/UX", "Figma", "Sketch", "Adobe XD", "InVision", "Axure", "Balsamiq", "Zeplin", "Framer", "Principle", "Photoshop", "Illustrator", "After Effects", "Adobe Creative Suite", "Interaction Design", "IxD", "User Research", "User Testing", "Usability", "Usability Testing", "Accessibility", "a11y", "WCAG", "Wireframing", "Prototyping", "Mockups", "High-Fidelity", "Hi-Fi", "Low-Fidelity", "Lo-Fi", "Design Systems", "Atomic Design", "User Personas", "Personas", "Journey Mapping", "User Flows", "Empathy Maps", "Heuristic Evaluation", "Card Sorting", "Information Architecture", "IA", "Visual Design", "Typography", "Color Theory", "Responsive Design", "Mobile-First Design", "Human-Computer Interaction", "HCI", "Storyboarding", "A/B Testing", "User-Centered Design", "UCD", "Design Thinking", "Marvel", "Abstract", "User Interviews", "Surveys", "Affinity Diagram", "Canva", "CorelDRAW", "Webflow", "Maze", "UserZoom", "Hotjar"],
-        "Embedded Systems/IoT": ["Embedded Systems", "Embedded C", "Embedded C++", "Internet of Things", "IoT", "M2M", "Machine-to-Machine", "Real-Time Operating System", "RTOS", "FreeRTOS", "Zephyr", "VxWorks", "QNX", "Firmware", "Microcontroller", "MCU", "Microprocessor", "MPU", "SoC", "System-on-a-Chip", "FPGA", "ASIC", "Arduino", "Raspberry Pi", "ESP8266", "ESP32", "STM32", "ARM", "ARM Cortex", "RISC-V", "PIC", "BeagleBone", "Jetson Nano", "MQTT", "CoAP", "AMQP", "SPI", "I2C", "UART", "CAN Bus", "Modbus", "Zigbee", "Z-Wave", "Bluetooth", "BLE", "LoRa", "LoRaWAN", "6LoWPAN", "VHDL", "Verilog", "SystemVerilog", "LabVIEW", "MATLAB", "Simulink", "Keil", "IAR", "Eclipse IoT", "PlatformIO", "Yocto", "Buildroot", "Sensors", "Actuators", "GPIO", "ADC", "DAC", "PWM", "JTAG", "SWD", "OTA", "Over-the-Air", "Edge Computing", "IIoT", "Industrial IoT", "TinyML", "Bare Metal"]
-    }
-    
-    SKILL_LIST = []
-    for category, skills in SKILL_CATEGORIES.items():
-        SKILL_LIST.extend([skill.lower() for skill in skills])
-    
-    doc = nlp(text.lower())
-    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    skill_patterns = [nlp.make_doc(skill) for skill in SKILL_LIST]
-    matcher.add("SKILL_MATCHER", skill_patterns)
-    matches = matcher(doc)
+def extract_skills(text, doc=None):
+    # Matching is on the LOWER attribute, so the tokenizer alone is enough
+    if doc is None:
+        doc = get_nlp().make_doc(text.lower())
+    matches = get_skill_catalogue().matcher()(doc)
     
     found_skills = set()
     for match_id, start, end in matches:
         span = doc[start:end]
-        found_skills.add(span.text)
+        found_skills.add(span.text.lower())
         
     return list(found_skills)
 
 
+# Bump whenever parse_resume_complete's output changes for the same file;
+# cached parses (resume_store) from other versions are ignored.
+PARSER_VERSION = 1
+
+
+def parser_version():
+    """PARSER_VERSION plus the settings and data that shape a parse (keys the parse cache)."""
+    catalogue = get_skill_catalogue()
+    return (f"{PARSER_VERSION}:{SPACY_MODEL}:{PDF_MAX_PAGES}:{PDF_MAX_CHARS}:{OCR_AVAILABLE}:{OCR_DPI}:"
+            f"{catalogue.mtime}")
+
+
 def parse_resume_complete(file_path):
-    text = extract_text_from_resume(file_path)
+    extracted = extract_resume_text(file_path)
+    text = extracted['text']
     
     if text.startswith("Error") or text.startswith("Unsupported"):
         return {'error': text}
     
-    skills = extract_skills(text)
+    # One spaCy pass shared by every extractor
+    doc = parse_resume_doc(text)
+    skills = extract_skills(text, doc=doc)
     contact_info = extract_contact_info(text)
     experience = extract_experience_years(text)
-    education = extract_education(text)
+    education = extract_education(text, doc=doc)
     skill_categories = categorize_skills(skills)
     
     return {
@@ -268,5 +522,10 @@ def parse_resume_complete(file_path):
         'skill_categories': skill_categories,
         'contact_info': contact_info,
         'experience': experience,
-        'education': education
+        'education': education,
+        # Only part of the document was read (see extract_pdf_text limits)
+        'text_truncated': extracted['truncated'],
+        'text_truncated_by': extracted['truncated_by'],
+        # Scanned PDF whose OCR could not run: the text is the reason, so it is never cached
+        'ocr_failed': extracted['failed'],
     }
@@ -0,0 +1,188 @@
+# interview/resume_store.py
+# Content-addressed resume uploads and the parse-result cache keyed by their hash
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_CONFIG = {
+    # Uploads, stored as <PATH>/<hash[:2]>/<sha256><ext>
+    'PATH': os.path.join(settings.MEDIA_ROOT, 'resumes'),
+    # parse_resume_complete results, one JSON file per (hash, parser version)
+    'CACHE_PATH': os.path.join(settings.MEDIA_ROOT, 'resume_cache'),
+}
+
+
+def get_store_config():
+    config = dict(DEFAULT_STORE_CONFIG)
+    config.update(getattr(settings, 'NEXORA_RESUME_STORE', {}))
+    return config
+
+
+def _is_content_hash(value):
+    return len(value) == 64 and all(c in '0123456789abcdef' for c in value)
+
+
+def resume_path(content_hash, extension, root=None):
+    root = str(root or get_store_config()['PATH'])
+    return os.path.join(root, content_hash[:2], content_hash + extension)
+
+
+def store_upload(uploaded_file):
+    """Stream an UploadedFile to disk under its SHA-256, hashing chunks as they are written.
+
+    Identical uploads (from anyone) share one file; same-named uploads
+    never overwrite each other.
+
+    Returns:
+        dict: content_hash, path, size, created (False when the file was already stored)
+    """
+    root = str(get_store_config()['PATH'])
+    os.makedirs(root, exist_ok=True)
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = os.path.join(root, f'upload-{os.getpid()}-{time.monotonic_ns()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as destination:
+            for chunk in uploaded_file.chunks():
+                digest.update(chunk)
+                destination.write(chunk)
+                size += len(chunk)
+        content_hash = digest.hexdigest()
+        path = resume_path(content_hash, extension, root)
+        created = not os.path.exists(path)
+        if created:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        else:
+            # Refresh the mtime so collect_resume_files' grace period counts from this upload
+            os.utime(path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {'content_hash': content_hash, 'path': path, 'size': size, 'created': created}
+
+
+def _version_tag(version):
+    return hashlib.sha1(version.encode('utf-8')).hexdigest()[:12]
+
+
+def _cache_path(content_hash, version, cache_root=None):
+    cache_root = str(cache_root or get_store_config()['CACHE_PATH'])
+    return os.path.join(cache_root, content_hash[:2], f'{content_hash}.{_version_tag(version)}.json')
+
+
+def load_cached_parse(content_hash):
+    """Cached parse_resume_complete result for this content and parser version, or None."""
+    from .resume_parser import parser_version
+    version = parser_version()
+    try:
+        with open(_cache_path(content_hash, version), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != version:
+        return None
+    return entry.get('parsed')
+
+
+def save_cached_parse(content_hash, parsed):
+    """Cache a parse unless it failed, OCR failed or it was cut short by the time budget (none is repeatable)."""
+    from .resume_parser import parser_version, TRUNCATED_TIME_BUDGET
+    if (parsed.get('error') or parsed.get('ocr_failed')
+            or parsed.get('text_truncated_by') == TRUNCATED_TIME_BUDGET):
+        return False
+    version = parser_version()
+    path = _cache_path(content_hash, version)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, 'content_hash': content_hash, 'parsed': parsed}, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.error(f"Could not cache resume parse {content_hash}: {e}")
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+
+def parse_resume_cached(file_path, content_hash=None):
+    """parse_resume_complete, served from / stored in the parse cache when the hash is known."""
+    from .resume_parser import parse_resume_complete
+    if content_hash:
+        parsed = load_cached_parse(content_hash)
+        if parsed is not None:
+            return parsed
+    parsed = parse_resume_complete(file_path)
+    if content_hash:
+        save_cached_parse(content_hash, parsed)
+    return parsed
+
+
+def _iter_files(root):
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            yield os.path.join(dirpath, name), name
+
+
+def collect_resume_files(min_age=86400, dry_run=False, include_legacy=False):
+    """Remove stored uploads and cached parses no Resume refers to.
+
+    Only files older than ``min_age`` seconds are touched, so uploads whose
+    parse is still queued or running are left alone. Cache entries for an
+    outdated parser version are removed as well. Files saved under their
+    original name before uploads were content-addressed are only removed
+    with ``include_legacy``.
+
+    Returns:
+        dict: files and bytes removed, per kind ('uploads', 'legacy', 'cache')
+    """
+    from .models import Resume
+    from .resume_parser import parser_version
+
+    config = get_store_config()
+    referenced = set(Resume.objects.exclude(content_hash=None).values_list('content_hash', flat=True))
+    current_tag = _version_tag(parser_version())
+    cutoff = time.time() - min_age
+    removed = {kind: {'files': 0, 'bytes': 0} for kind in ('uploads', 'legacy', 'cache')}
+
+    def remove(path, kind):
+        try:
+            st = os.stat(path)
+            if st.st_mtime > cutoff:
+                return
+            if not dry_run:
+                os.remove(path)
+        except OSError as e:
+            logger.error(f"Could not remove {path}: {e}")
+            return
+        removed[kind]['files'] += 1
+        removed[kind]['bytes'] += st.st_size
+
+    for path, name in _iter_files(str(config['PATH'])):
+        stem = os.path.splitext(name)[0]
+        if _is_content_hash(stem):
+            if stem not in referenced:
+                remove(path, 'uploads')
+        elif name.endswith('.tmp'):
+            # Left behind by an interrupted upload
+            remove(path, 'uploads')
+        elif include_legacy:
+            remove(path, 'legacy')
+
+    for path, name in _iter_files(str(config['CACHE_PATH'])):
+        parts = name.split('.')
+        if len(parts) != 3 or parts[0] not in referenced or parts[1] != current_tag:
+            remove(path, 'cache')
+
+    return removed
@@ -0,0 +1,248 @@
+# interview/rollups.py
+# Incrementally maintained per-user interview analytics (UserStatsRollup)
+
+import logging
+from datetime import datetime, timedelta
+
+from django.db import DatabaseError
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from .models import InterviewSession, UserStatsRollup
+
+logger = logging.getLogger(__name__)
+
+# Newest sessions kept in the ring; covers the 12-session reports chart
+RECENT_SESSIONS_RING = 12
+# Days of per-day session counts kept for the "last 30 days" figures
+DAILY_COUNT_DAYS = 31
+# Session score counted as a pass (also used by db_operations' report pipelines)
+PASS_THRESHOLD = 0.7
+# Conditional ring updates attempted before falling back to a full rebuild
+RECORD_RETRIES = 5
+
+
+def summarize_session(session):
+    """Compact, JSON-serializable summary of one session for the recent ring.
+
+    Per-answer scores are reduced to a sum/count, the high/mid/low band
+    counts the dashboard insight uses, and per-keyword [sum, count] pairs
+    that the views group into skill categories at read time.
+    """
+    answer_count = 0
+    answer_score_sum = 0.0
+    bands = [0, 0, 0]  # >= 0.75, 0.4-0.75, < 0.4
+    keywords = {}
+    answers = session.answers if isinstance(session.answers, dict) else {}
+    for meta in answers.values():
+        try:
+            sc = float(meta.get('score', 0))
+            answer_count += 1
+            answer_score_sum += sc
+            bands[0 if sc >= 0.75 else 1 if sc >= 0.4 else 2] += 1
+        except Exception:
+            sc = 0.0
+        for kw in meta.get('keywords', []) or []:
+            if isinstance(kw, str) and kw.strip():
+                acc = keywords.setdefault(kw.strip(), [0.0, 0])
+                acc[0] += sc
+                acc[1] += 1
+
+    created_at = session.created_at or timezone.now()
+    return {
+        'session_id': session.session_id,
+        'score': session.score,
+        'created_at': created_at.isoformat(),
+        'skills': list(session.skills[:3]) if session.skills else [],
+        'level': session.current_level,
+        'answer_count': answer_count,
+        'answer_score_sum': answer_score_sum,
+        'bands': bands,
+        'keywords': keywords,
+    }
+
+
+def _day_key(created_at):
+    return created_at[:10]
+
+
+def _counter_deltas(summary, sign=1):
+    return {
+        'session_count': sign,
+        'score_sum': sign * summary['score'],
+        'pass_count': sign * (1 if summary['score'] >= PASS_THRESHOLD else 0),
+        'answer_count': sign * summary['answer_count'],
+        'answer_score_sum': sign * summary['answer_score_sum'],
+    }
+
+
+def _count_day(daily_counts, summary, sign=1):
+    day = _day_key(summary['created_at'])
+    daily_counts[day] = daily_counts.get(day, 0) + sign
+
+
+def _apply(rollup, summary, sign=1):
+    for field, delta in _counter_deltas(summary, sign).items():
+        setattr(rollup, field, getattr(rollup, field) + delta)
+    _count_day(rollup.daily_counts, summary, sign)
+
+
+def _pruned_daily_counts(daily_counts):
+    cutoff = (timezone.now() - timedelta(days=DAILY_COUNT_DAYS)).strftime('%Y-%m-%d')
+    return {day: n for day, n in daily_counts.items() if day >= cutoff and n > 0}
+
+
+def rebuild_user_rollup(username):
+    """Recompute a user's rollup from their full history (bootstrap and repair)."""
+    rollup = UserStatsRollup.objects.filter(username=username).first() or UserStatsRollup(username=username)
+    rollup.session_count = 0
+    rollup.score_sum = 0.0
+    rollup.pass_count = 0
+    rollup.answer_count = 0
+    rollup.answer_score_sum = 0.0
+    rollup.daily_counts = {}
+    recent = []
+    for session in InterviewSession.objects.filter(username=username).order_by('-created_at'):
+        summary = summarize_session(session)
+        _apply(rollup, summary)
+        if len(recent) < RECENT_SESSIONS_RING:
+            recent.append(summary)
+    rollup.recent_sessions = recent
+    rollup.daily_counts = _pruned_daily_counts(rollup.daily_counts)
+    creating = rollup.pk is None
+    try:
+        rollup.save()
+    except DatabaseError:
+        # Another request created this user's rollup first (usernames are unique):
+        # write the same from-history figures over it instead
+        existing = UserStatsRollup.objects.filter(username=username).first() if creating else None
+        if existing is None:
+            raise
+        rollup.pk = existing.pk
+        rollup.save()
+    return rollup
+
+
+def get_user_rollup(username):
+    """Return the user's rollup, building it from history the first time."""
+    rollup = UserStatsRollup.objects.filter(username=username).first()
+    if rollup is None:
+        rollup = rebuild_user_rollup(username)
+    return rollup
+
+
+def record_session(session, created=True):
+    """Fold a saved session into its user's rollup without rescanning history.
+
+    Concurrent saves for one user must not lose each other's figures, so the
+    rollup is never written back whole: the counters are $inc'ed, and the
+    ring and daily counts are replaced in the same update, conditioned on
+    them still being what was read. When another save got in first the
+    document is re-read and the update retried.
+    """
+    from .db_operations import get_mongo_db
+    collection = get_mongo_db()[UserStatsRollup._meta.db_table]
+    summary = summarize_session(session)
+
+    for _ in range(RECORD_RETRIES):
+        rollup = collection.find_one({'username': session.username},
+                                     {'recent_sessions': 1, 'daily_counts': 1})
+        if rollup is None:
+            rebuild_user_rollup(session.username)  # includes this session
+            return
+        ring = rollup.get('recent_sessions') or []
+        daily_counts = dict(rollup.get('daily_counts') or {})
+
+        deltas = _counter_deltas(summary)
+        if not created:
+            previous = next((s for s in ring if s['session_id'] == session.session_id), None)
+            if previous is None:
+                # Re-saved session that already left the ring: its old figures are gone
+                rebuild_user_rollup(session.username)
+                return
+            for field, delta in _counter_deltas(previous, sign=-1).items():
+                deltas[field] += delta
+            _count_day(daily_counts, previous, sign=-1)
+        _count_day(daily_counts, summary)
+
+        recent = [s for s in ring if s['session_id'] != session.session_id]
+        recent.append(summary)
+        recent.sort(key=lambda s: s['created_at'], reverse=True)
+
+        result = collection.update_one(
+            {'_id': rollup['_id'],
+             'recent_sessions': rollup.get('recent_sessions'),
+             'daily_counts': rollup.get('daily_counts')},
+            {'$inc': deltas,
+             '$set': {'recent_sessions': recent[:RECENT_SESSIONS_RING],
+                      'daily_counts': _pruned_daily_counts(daily_counts),
+                      'updated_at': timezone.now()}},
+        )
+        if result.matched_count:
+            return
+
+    # Still contended after the retries: recompute from history instead
+    rebuild_user_rollup(session.username)
+
+
+def _on_session_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    try:
+        record_session(instance, created=created)
+    except Exception as e:
+        logger.error(f"Could not update stats rollup for {instance.username}: {e}")
+
+
+def _on_session_deleted(sender, instance, **kwargs):
+    try:
+        rebuild_user_rollup(instance.username)
+    except Exception as e:
+        logger.error(f"Could not rebuild stats rollup for {instance.username}: {e}")
+
+
+def connect_signals():
+    post_save.connect(_on_session_saved, sender=InterviewSession, dispatch_uid="stats_rollup_save")
+    post_delete.connect(_on_session_deleted, sender=InterviewSession, dispatch_uid="stats_rollup_delete")
+
+
+# ------------------------------------------------------------
+# Read helpers used by the dashboard, reports and profile views
+# ------------------------------------------------------------
+
+def average_score(rollup):
+    return rollup.score_sum / rollup.session_count if rollup.session_count else 0.0
+
+
+def sessions_since(rollup, days):
+    """Sessions in the last ``days`` days, at day granularity."""
+    cutoff = (timezone.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    return sum(n for day, n in rollup.daily_counts.items() if day >= cutoff)
+
+
+def recent_session_times(rollup, limit):
+    """[(created_at datetime, summary)] for the newest ``limit`` sessions, newest first."""
+    return [(datetime.fromisoformat(s['created_at']), s) for s in rollup.recent_sessions[:limit]]
+
+
+def keyword_scores(rollup, limit=10):
+    """keyword -> [score_sum, count] over the newest ``limit`` sessions."""
+    totals = {}
+    for summary in rollup.recent_sessions[:limit]:
+        for kw, (sc_sum, n) in summary.get('keywords', {}).items():
+            acc = totals.setdefault(kw, [0.0, 0])
+            acc[0] += sc_sum
+            acc[1] += n
+    return totals
+
+
+def category_scores(rollup, skill_to_category, limit=10):
+    """category -> [score_sum, count] for keywords that map to a resume skill category."""
+    totals = {}
+    for kw, (sc_sum, n) in keyword_scores(rollup, limit).items():
+        category = skill_to_category.get(kw.lower())
+        if category is not None:
+            acc = totals.setdefault(category, [0.0, 0])
+            acc[0] += sc_sum
+            acc[1] += n
+    return totals
@@ -1,3 +1,139 @@
-from django.test import TestCase
+import random
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from . import answer_evaluation
+from .answer_evaluation import (
+    FUZZY_THRESHOLD, fuzzy_parity_mismatches, get_fuzzy_engine, set_fuzzy_engine, tokenize,
+)
+
+WORDS = (
+    "python django java cloud database testing network memory thread docker kubernetes api "
+    "algorithms concurrency scalability latency caching index query recursion polymorphism"
+).split()
+FILLER = ["the", "is", "a", "and", "of", "we", "use", "it"]
+
+
+def _typo(rng, word):
+    """Drop, swap or double a letter half the time."""
+    if len(word) < 5 or rng.random() < 0.5:
+        return word
+    i = rng.randrange(len(word) - 1)
+    edit = rng.randrange(3)
+    if edit == 0:
+        return word[:i] + word[i + 1:]
+    if edit == 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + word[i] + word[i:]
+
+
+def scoring_cases(count=300, seed=7):
+    """A fixed set of (answer, question) pairs covering typos, phrases, pre-tokenized and id-less questions."""
+    rng = random.Random(seed)
+    answers, questions = [], []
+    for i in range(count):
+        keywords = rng.sample(WORDS, rng.randint(0, 6))
+        if rng.random() < 0.3:
+            keywords = [" ".join(rng.sample(WORDS, 2))] + keywords
+        question = {'keywords': keywords}
+        if rng.random() < 0.5:
+            question['tokens'] = [w for k in keywords for w in k.split()]
+        if rng.random() < 0.5:
+            question['id'] = rng.randrange(40)
+        n = rng.randint(0, 80)
+        answer = " ".join(_typo(rng, rng.choice(WORDS + FILLER)) for _ in range(n))
+        if i % 25 == 0:
+            answer = answers[-1] if answers else ""
+        answers.append(answer)
+        questions.append(question)
+    answers += ["", "!!! ???", "Python, Django & REST-APIs."]
+    questions += [{'keywords': ['python']}, {'keywords': ['python']}, {'keywords': ['python', 'django', 'rest api']}]
+    return answers, questions
+
+
+class FuzzyEngineParityTests(SimpleTestCase):
+    """The pruned fuzzy matcher must agree with the pairwise SequenceMatcher reference."""
+
+    def setUp(self):
+        self.engine = get_fuzzy_engine()
+        answer_evaluation._scoring_profiles.clear()
+
+    def tearDown(self):
+        set_fuzzy_engine(self.engine)
+        answer_evaluation._scoring_profiles.clear()
+
+    def test_no_term_mismatches(self):
+        rng = random.Random(11)
+        terms = WORDS + [_typo(rng, w) for w in WORDS] + ["api", "sql", "", "Docker ", "kubernetes-api"]
+        for answer in scoring_cases()[0]:
+            tokens = tokenize(answer)
+            self.assertEqual(fuzzy_parity_mismatches(tokens, terms), [], answer)
+
+    def test_no_mismatches_at_other_thresholds(self):
+        tokens = tokenize("concurency scalabilty latncy cachng recurson polymorphsm databse")
+        for threshold in (-0.5, 0.0, 0.6, 0.7, FUZZY_THRESHOLD, 0.9, 1.0):
+            self.assertEqual(fuzzy_parity_mismatches(tokens, WORDS, threshold), [], threshold)
+
+    def test_scores_match_difflib_engine(self):
+        answers, questions = scoring_cases()
+        results = {}
+        for engine in ("difflib", "fast"):
+            set_fuzzy_engine(engine)
+            answer_evaluation._scoring_profiles.clear()
+            results[engine] = [
+                answer_evaluation._smart_keyword_score(a, q['keywords'], q.get('tokens'), question_id=q.get('id'))
+                for a, q in zip(answers, questions)
+            ]
+        self.assertEqual(results["fast"], results["difflib"])
+
+
+class ScoreManyParityTests(SimpleTestCase):
+    """score_many must return exactly what _smart_keyword_score returns pair by pair."""
+
+    def setUp(self):
+        self.engine = get_fuzzy_engine()
+        answer_evaluation._scoring_profiles.clear()
+
+    def tearDown(self):
+        set_fuzzy_engine(self.engine)
+        answer_evaluation._scoring_profiles.clear()
+
+    def assert_matches_sequential(self, answers, questions):
+        expected = [
+            answer_evaluation._smart_keyword_score(a, q.get('keywords'), q.get('tokens'), question_id=q.get('id'))
+            for a, q in zip(answers, questions)
+        ]
+        got = answer_evaluation.score_many(answers, questions)
+        mismatches = [i for i, (e, g) in enumerate(zip(expected, got)) if e != g]
+        self.assertEqual(mismatches, [])
+        # Same number types too: results are stored in sessions and rendered as-is
+        for e, g in zip(expected, got):
+            self.assertIs(type(g[0]), type(e[0]))
+            self.assertEqual({k: type(v) for k, v in g[1].items()}, {k: type(v) for k, v in e[1].items()})
+
+    def test_matches_sequential_scoring(self):
+        for engine in ("fast", "difflib"):
+            with self.subTest(engine=engine):
+                set_fuzzy_engine(engine)
+                answer_evaluation._scoring_profiles.clear()
+                self.assert_matches_sequential(*scoring_cases())
+
+    def test_matches_without_numpy(self):
+        available = answer_evaluation.NUMPY_AVAILABLE
+        answer_evaluation.NUMPY_AVAILABLE = False
+        try:
+            self.assert_matches_sequential(*scoring_cases(count=60, seed=3))
+        finally:
+            answer_evaluation.NUMPY_AVAILABLE = available
+
+    def test_composite_breakdowns_match(self):
+        answers, questions = scoring_cases(count=80, seed=5)
+        expected = [
+            answer_evaluation.composite_breakdown(a, q['keywords'], pre_tokenized=q.get('tokens'))
+            for a, q in zip(answers, questions)
+        ]
+        self.assertEqual(answer_evaluation.composite_breakdown_many(answers, questions), expected)
+
+    def test_length_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            answer_evaluation.score_many(["one answer"], [])
@@ -2,14 +2,22 @@
 
 from django.urls import path
 from . import views
+from .async_db import get_async_config
+
+# Under ASGI the dashboard, question and results pages use the async views
+if get_async_config()['VIEWS']:
+    from . import async_views as flow_views
+else:
+    flow_views = views
 
 urlpatterns = [
     path('upload/', views.upload_resume, name='upload_resume'),
-    path('dashboard/', views.dashboard, name='interview_dashboard'),
+    path('upload/status/<str:job_id>/', views.resume_job_status, name='resume_job_status'),
+    path('dashboard/', flow_views.dashboard, name='interview_dashboard'),
     path('start/', views.start_interview_view, name='start_interview'),
     path('instructions/', views.interview_instructions_view, name='interview_instructions'),
-    path('question/', views.interview_question_view, name='interview_question'),
-    path('results/<str:session_id>/', views.results_view, name='interview_results'),
+    path('question/', flow_views.interview_question_view, name='interview_question'),
+    path('results/<str:session_id>/', flow_views.results_view, name='interview_results'),
     
     # New pages
     path('reports/', views.reports_view, name='reports'),
@@ -8,10 +8,13 @@ from .answer_evaluation import (
     keyword_match_score,
     composite_answer_score,
     composite_breakdown,
+    composite_breakdown_many,
 )
-from .db_operations import get_questions_by_skills, save_answers, get_session_data
+from .db_operations import save_answers, get_session_data
+from .question_index import get_question_index
 from .models import Question
 import random
+import re
 
 
 # ============================================================
@@ -30,7 +33,7 @@ def get_fixed_interview_questions(skills, counts=None, total=None):
         total (int): optional total cap; if omitted uses sum(counts)
 
     Returns:
-        list[dict]
+        list[dict]: question dicts, each carrying its question 'id'
     """
     if not skills or not isinstance(skills, list):
         skills = []
@@ -42,25 +45,17 @@ def get_fixed_interview_questions(skills, counts=None, total=None):
     if total is None:
         total = sum(counts.values())
 
-    all_questions = get_questions_by_skills(skills, limit=300)
-    if not all_questions:
-        all_questions = [
-            {
-                "keywords": q.keywords if q.keywords else [],
-                "tokens": q.tokens if hasattr(q, 'tokens') else [],
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            }
-            for q in Question.objects.all()
-        ]
-
-    # Group by level
+    index = get_question_index()
+    ids = index.match_ids(skills, limit=300)
+    if not ids:
+        ids = list(index.ids)
+
+    # Group ids by level; only the selected questions are materialized
     grouped = {"beginner": [], "intermediate": [], "hard": []}
-    for q in all_questions:
-        lvl = q.get("level", "beginner")
+    for qid in ids:
+        lvl = index.level(qid)
         if lvl in grouped:
-            grouped[lvl].append(q)
+            grouped[lvl].append(qid)
 
     selected = []
     for lvl, cnt in counts.items():
@@ -69,17 +64,18 @@ def get_fixed_interview_questions(skills, counts=None, total=None):
 
     # Fill remainder if under target total
     if len(selected) < total:
-        remaining = [q for q in all_questions if q not in selected]
+        selected_ids = set(selected)
+        remaining = [qid for qid in ids if qid not in selected_ids]
         selected.extend(remaining[: (total - len(selected))])
 
-    return selected[:total]
+    return [dict(index.get(qid), id=qid) for qid in selected[:total]]
 
 
 # ============================================================
 # ANSWER SCORING FOR EACH QUESTION
 # ============================================================
 
-def score_single_answer(answer_text, expected_keywords, pre_tokenized=None, level='beginner'):
+def score_single_answer(answer_text, expected_keywords, pre_tokenized=None, level='beginner', question_id=None):
     """
     Score a single answer based on keyword matching.
 
@@ -88,12 +84,14 @@ def score_single_answer(answer_text, expected_keywords, pre_tokenized=None, leve
         expected_keywords: List of expected keywords (raw)
         pre_tokenized: List of pre-tokenized keywords (optional, preferred)
         level: Question difficulty level
+        question_id: Question id, used to reuse its cached ScoringProfile
 
     Returns:
         float: score between 0 and 1
     """
     # Use composite scoring with pre-tokenized keywords if available
-    return composite_answer_score(answer_text, expected_keywords, level=level, pre_tokenized=pre_tokenized)
+    return composite_answer_score(answer_text, expected_keywords, level=level, pre_tokenized=pre_tokenized,
+                                  question_id=question_id)
 
 
 # ============================================================
@@ -114,13 +112,13 @@ def evaluate_interview_answers(user_id, field, current_level, user_answers):
         dict: evaluation and scoring summary
     """
 
-    # Fetch expected questions for this level
-    questions = Question.objects.filter(level=current_level)
-
-    # Build mapping: question_id -> expected_keywords
-    level_bank = {str(q.id): q.keywords for q in questions}
+    # Build mapping: question_id -> expected_keywords (only those two fields are loaded)
+    level_bank = {
+        str(qid): keywords
+        for qid, keywords in Question.objects.filter(level=current_level).values_list('id', 'keywords')
+    }
 
-    # Perform scoring
+    # Perform scoring (the whole bank in one score_many batch)
     per_question, avg_score, overall_flag = evaluate_user_level(
         user_answers,
         level_bank,
@@ -152,59 +150,55 @@ def evaluate_interview_answers(user_id, field, current_level, user_answers):
 
 
 # ============================================================
-# OLD ADAPTIVE QUESTION FUNCTION (KEPT FOR COMPATIBILITY)
+# ADAPTIVE QUESTION SELECTION (PER-INTERVIEW POOL)
 # ============================================================
 
-def _build_question_pool(skills):
-    """Return a pool of questions (skill-matched first, fallback to all)."""
-    if not skills or not isinstance(skills, list):
-        skills = []
-    pool = get_questions_by_skills(skills, limit=300)
-    if not pool:
-        pool = [
-            {
-                "keywords": q.keywords if q.keywords else [],
-                "tokens": q.tokens if hasattr(q, 'tokens') else [],
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            }
-            for q in Question.objects.all()
-        ]
-    # Shuffle for variety but keep deterministic slice use later
-    random.shuffle(pool)
-    return pool
-
-
-def get_adaptive_questions(skills, answered, target_total=10, base_level='beginner'):
-    """
-    Real-time adaptive question selection.
+ADAPTIVE_LEVELS = ['beginner', 'intermediate', 'hard']
+ADAPTIVE_CAPS = {'beginner': 4, 'intermediate': 3, 'hard': 3}
+
+
+def build_adaptive_pool(skills, seed=None, per_level=None):
+    """Build the candidate pool for one adaptive interview.
+
+    Called once at interview start. The pool is a small JSON-serializable dict
+    kept in the session: a seeded shuffle of question ids split into one queue
+    per level. Queues are stored reversed so the next candidate is a
+    ``list.pop()``.
 
     Args:
         skills (list): extracted skills
-        answered (list[dict]): list of {'question_text','score','level'} already answered
-        target_total (int): interview length
-        base_level (str): starting difficulty
+        seed (int): optional shuffle seed (random if omitted)
+        per_level (int): optional cap on ids kept per level queue
 
     Returns:
-        dict | None: next question dictionary or None if interview complete
-
-    Policy:
-        - Target distribution: 4 beginner, 3 intermediate, 3 hard (like fixed mode)
-        - Difficulty escalation: if rolling avg (last 2) > 0.75 and quota not met -> move up
-        - Difficulty de-escalation: if rolling avg (last 2) < 0.40 -> move down (unless already beginner)
-        - Otherwise maintain current level
-        - Avoid duplicates; fallback to any remaining question if quota depleted
+        dict: {'seed': int, 'queues': {level: [question ids]}}
     """
-    # Interview complete
-    if len(answered) >= target_total:
-        return None
-
-    pool = _build_question_pool(skills)
-
-    # Keep track of used question texts for exclusion
-    used_texts = {a['question_text'] for a in answered}
-
+    if not skills or not isinstance(skills, list):
+        skills = []
+    if seed is None:
+        seed = random.randrange(2 ** 31)
+
+    index = get_question_index()
+    ids = index.match_ids(skills, limit=300)
+    if not ids:
+        ids = list(index.ids)
+    random.Random(seed).shuffle(ids)
+
+    queues = {lvl: [] for lvl in ADAPTIVE_LEVELS}
+    queues['other'] = []
+    for qid in ids:
+        lvl = index.level(qid)
+        queues[lvl if lvl in queues else 'other'].append(qid)
+    for lvl, queue in queues.items():
+        if per_level is not None:
+            del queue[per_level:]
+        queue.reverse()
+
+    return {'seed': seed, 'queues': queues}
+
+
+def _desired_level(answered, base_level):
+    """Pick the next difficulty from rolling performance and the 4/3/3 caps."""
     # Count per level answered so far
     counts = {'beginner': 0, 'intermediate': 0, 'hard': 0}
     for a in answered:
@@ -230,44 +224,223 @@ def get_adaptive_questions(skills, answered, target_total=10, base_level='beginn
         desired = descend_map[last_level]
 
     # Enforce distribution caps (4/3/3)
-    caps = {'beginner': 4, 'intermediate': 3, 'hard': 3}
-    if counts.get(desired,0) >= caps[desired]:
+    caps = ADAPTIVE_CAPS
+    if counts.get(desired,0) >= caps.get(desired, 0):
         # Pick a level with remaining quota (priority order beginner->intermediate->hard)
-        for lvl in ['beginner','intermediate','hard']:
+        for lvl in ADAPTIVE_LEVELS:
             if counts[lvl] < caps[lvl]:
                 desired = lvl
                 break
+    return desired
+
+
+def _pop_unused(queue, index, used_texts):
+    """Pop ids off a queue until one resolves to an unused question."""
+    while queue:
+        qid = queue.pop()
+        q = index.get(qid)
+        if q is not None and q.get('question_text') not in used_texts:
+            return dict(q, id=qid)
+    return None
+
+
+def next_adaptive_question(pool, answered, target_total=10, base_level='beginner'):
+    """Pop the next question from a pool built by build_adaptive_pool.
+
+    The pool is mutated in place; callers keeping it in the session must
+    store it back afterwards.
+
+    Returns:
+        dict | None: question dict (with its 'id') or None if interview complete
+    """
+    if len(answered) >= target_total:
+        return None
+
+    index = get_question_index()
+    used_texts = {a['question_text'] for a in answered}
+    queues = pool.get('queues', {})
+
+    desired = _desired_level(answered, base_level)
+    order = [desired] + [lvl for lvl in ADAPTIVE_LEVELS + ['other'] if lvl != desired]
+    for lvl in order:
+        q = _pop_unused(queues.get(lvl, []), index, used_texts)
+        if q is not None:
+            return q
+    return None  # No questions available
 
-    # Filter candidate questions
-    candidates = [q for q in pool if q.get('level') == desired and q.get('question_text') not in used_texts]
 
-    if not candidates:
-        # Fallback: any unused question
-        candidates = [q for q in pool if q.get('question_text') not in used_texts]
+def get_adaptive_questions(skills, answered, target_total=10, base_level='beginner', pool=None):
+    """
+    Real-time adaptive question selection.
+
+    Args:
+        skills (list): extracted skills
+        answered (list[dict]): list of {'question_text','score','level'} already answered
+        target_total (int): interview length
+        base_level (str): starting difficulty
+        pool (dict): per-interview pool from build_adaptive_pool (built ad hoc if omitted)
+
+    Returns:
+        dict | None: next question dictionary or None if interview complete
+
+    Policy:
+        - Target distribution: 4 beginner, 3 intermediate, 3 hard (like fixed mode)
+        - Difficulty escalation: if rolling avg (last 2) > 0.75 and quota not met -> move up
+        - Difficulty de-escalation: if rolling avg (last 2) < 0.40 -> move down (unless already beginner)
+        - Otherwise maintain current level
+        - Avoid duplicates; fallback to any remaining question if quota depleted
+    """
+    # Interview complete
+    if len(answered) >= target_total:
+        return None
 
-    if not candidates:
-        return None  # No questions available
+    if pool is None:
+        pool = build_adaptive_pool(skills)
 
-    # Select first candidate (pool shuffled earlier)
-    return candidates[0]
+    return next_adaptive_question(pool, answered, target_total=target_total, base_level=base_level)
+
+
+# ============================================================
+# COMPACT INTERVIEW SESSION STATE
+# ============================================================
+# While an interview runs the Django session only holds question ids,
+# the cursor and [question_id, score, answer_text] entries; question
+# bodies are resolved from the shared question index.
+
+def is_legacy_interview_state(session):
+    """True for an interview started before the session held only ids (it stored whole question dicts)."""
+    if isinstance(session.get('current_question'), dict):
+        return True
+    if any(isinstance(entry, dict) for entry in session.get('answered') or []):
+        return True
+    return any(isinstance(q, dict) for q in session.get('interview_questions') or [])
+
+
+def get_question(qid):
+    """Resolve a question id to its dict (with 'id'), or None if it is gone."""
+    q = get_question_index().get(qid)
+    return dict(q, id=qid) if q is not None else None
+
+
+def expand_answered(entries):
+    """Rebuild the answered list the adaptive selector expects.
+
+    Args:
+        entries (list): compact [question_id, score, answer_text] entries
+
+    Returns:
+        list[dict]: {'question_text','level','score'} per resolvable entry
+    """
+    answered = []
+    for qid, score, _ in entries:
+        q = get_question(qid)
+        if q is None:
+            continue
+        answered.append({
+            'question_text': q.get('question_text', ''),
+            'level': q.get('level', 'beginner'),
+            'score': score,
+        })
+    return answered
+
+
+def is_echo_answer(question_text, answer_text):
+    """True if the answer just repeats the question (ignoring case and punctuation)."""
+    norm_q = re.sub(r"\W+", "", (question_text or '').lower())
+    norm_a = re.sub(r"\W+", "", (answer_text or '').lower())
+    return bool(norm_q and norm_q == norm_a)
+
+
+def skill_category_map(resume):
+    """Map lowercased resume skills to their category (Resume.skill_categories)."""
+    skill_to_category = {}
+    if resume and isinstance(resume.skill_categories, dict) and resume.skill_categories:
+        for cat, skills_list in resume.skill_categories.items():
+            if isinstance(skills_list, list):
+                for skill in skills_list:
+                    skill_to_category[skill.lower().strip()] = cat
+    return skill_to_category
+
+
+def keyword_categories(keywords, skill_to_category):
+    """Category of each keyword that maps to a resume skill (one entry per keyword)."""
+    categories = []
+    for kw in (keywords or []):
+        if kw:
+            category = skill_to_category.get(kw.lower().strip())
+            if category is not None:
+                categories.append(category)
+    return categories
+
+
+def build_scored_answers(entries, skill_to_category=None, breakdowns=None):
+    """Build the InterviewSession.answers dict from compact session entries.
+
+    Everything the results page shows per answer is computed here, once,
+    when the interview is submitted: the composite breakdown, the echo flag
+    and the resume skill categories the question's keywords fall into.
+
+    Args:
+        entries (list): compact [question_id, score, answer_text] entries
+        skill_to_category (dict): skill_category_map() of the user's resume
+        breakdowns (list): composite breakdowns aligned with entries, if the
+            caller already has them (computed in one batch otherwise)
+
+    Returns:
+        dict: question_text -> {'answer','score','keywords','tokens','level',
+        'breakdown','echo_answer','categories'}
+    """
+    if skill_to_category is None:
+        skill_to_category = {}
+    resolved = []
+    for i, (qid, score, answer_text) in enumerate(entries):
+        q = get_question(qid)
+        if q is not None:
+            resolved.append((i, q, score, answer_text))
+    if breakdowns is None:
+        batch = composite_breakdown_many(
+            [answer_text for _, _, _, answer_text in resolved],
+            [{'keywords': q.get('keywords') or [], 'tokens': q.get('tokens') or None, 'id': q['id']}
+             for _, q, _, _ in resolved],
+        )
+    else:
+        batch = [breakdowns[i] for i, _, _, _ in resolved]
+
+    scored_answers = {}
+    for (_, q, score, answer_text), bd in zip(resolved, batch):
+        question_text = q.get('question_text', '')
+        keywords = q.get('keywords', [])
+        scored_answers[question_text] = {
+            'answer': answer_text,
+            'score': score,
+            'keywords': keywords,
+            'tokens': q.get('tokens', None),
+            'level': q.get('level', 'beginner'),
+            'breakdown': bd,
+            'echo_answer': is_echo_answer(question_text, answer_text),
+            'categories': keyword_categories(keywords, skill_to_category),
+        }
+    return scored_answers
 
 
 # ============================================================
 # FINAL SCORING FOR WHOLE INTERVIEW SESSION
 # ============================================================
 
-def calculate_interview_score(session_id):
+def calculate_interview_score(session_id, session_data=None):
     """
     Generate the final score + grade for an interview session.
 
     Args:
         session_id: Interview Session ID
+        session_data: already-fetched get_session_data() result (optional)
 
     Returns:
         dict: score, percentage, feedback
     """
 
-    session_data = get_session_data(session_id)
+    if session_data is None:
+        session_data = get_session_data(session_id)
 
     if not session_data:
         return None
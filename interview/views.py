@@ -1,77 +1,48 @@
 from django.shortcuts import render, redirect
+from django.urls import reverse
+from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from .models import Resume, Question, InterviewSession, Profile
-from .resume_parser import extract_text_from_resume, extract_skills, parse_resume_complete
-from .db_operations import insert_resume, get_questions_by_skills, save_answers, get_session_data
-from .utils import get_adaptive_questions, calculate_interview_score, score_single_answer
-from .utils import get_fixed_interview_questions
-from .answer_evaluation import keyword_match_score
+from .resume_parser import extract_text_from_resume, extract_skills
+from .db_operations import get_questions_by_skills, save_answers, get_session_data
+from .db_operations import range_cutoff, get_session_stats, get_session_series, get_session_page
+from .resume_jobs import submit_resume_job, get_resume_job, JOB_DONE, JOB_FAILED, JOB_PENDING, PENDING_NOTICE_SECONDS
+from .resume_store import store_upload
+from .rollups import get_user_rollup, average_score, sessions_since, recent_session_times, keyword_scores, category_scores
+from .utils import get_adaptive_questions, calculate_interview_score
+from .utils import build_adaptive_pool, get_question, expand_answered, build_scored_answers
+from .utils import get_fixed_interview_questions, skill_category_map, is_echo_answer, keyword_categories
+from .utils import is_legacy_interview_state
+from .answer_evaluation import keyword_match_score, composite_answer_score, composite_scores_and_breakdowns
 import random
 import json
+import time
 from django.utils import timezone
 
-# Helper to ensure a single Profile per user (merging duplicates)
-def get_single_profile(user):
-
-    try:
-        # first we try to get user profile from db
-        profile = Profile.objects.filter(user=user).first()
-        if profile:
-            return profile
-    except Exception as e:
-        print(f"DEBUG: Error getting profile: {e}")
-    
-    # Create new if none exists
-    try:
-        profile = Profile.objects.create(
-            user=user,
-            unique_user_id=f"U{user.id}",
-            name=user.username,
-            email=user.email or "",
-        )
-        return profile
-    except Exception as e:
-        print(f"DEBUG: Error creating profile: {e}")
-        # Last resort - return any existing profile
-        return Profile.objects.filter(user=user).first()
-
 # NOTE: Views updated to use new models and utilities
 # Includes integration with answerflagging.py and mongo_conn.py
 
 @login_required(login_url='/login/')
 def upload_resume(request):
-    profile = get_single_profile(request.user)
+    profile = request.nexora.profile
     if request.method == 'POST':
         resume_file = request.FILES.get('resume')
         if not resume_file:
             return render(request, 'interview/upload_resume_new.html', {'error': 'No file selected.'})
         try:
-            import os
-            from django.conf import settings
-            temp_path = os.path.join(settings.MEDIA_ROOT, 'resumes', resume_file.name)
-            os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-            with open(temp_path, 'wb+') as destination:
-                for chunk in resume_file.chunks():
-                    destination.write(chunk)
-            parsed = parse_resume_complete(temp_path)
-            if parsed.get('error'):
-                return render(request, 'interview/upload_resume_new.html', {'error': parsed['error']})
-            resume_data = {
-                'username': request.user.username,
-                'email': parsed.get('contact_info', {}).get('email') or request.user.email or '',
-                'phone': parsed.get('contact_info', {}).get('phone') or '',
-                'skills': parsed.get('skills', []),
-                'skill_categories': parsed.get('skill_categories', {}),
-                'experience': parsed.get('text', '')[:2000],
-                'education': '\n'.join(parsed.get('education', {}).get('degrees', [])),
-            }
-            result = insert_resume(resume_data)
-            if result.get('message'):
-                messages.success(request, result['message'])
-            else:
-                messages.success(request, f"Resume uploaded successfully! Extracted {len(resume_data['skills'])} skills.")
-            return redirect('interview_dashboard')
+            # Stored under its content hash; a file parsed before comes back from the parse cache
+            stored = store_upload(resume_file)
+            job = submit_resume_job(request.user.username, request.user.email, stored['path'],
+                                    content_hash=stored['content_hash'])
+            # A new resume is (or soon will be) the latest one
+            request.nexora.invalidate(profile=False)
+            if job['status'] == JOB_FAILED:
+                return render(request, 'interview/upload_resume_new.html', {'error': job['error']})
+            if job['status'] == JOB_DONE:
+                messages.success(request, job['message'])
+                return redirect('interview_dashboard')
+            # Parsing continues in the background; the page polls resume_job_status
+            return render(request, 'interview/upload_resume_new.html', {'job_id': job['id']})
         except Exception as e:
             print(f"Could not parse resume or skills: {e}")
             import traceback
@@ -80,232 +51,214 @@ def upload_resume(request):
     return render(request, 'interview/upload_resume_new.html')
 
 
+@login_required(login_url='/login/')
+def resume_job_status(request, job_id):
+    """JSON status of a queued resume parse: pending, running, done or failed."""
+    job = get_resume_job(job_id)
+    if not job or job.get('username') != request.user.username:
+        return JsonResponse({'status': 'unknown', 'error': 'Job not found.'}, status=404)
+    if job['status'] == JOB_DONE:
+        # The resume may have been saved by a worker process this cache never heard from
+        request.nexora.invalidate(profile=False)
+    message = job.get('message', '')
+    if job['status'] == JOB_PENDING and time.time() - job.get('created_at', 0) > PENDING_NOTICE_SECONDS:
+        message = ("Your resume is still waiting to be analyzed. If this does not change, no resume "
+                   "worker is running: ask the site administrator to start `manage.py process_resume_jobs`.")
+    return JsonResponse({
+        'job_id': job['id'],
+        'status': job['status'],
+        'message': message,
+        'error': job.get('error', ''),
+    })
+
+
 @login_required(login_url='/login/')
 def dashboard(request):
     try:
-        profile = get_single_profile(request.user)
+        profile = request.nexora.profile
         
         # Get the latest resume
-        latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
+        latest_resume = request.nexora.latest_resume
         
-        # Get all interview sessions for this user (newest first)
-        sessions = InterviewSession.objects.filter(username=request.user.username).order_by('-created_at')
+        # Per-user analytics rollup (kept up to date as sessions are saved)
+        rollup = get_user_rollup(request.user.username)
         
-        # Calculate statistics
-        total_interviews = sessions.count()
-        avg_score = 0
-        technical_accuracy = 0
+        context = _dashboard_context(profile, latest_resume, rollup)
+        return render(request, 'interview/dashboard_new.html', context)
+    except Exception:
+        return redirect('upload_resume')
+
+
+def _dashboard_context(profile, latest_resume, rollup):
+    """Dashboard template context (no database access; shared with async_views)."""
+    # Calculate statistics
+    total_interviews = rollup.session_count
+    avg_score = 0
+    technical_accuracy = 0
+    
+    insights = []
+    chart_labels = []
+    chart_scores = []
+    if total_interviews > 0:
+        # Calculate average score across all sessions
+        avg_score = average_score(rollup) * 100
         
-        insights = []
-        chart_labels = []
-        chart_scores = []
-        if total_interviews > 0:
-            # Calculate average score across all sessions
-            total_score_sum = sum(session.score for session in sessions)
-            avg_score = (total_score_sum / total_interviews) * 100
+        # Recent sessions for insights (recent 3 vs overall)
+        recent_sessions = rollup.recent_sessions[:3]
+        if recent_sessions:
+            recent_avg = sum(s['score'] for s in recent_sessions) / len(recent_sessions)
+            overall_avg = average_score(rollup)
+            # Insight 1: Improvement trend
+            if recent_avg > overall_avg + 0.03:  # >3 pts improvement
+                insights.append({
+                    'icon': 'emoji-smile',
+                    'tone': 'success',
+                    'text': "You're improving in technical clarity. Focus next on communication skills."
+                })
+            elif recent_avg < overall_avg - 0.05:
+                insights.append({
+                    'icon': 'exclamation-triangle',
+                    'tone': 'warning',
+                    'text': "Recent performance dipped a bit. Revisit fundamentals and pace your answers."
+                })
             
-            # Recent sessions for insights (recent 3 vs overall)
-            recent_sessions = list(sessions[:3])
-            if recent_sessions:
-                recent_avg = sum(s.score for s in recent_sessions) / len(recent_sessions)
-                overall_avg = (total_score_sum / total_interviews)
-                # Insight 1: Improvement trend
-                if recent_avg > overall_avg + 0.03:  # >3 pts improvement
+            # Insight 2: Structure vs metrics based on per-question score bands
+            n = sum(s['answer_count'] for s in recent_sessions)
+            if n:
+                high = sum(s['bands'][0] for s in recent_sessions) / n
+                mid = sum(s['bands'][1] for s in recent_sessions) / n
+                low = sum(s['bands'][2] for s in recent_sessions) / n
+                if high >= 0.4 and mid >= 0.25:
                     insights.append({
-                        'icon': 'emoji-smile',
+                        'icon': 'hand-thumbs-up',
                         'tone': 'success',
-                        'text': "You're improving in technical clarity. Focus next on communication skills."
+                        'text': "Great structure in STAR responses. Add metric-driven outcomes."
                     })
-                elif recent_avg < overall_avg - 0.05:
+                elif low >= 0.4:
                     insights.append({
-                        'icon': 'exclamation-triangle',
+                        'icon': 'lightbulb',
                         'tone': 'warning',
-                        'text': "Recent performance dipped a bit. Revisit fundamentals and pace your answers."
+                        'text': "Focus on core keywords in answers. Mention definitions and key trade-offs."
                     })
-                
-                # Insight 2: Structure vs metrics based on per-question scores
-                per_q_scores = []
-                for s in recent_sessions:
-                    if isinstance(s.answers, dict):
-                        for v in s.answers.values():
-                            try:
-                                per_q_scores.append(float(v.get('score', 0)))
-                            except Exception:
-                                continue
-                if per_q_scores:
-                    n = len(per_q_scores)
-                    high = sum(1 for x in per_q_scores if x >= 0.75) / n
-                    mid = sum(1 for x in per_q_scores if 0.4 <= x < 0.75) / n
-                    low = sum(1 for x in per_q_scores if x < 0.4) / n
-                    if high >= 0.4 and mid >= 0.25:
-                        insights.append({
-                            'icon': 'hand-thumbs-up',
-                            'tone': 'success',
-                            'text': "Great structure in STAR responses. Add metric-driven outcomes."
-                        })
-                    elif low >= 0.4:
-                        insights.append({
-                            'icon': 'lightbulb',
-                            'tone': 'warning',
-                            'text': "Focus on core keywords in answers. Mention definitions and key trade-offs."
-                        })
-        
-        # Technical accuracy: average keyword match across all individual answers
-        # More granular than session averages - reflects actual technical correctness
-        all_answer_scores = []
-        for session in sessions:
-            if isinstance(session.answers, dict):
-                for answer_meta in session.answers.values():
-                    try:
-                        score = float(answer_meta.get('score', 0))
-                        all_answer_scores.append(score)
-                    except Exception:
-                        continue
-        
-        technical_accuracy = (sum(all_answer_scores) / len(all_answer_scores)) * 100 if all_answer_scores else 0
-
-        if total_interviews > 0:
-            # Build improvement-over-time arrays from last 8 sessions (chronological)
-            last8 = list(sessions[:8])
-            for s in reversed(last8):
-                try:
-                    chart_labels.append(s.created_at.strftime('%d %b'))
-                except Exception:
-                    chart_labels.append('')
-                chart_scores.append(round(s.score * 100, 1))
+    
+    # Technical accuracy: average keyword match across all individual answers
+    # More granular than session averages - reflects actual technical correctness
+    technical_accuracy = (rollup.answer_score_sum / rollup.answer_count) * 100 if rollup.answer_count else 0
+
+    if total_interviews > 0:
+        # Build improvement-over-time arrays from last 8 sessions (chronological)
+        for created_at, s in reversed(recent_session_times(rollup, 8)):
+            chart_labels.append(created_at.strftime('%d %b'))
+            chart_scores.append(round(s['score'] * 100, 1))
+    
+    # Extract experience years from resume
+    experience_years = "N/A"
+    if latest_resume:
+        from .resume_parser import extract_experience_years
+        exp_data = extract_experience_years(latest_resume.experience or "")
+        if exp_data.get('total_years', 0) > 0:
+            experience_years = f"{exp_data['total_years']} yrs"
+    
+    # Extract education from resume
+    education_level = "N/A"
+    if latest_resume and latest_resume.education:
+        # Parse first degree mentioned
+        education_level = latest_resume.education.split('\n')[0] if latest_resume.education else "N/A"
+
+    # Build radar data: proficiency per skill category (based on interview performance)
+    radar_labels = []
+    radar_values = []
+    if latest_resume and isinstance(latest_resume.skill_categories, dict) and latest_resume.skill_categories:
+        # Build a map of skill -> category
+        skill_to_category = {}
+        for cat, skills_list in latest_resume.skill_categories.items():
+            if isinstance(skills_list, list):
+                for skill in skills_list:
+                    skill_to_category[skill.lower().strip()] = cat
         
-        # Extract experience years from resume
-        experience_years = "N/A"
-        if latest_resume:
-            from .resume_parser import extract_experience_years
-            exp_data = extract_experience_years(latest_resume.experience or "")
-            if exp_data.get('total_years', 0) > 0:
-                experience_years = f"{exp_data['total_years']} yrs"
+        # Aggregate scores by category from recent sessions (last 10)
+        category_totals = category_scores(rollup, skill_to_category, limit=10)
         
-        # Extract education from resume
-        education_level = "N/A"
-        if latest_resume and latest_resume.education:
-            # Parse first degree mentioned
-            education_level = latest_resume.education.split('\n')[0] if latest_resume.education else "N/A"
-
-        # Build radar data: proficiency per skill category (based on interview performance)
-        radar_labels = []
-        radar_values = []
-        if latest_resume and isinstance(latest_resume.skill_categories, dict) and latest_resume.skill_categories:
-            # Build a map of skill -> category
-            skill_to_category = {}
-            for cat, skills_list in latest_resume.skill_categories.items():
-                if isinstance(skills_list, list):
-                    for skill in skills_list:
-                        skill_to_category[skill.lower().strip()] = cat
-            
-            # Aggregate scores by category from recent sessions
-            from collections import defaultdict
-            category_scores = defaultdict(list)
-            for session in sessions[:10]:  # Last 10 sessions
-                if not isinstance(session.answers, dict):
-                    continue
-                for answer_meta in session.answers.values():
-                    try:
-                        score = float(answer_meta.get('score', 0))
-                    except Exception:
-                        score = 0.0
-                    keywords = answer_meta.get('keywords', [])
-                    if keywords:
-                        for kw in keywords:
-                            kw_clean = kw.lower().strip()
-                            if kw_clean in skill_to_category:
-                                category_scores[skill_to_category[kw_clean]].append(score)
-            
-            # Calculate average proficiency per category
-            category_proficiency = []
-            for cat, scores in category_scores.items():
-                avg = (sum(scores) / len(scores)) * 100 if scores else 0
-                category_proficiency.append((cat, round(avg, 1), len(scores)))
-            
-            # Only show categories when we have interview-based scores
-            if category_proficiency:
-                # Sort by proficiency and pick top 6
-                category_proficiency.sort(key=lambda x: x[1], reverse=True)
-                top = category_proficiency[:6]
-                radar_labels = [c for c, _, _ in top]
-                radar_values = [v for _, v, _ in top]
-                # Clamp values defensively to 0–100
-                try:
-                    radar_values = [max(0, min(100, float(v))) for v in radar_values]
-                except Exception:
-                    radar_values = [0 for _ in radar_values]
-
-        chart_payload = {
-            'labels': chart_labels,
-            'scores': chart_scores,
-            'radar_labels': radar_labels,
-            'radar_values': radar_values,
-        }
+        # Calculate average proficiency per category
+        category_proficiency = []
+        for cat, (score_sum, count) in category_totals.items():
+            avg = (score_sum / count) * 100 if count else 0
+            category_proficiency.append((cat, round(avg, 1), count))
         
-        context = {
-            'profile': profile,
-            'resume': latest_resume,
-            'skills': latest_resume.skills if latest_resume else [],
-            'skill_categories': latest_resume.skill_categories if latest_resume else {},
-            'stats': {
-                'total_interviews': total_interviews,
-                'avg_score': round(avg_score, 1),
-                'avg_feedback_score': round((avg_score / 100) * 5, 1),  # Convert 0-100% to 0-5 scale
-                'technical_accuracy': round(technical_accuracy, 0),
-                'experience_years': experience_years,
-                'education_level': education_level,
-                'questions_per_interview': 9,
-            },
-            'insights': insights,
-            'chart_json': json.dumps(chart_payload)
-        }
-        return render(request, 'interview/dashboard_new.html', context)
-    except Exception:
-        return redirect('upload_resume')
+        # Only show categories when we have interview-based scores
+        if category_proficiency:
+            # Sort by proficiency and pick top 6
+            category_proficiency.sort(key=lambda x: x[1], reverse=True)
+            top = category_proficiency[:6]
+            radar_labels = [c for c, _, _ in top]
+            radar_values = [v for _, v, _ in top]
+            # Clamp values defensively to 0–100
+            try:
+                radar_values = [max(0, min(100, float(v))) for v in radar_values]
+            except Exception:
+                radar_values = [0 for _ in radar_values]
+
+    chart_payload = {
+        'labels': chart_labels,
+        'scores': chart_scores,
+        'radar_labels': radar_labels,
+        'radar_values': radar_values,
+    }
+    
+    context = {
+        'profile': profile,
+        'resume': latest_resume,
+        'skills': latest_resume.skills if latest_resume else [],
+        'skill_categories': latest_resume.skill_categories if latest_resume else {},
+        'stats': {
+            'total_interviews': total_interviews,
+            'avg_score': round(avg_score, 1),
+            'avg_feedback_score': round((avg_score / 100) * 5, 1),  # Convert 0-100% to 0-5 scale
+            'technical_accuracy': round(technical_accuracy, 0),
+            'experience_years': experience_years,
+            'education_level': education_level,
+            'questions_per_interview': 9,
+        },
+        'insights': insights,
+        'chart_json': json.dumps(chart_payload)
+    }
+    return context
 
 
 @login_required(login_url='/login/')
 def reports_view(request):
     """View for reports page showing interview analytics with range filter."""
-    from .models import InterviewSession, Resume
     from .resume_parser import extract_experience_years
     
-    # Get all interview sessions for the user
-    sessions = InterviewSession.objects.filter(username=request.user.username).order_by('-created_at')
-    total_interviews = len(sessions)
+    range_param = request.GET.get('range', 'all')
+    cutoff = range_cutoff(range_param)
+
+    # Per-user analytics rollup (kept up to date as sessions are saved)
+    rollup = get_user_rollup(request.user.username)
+    if cutoff is None:
+        total_interviews = rollup.session_count
+    else:
+        # Ranged figures are aggregated in MongoDB
+        range_stats = get_session_stats(request.user.username, since=cutoff)
+        total_interviews = range_stats['total_interviews']
     
     # Calculate statistics
     if total_interviews > 0:
-        # Average score
-        total_score_sum = sum(session.score for session in sessions)
-        avg_score = (total_score_sum / total_interviews) * 100
-        
-        # Pass rate (sessions with score >= 0.7)
-        passing_sessions = [s for s in sessions if s.score >= 0.7]
-        pass_rate = (len(passing_sessions) / total_interviews) * 100
+        # Average score and pass rate (sessions with score >= 0.7)
+        if cutoff is None:
+            avg_score = average_score(rollup) * 100
+            pass_rate = (rollup.pass_count / total_interviews) * 100
+        else:
+            avg_score = range_stats['avg_score']
+            pass_rate = range_stats['pass_rate']
         
         # Calculate total practice time (estimate: 2 minutes per question)
         total_questions = total_interviews * 9  # 9 questions per interview
         total_minutes = total_questions * 2
         total_hours = total_minutes / 60
         
-        # Monthly comparison (timezone-aware)
-        from datetime import timedelta
-        last_month = timezone.now() - timedelta(days=30)
-        recent_sessions = []
-        for s in sessions:
-            created = s.created_at
-            # Ensure aware datetime for comparison
-            if timezone.is_naive(created):
-                try:
-                    created = timezone.make_aware(created, timezone.get_current_timezone())
-                except Exception:
-                    # If making aware fails, skip comparison for this item
-                    continue
-            if created >= last_month:
-                recent_sessions.append(s)
-        monthly_change = (len(recent_sessions) / total_interviews) * 100 if total_interviews > 0 else 0
+        # Monthly comparison (sessions in the last 30 days)
+        monthly_change = (sessions_since(rollup, 30) / rollup.session_count) * 100 if rollup.session_count else 0
     else:
         avg_score = 0
         pass_rate = 0
@@ -314,32 +267,33 @@ def reports_view(request):
     
     # Get recent sessions for activity
     recent_sessions_data = []
-    for session in sessions[:5]:  # Last 5 sessions
+    for created_at, session in recent_session_times(rollup, 5):  # Last 5 sessions
         recent_sessions_data.append({
-            'created_at': session.created_at,
-            'score': round(session.score * 100, 0),
-            'skills': ', '.join(session.skills[:3]) if session.skills else 'General',
-            'level': session.current_level,
+            'created_at': created_at,
+            'score': round(session['score'] * 100, 0),
+            'skills': ', '.join(session['skills'][:3]) if session['skills'] else 'General',
+            'level': session['level'],
         })
 
     # Build chart data for performance breakdown (last 12 sessions)
     chart_labels = []
     chart_scores = []
-    last12 = list(sessions[:12])
-    for s in reversed(last12):  # chronological
+    if cutoff is None:
+        last12 = [(created_at, s['score']) for created_at, s in recent_session_times(rollup, 12)]
+    else:
+        last12 = [(s['created_at'], s['score']) for s in get_session_series(request.user.username, since=cutoff, limit=12)]
+    for created_at, score in reversed(last12):  # chronological
         try:
-            chart_labels.append(s.created_at.strftime('%d %b'))
+            chart_labels.append(created_at.strftime('%d %b'))
         except Exception:
             chart_labels.append('')
-        chart_scores.append(round(s.score * 100, 1))
+        chart_scores.append(round(score * 100, 1))
 
     # Compute strengths and weaknesses from recent answers (last 10 sessions)
-    from collections import defaultdict
-    
     # Build skill -> category mapping from resume
     skill_to_category = {}
     try:
-        latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
+        latest_resume = request.nexora.latest_resume
         if latest_resume and isinstance(latest_resume.skill_categories, dict) and latest_resume.skill_categories:
             for cat, skills_list in latest_resume.skill_categories.items():
                 if isinstance(skills_list, list):
@@ -349,34 +303,16 @@ def reports_view(request):
         print(f"Error loading skill categories for reports: {e}")
     
     # Aggregate scores by category instead of individual keywords
-    category_scores = defaultdict(list)
-    kw_scores = defaultdict(list)  # Keep for fallback
-    
-    for s in sessions[:10]:
-        answers = s.answers if isinstance(s.answers, dict) else {}
-        for meta in answers.values():
-            try:
-                sc = float(meta.get('score', 0))
-            except Exception:
-                sc = 0.0
-            kws = meta.get('keywords', []) or []
-            for kw in kws:
-                if isinstance(kw, str) and kw.strip():
-                    kw_clean = kw.strip().lower()
-                    kw_scores[kw.strip()].append(sc)
-                    
-                    # Map to category if available
-                    if kw_clean in skill_to_category:
-                        category = skill_to_category[kw_clean]
-                        category_scores[category].append(sc)
+    category_totals = category_scores(rollup, skill_to_category, limit=10)
+    kw_totals = keyword_scores(rollup, limit=10)  # Keep for fallback
 
     strengths = []
     weaknesses = []
     
     # Use categories if available, otherwise fall back to keywords
-    if category_scores:
+    if category_totals:
         # Average per category
-        avgs = [(k, sum(v)/len(v) if v else 0.0, len(v)) for k, v in category_scores.items()]
+        avgs = [(k, sc / n if n else 0.0, n) for k, (sc, n) in category_totals.items()]
         # Strengths: avg >= 0.75 with at least 2 samples
         strong = [(k, a) for k, a, n in avgs if a >= 0.75 and n >= 2]
         strong.sort(key=lambda x: x[1], reverse=True)
@@ -385,9 +321,9 @@ def reports_view(request):
         weak = [(k, a) for k, a, n in avgs if a <= 0.5 and n >= 1]
         weak.sort(key=lambda x: x[1])
         weaknesses = [{'label': k, 'accuracy': round(a*100)} for k, a in weak[:3]]
-    elif kw_scores:
+    elif kw_totals:
         # Fallback to keywords if no categories available
-        avgs = [(k, sum(v)/len(v) if v else 0.0, len(v)) for k, v in kw_scores.items()]
+        avgs = [(k, sc / n if n else 0.0, n) for k, (sc, n) in kw_totals.items()]
         strong = [(k, a) for k, a, n in avgs if a >= 0.75 and n >= 2]
         strong.sort(key=lambda x: x[1], reverse=True)
         strengths = [{'label': k, 'accuracy': round(a*100)} for k, a in strong[:3]]
@@ -408,7 +344,7 @@ def reports_view(request):
     }
     
     import json
-    return render(request, 'interview/reports.html', {'stats': stats, 'chart_json': json.dumps(stats['chart'])})
+    return render(request, 'interview/reports.html', {'stats': stats, 'chart_json': json.dumps(stats['chart']), 'range_param': range_param})
 
 
 from django.template.loader import get_template
@@ -419,27 +355,13 @@ def reports_pdf_view(request):
     request.GET = request.GET.copy()  # ensure mutable
     # Build same context as reports_view without rendering template twice
     range_param = request.GET.get('range', 'all')
-    # Quick reuse: invoke reports_view logic by calling function components
-    # For simplicity, call reports_view and extract its context dict from response (not ideal).
-    # Instead, duplicate minimal data fetch (could refactor later).
-    all_sessions = InterviewSession.objects.filter(username=request.user.username).order_by('-created_at')
-    from datetime import timedelta
-    if range_param == '7':
-        cutoff = timezone.now() - timedelta(days=7)
-        sessions = [s for s in all_sessions if s.created_at >= cutoff]
-    elif range_param == '30':
-        cutoff = timezone.now() - timedelta(days=30)
-        sessions = [s for s in all_sessions if s.created_at >= cutoff]
-    else:
-        sessions = list(all_sessions)
-    total_interviews = len(sessions)
-    if total_interviews:
-        avg_score = (sum(s.score for s in sessions) / total_interviews) * 100
-        passing_sessions = [s for s in sessions if s.score >= 0.7]
-        pass_rate = (len(passing_sessions) / total_interviews) * 100
-    else:
-        avg_score = 0
-        pass_rate = 0
+    # Count, average and pass rate are aggregated in MongoDB; rows skip the answers field
+    cutoff = range_cutoff(range_param)
+    range_stats = get_session_stats(request.user.username, since=cutoff)
+    sessions = get_session_series(request.user.username, since=cutoff)
+    total_interviews = range_stats['total_interviews']
+    avg_score = range_stats['avg_score']
+    pass_rate = range_stats['pass_rate']
     template = get_template('interview/report_pdf.html')
     context = {
         'generated_at': timezone.now(),
@@ -470,7 +392,7 @@ def help_view(request):
 
 @login_required(login_url='/login/')
 def settings_view(request):
-    profile = get_single_profile(request.user)
+    profile = request.nexora.profile
     
     # Debug: Check what profile we're working with
     print(f"DEBUG: Profile pk={profile.pk}, type={type(profile.pk)}, name={profile.name}, email={profile.email}, phone={profile.phone}")
@@ -500,8 +422,9 @@ def settings_view(request):
             profile.current_level = new_level
         
         try:
-            # Save directly - let djongo handle it
-            profile.save()
+            # Only the form's fields: the profile may come from the request.nexora cache
+            profile.save(update_fields=['name', 'email', 'phone', 'linkedin_url', 'current_level'])
+            request.nexora.invalidate(latest_resume=False)
             print(f"DEBUG: Profile saved successfully")
             messages.success(request, 'Settings saved successfully.')
         except Exception as e:
@@ -558,32 +481,50 @@ def feedback_view(request):
     return render(request, 'interview/feedback.html')
 
 
+def _parse_page_cursor(value):
+    """Parse a '<created_at>|<id>' keyset cursor from the query string (None if absent or invalid)."""
+    if not value:
+        return None
+    try:
+        from datetime import datetime
+        created_at, pk = value.rsplit('|', 1)
+        cursor = datetime.fromisoformat(created_at)
+        pk = int(pk)
+    except ValueError:
+        return None
+    if timezone.is_naive(cursor):
+        cursor = timezone.make_aware(cursor, timezone.get_current_timezone())
+    return cursor, pk
+
+
+def _page_cursor(key):
+    return f"{key[0].isoformat()}|{key[1]}" if key else ''
+
+
 @login_required(login_url='/login/')
 def profile_view(request):
     """View for user profile page."""
-    from .models import InterviewSession, Resume, Profile
     from .resume_parser import extract_experience_years
     
     # Get user profile
     try:
-        profile = get_single_profile(request.user)
+        profile = request.nexora.profile
     except Exception:
         profile = None
     
     # Get latest resume
     try:
-        latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
-    except Resume.DoesNotExist:
+        latest_resume = request.nexora.latest_resume
+    except Exception:
         latest_resume = None
     
-    # Get interview sessions
-    sessions = InterviewSession.objects.filter(username=request.user.username).order_by('-created_at')
-    total_interviews = sessions.count()
+    # Interview totals from the per-user analytics rollup
+    rollup = get_user_rollup(request.user.username)
+    total_interviews = rollup.session_count
     
     # Calculate statistics
     if total_interviews > 0:
-        total_score_sum = sum(session.score for session in sessions)
-        avg_score = (total_score_sum / total_interviews) * 100
+        avg_score = average_score(rollup) * 100
         
         # Calculate total practice time
         total_questions = total_interviews * 9
@@ -602,9 +543,15 @@ def profile_view(request):
     except ValueError:
         page = 1
 
-    # Build full activity list
-    full_activity = []
+    # Fetch only the requested page: keyset cursors from the Prev/Next links,
+    # falling back to an offset for a bare ?page=N
     from datetime import datetime
+    after = _parse_page_cursor(request.GET.get('after'))
+    before = _parse_page_cursor(request.GET.get('before'))
+    page_data = get_session_page(request.user.username, page_size,
+                                 offset=(page - 1) * page_size, after=after, before=before)
+    sessions = page_data['rows']
+    recent_activity = []
     for session in sessions:
         activity_type = 'Completed Interview'
         activity_detail = f"Score: {round(session.score * 100, 0)}% • 9 questions"
@@ -626,7 +573,7 @@ def profile_view(request):
             icon = 'lightning-fill'
         else:
             icon = 'exclamation-triangle-fill'
-        full_activity.append({
+        recent_activity.append({
             'type': activity_type,
             'detail': activity_detail,
             'time_ago': time_ago,
@@ -635,13 +582,15 @@ def profile_view(request):
             'icon': icon,
         })
 
-    total_items = len(full_activity)
+    total_items = total_interviews
     total_pages = (total_items // page_size) + (1 if total_items % page_size else 0)
-    start = (page - 1) * page_size
-    end = start + page_size
-    recent_activity = full_activity[start:end]
-    has_prev = page > 1
-    has_next = page < total_pages
+    if before is not None:
+        # Came back from an older page, so there is always a next one
+        has_prev = page > 1 and page_data['has_more']
+        has_next = bool(sessions)
+    else:
+        has_prev = page > 1
+        has_next = page_data['has_more']
     
     stats = {
         'total_interviews': total_interviews,
@@ -654,6 +603,8 @@ def profile_view(request):
         'total_pages': total_pages,
         'has_prev': has_prev,
         'has_next': has_next,
+        'prev_cursor': _page_cursor(page_data['first_key']),
+        'next_cursor': _page_cursor(page_data['last_key']),
     }
     
     return render(request, 'interview/profile.html', {'stats': stats, 'resume': latest_resume})
@@ -662,8 +613,8 @@ def profile_view(request):
 @login_required(login_url='/login/')
 def start_interview_view(request):
     """Start interview with fixed 3-per-level distribution (previous criteria)."""
-    profile = get_single_profile(request.user)
-    latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
+    profile = request.nexora.profile
+    latest_resume = request.nexora.latest_resume
 
     if not latest_resume:
         return redirect('upload_resume')
@@ -675,24 +626,25 @@ def start_interview_view(request):
     if (request.GET.get('mode') or '').lower() != 'fixed':
         target_total = 9
         answered = []
-        # Get first adaptive question
+        # Build the candidate pool once for the whole interview, then take the first question
         try:
-            next_q = get_adaptive_questions(skills, answered, target_total=target_total, base_level=current_level)
+            pool = build_adaptive_pool(skills, per_level=target_total * 2)
+            next_q = get_adaptive_questions(skills, answered, target_total=target_total, base_level=current_level, pool=pool)
         except Exception:
             next_q = None
         if not next_q:
             messages.error(request, 'No questions available for adaptive mode. Please try fixed mode.')
             return redirect('interview_dashboard')
 
-        # Initialize adaptive interview session state
+        # Initialize adaptive interview session state (ids only, bodies come from the question index)
         request.session['interview_mode'] = 'adaptive'
         request.session['skills'] = skills
         request.session['interview_level'] = current_level
         request.session['target_total'] = target_total
         request.session['answered'] = answered
-        request.session['current_question'] = next_q
+        request.session['question_pool'] = pool
+        request.session['current_question'] = next_q['id']
         request.session['current_question_index'] = 0
-        request.session['scored_answers'] = {}
         # Show instructions screen before first question
         request.session['instructions_pending'] = True
         return redirect('interview_instructions')
@@ -705,7 +657,8 @@ def start_interview_view(request):
             'error': 'No questions available. Please contact administrator.'
         })
 
-    request.session['interview_questions'] = questions
+    request.session['interview_mode'] = 'fixed'
+    request.session['interview_questions'] = [q['id'] for q in questions]
     request.session['current_question_index'] = 0
     request.session['user_answers'] = {}
     request.session['interview_level'] = current_level
@@ -740,222 +693,356 @@ def interview_instructions_view(request):
 
 @login_required(login_url='/login/')
 def interview_question_view(request):
-    # Ensure instructions have been acknowledged for a new session
-    if request.session.get('instructions_pending'):
-        return redirect('interview_instructions')
-
-    mode = request.session.get('interview_mode', 'fixed')
+    response = _interview_gate(request)
+    if response is not None:
+        return response
 
     # Adaptive mode branch
-    if mode == 'adaptive':
-        skills = request.session.get('skills', [])
-        base_level = request.session.get('interview_level', 'beginner')
-        target_total = int(request.session.get('target_total', 9))
-        answered = request.session.get('answered', [])
-        current_q = request.session.get('current_question')
-
-        # If no current question (e.g., direct navigation), fetch one
-        if not current_q:
-            current_q = get_adaptive_questions(skills, answered, target_total=target_total, base_level=base_level)
-            if not current_q:
-                return redirect('interview_dashboard')
-            request.session['current_question'] = current_q
+    if request.session.get('interview_mode', 'fixed') == 'adaptive':
+        state = _load_adaptive_interview(request)
+        if state is None:
+            return redirect('interview_dashboard')
 
         # Handle submission
         if request.method == 'POST':
             answer_text = request.POST.get('answer', '')
-            expected_keywords = current_q.get('keywords', [])
-            pre_tokenized = current_q.get('tokens', None)  # Use pre-tokenized if available
-            level = current_q.get('level', 'beginner')
             try:
-                score = score_single_answer(answer_text, expected_keywords, pre_tokenized=pre_tokenized, level=level)
+                score = composite_answer_score(answer_text, **_scoring_kwargs(state['current_q']))
             except Exception:
                 score = 0.0
-
-            # Update answered list and scored answers map
-            answered.append({
-                'question_text': current_q.get('question_text',''),
-                'level': current_q.get('level','beginner'),
-                'score': round(score, 2),
-            })
-            request.session['answered'] = answered
-
-            scored_answers = request.session.get('scored_answers', {})
-            q_text = current_q.get('question_text','')
-            scored_answers[q_text] = {
-                'answer': answer_text,
-                'score': round(score, 2),
-                'keywords': expected_keywords,
-                'tokens': pre_tokenized,  # Store tokens for breakdown later
-                'level': current_q.get('level','beginner')
-            }
-            request.session['scored_answers'] = scored_answers
-
-            # Progress index
-            request.session['current_question_index'] = len(answered)
-
-            # Check completion
-            if len(answered) >= target_total:
-                latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
-                profile = get_single_profile(request.user)
-
-                total_score = sum(a.get('score', 0) for a in answered)
-                avg_score = total_score / len(answered) if answered else 0
-
-                from .utils import evaluate_interview_answers
-                user_answers_for_eval = {qt: meta['answer'] for qt, meta in scored_answers.items()}
-                try:
-                    eval_results = evaluate_interview_answers(
-                        user_id=profile.unique_user_id,
-                        field='general',
-                        current_level=base_level,
-                        user_answers=user_answers_for_eval
-                    )
-                except Exception as e:
-                    print(f"Evaluation error: {e}")
-                    eval_results = None
-
-                from .models import InterviewSession as InterviewSessionModel
-                from django.utils.crypto import get_random_string
-                session_id = get_random_string(12)
-                interview_session = InterviewSessionModel(
-                    session_id=session_id,
-                    username=request.user.username,
-                    skills=latest_resume.skills if latest_resume else [],
-                    answers=scored_answers,
-                    score=round(avg_score, 2),
-                    current_level=base_level,
-                    recommended_next_level=eval_results['recommended_next_level'] if eval_results else base_level,
-                    evaluation_flag=eval_results['overall_flag'] if eval_results else 'Same',
-                    flag_records=eval_results['flag_record'] if eval_results else {}
-                )
-                interview_session.save()
-
-                if eval_results and eval_results['recommended_next_level'] != base_level:
-                    profile.current_level = eval_results['recommended_next_level']
-                    profile.save()
-
-                messages.success(request, f"Interview completed! Your score: {round(avg_score*100,1)}%")
-
-                # Clear session keys
-                for key in ['interview_mode','skills','target_total','answered','current_question','current_question_index','scored_answers','interview_level']:
-                    if key in request.session:
-                        del request.session[key]
-                return redirect('interview_results', session_id=session_id)
-
-            # Fetch next question
-            next_q = get_adaptive_questions(skills, answered, target_total=target_total, base_level=base_level)
-            request.session['current_question'] = next_q
+            if _record_adaptive_answer(request, state, answer_text, score):
+                return _complete_adaptive_interview(request, state['skills'], state['base_level'],
+                                                    state['answered_entries'])
+            _next_adaptive_question(request, state)
             return redirect('interview_question')
 
-        # GET render for adaptive
-        q_text = current_q.get('question_text','')
-        q_level = current_q.get('level','beginner')
-        question_number = len(answered) + 1
-        context = {
-            'question': {'text': q_text},
-            'question_number': question_number,
-            'total_questions': target_total,
-            'current_level': q_level,
-            'interview_mode': 'adaptive',
-        }
-        return render(request, 'interview/question_page.html', context)
+        return render(request, 'interview/question_page.html', _adaptive_question_context(state))
 
     # Fixed mode (legacy path)
-    questions = request.session.get('interview_questions', [])
-    current_index = request.session.get('current_question_index', 0)
-    user_answers = request.session.get('user_answers', {})
-    interview_level = request.session.get('interview_level', 'beginner')
-
-    if not questions or current_index >= len(questions):
+    state = _load_fixed_interview(request)
+    if state is None:
         return redirect('interview_dashboard')
 
     if request.method == 'POST':
-        answer_text = request.POST.get('answer', '')
-        question = questions[current_index]
-        user_answers[question['question_text']] = answer_text
-        request.session['user_answers'] = user_answers
-        next_index = current_index + 1
-        request.session['current_question_index'] = next_index
-
-        if next_index >= len(questions):
-            latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
-            profile = get_single_profile(request.user)
-
-            total_score = 0
-            scored_answers = {}
-            for q in questions:
-                q_text = q['question_text']
-                ans_text = user_answers.get(q_text, '')
-                keywords = q.get('keywords', [])
-                pre_tokenized = q.get('tokens', None)  # Use pre-tokenized if available
-                level = q.get('level', 'beginner')
-                # Use improved composite scoring (via utils.score_single_answer)
-                score = score_single_answer(ans_text, keywords, pre_tokenized=pre_tokenized, level=level)
-                total_score += score
-                scored_answers[q_text] = {
-                    'answer': ans_text,
-                    'score': round(score,2),
-                    'keywords': keywords,
-                    'tokens': pre_tokenized,  # Store tokens for breakdown later
-                    'level': q.get('level','beginner')
-                }
-            avg_score = total_score / len(questions) if questions else 0
-
-            from .utils import evaluate_interview_answers
-            user_answers_for_eval = {q_text: data['answer'] for q_text, data in scored_answers.items()}
-            try:
-                eval_results = evaluate_interview_answers(
-                    user_id=profile.unique_user_id,
-                    field='general',
-                    current_level=interview_level,
-                    user_answers=user_answers_for_eval
-                )
-            except Exception as e:
-                print(f"Evaluation error: {e}")
-                eval_results = None
-
-            from .models import InterviewSession as InterviewSessionModel
-            from django.utils.crypto import get_random_string
-            session_id = get_random_string(12)
-            interview_session = InterviewSessionModel(
-                session_id=session_id,
-                username=request.user.username,
-                skills=latest_resume.skills if latest_resume else [],
-                answers=scored_answers,
-                score=round(avg_score,2),
-                current_level=interview_level,
-                recommended_next_level=eval_results['recommended_next_level'] if eval_results else interview_level,
-                evaluation_flag=eval_results['overall_flag'] if eval_results else 'Same',
-                flag_records=eval_results['flag_record'] if eval_results else {}
-            )
-            interview_session.save()
+        if _record_fixed_answer(request, state, request.POST.get('answer', '')):
+            return _complete_fixed_interview(request, state['question_ids'], state['user_answers'],
+                                             state['interview_level'])
+        return redirect('interview_question')
 
-            if eval_results and eval_results['recommended_next_level'] != interview_level:
-                profile.current_level = eval_results['recommended_next_level']
-                profile.save()
+    question = get_question(state['question_ids'][state['current_index']]) or {}
+    return render(request, 'interview/question_page.html', _fixed_question_context(state, question))
 
-            messages.success(request, f"Interview completed! Your score: {round(avg_score*100,1)}%")
 
-            # Clear session keys
-            for key in ['interview_questions','current_question_index','user_answers','interview_level']:
-                if key in request.session:
-                    del request.session[key]
-            return redirect('interview_results', session_id=session_id)
-        else:
-            return redirect('interview_question')
+# ------------------------------------------------------------
+# Interview flow steps shared with async_views.interview_question_view.
+# The _load_* and _next_* steps look questions up in the question index,
+# so the async view runs them in a thread.
+# ------------------------------------------------------------
 
-    current_question = questions[current_index]
-    context = {
-        'question': {'text': current_question.get('question_text','')},
-        'question_number': current_index + 1,
-        'total_questions': len(questions),
-        'current_level': interview_level,
+def _interview_gate(request):
+    """Redirect before any question is shown, or None to carry on."""
+    # Ensure instructions have been acknowledged for a new session
+    if request.session.get('instructions_pending'):
+        return redirect('interview_instructions')
+    if is_legacy_interview_state(request.session):
+        return _restart_legacy_interview(request, request.session.get('interview_mode', 'fixed'))
+    return None
+
+
+def _load_adaptive_interview(request):
+    """Adaptive interview state from the session, choosing a current question if there is none.
+
+    Returns None when no question is left to ask.
+    """
+    skills = request.session.get('skills', [])
+    base_level = request.session.get('interview_level', 'beginner')
+    target_total = int(request.session.get('target_total', 9))
+    # Compact entries: [question_id, score, answer_text]
+    answered_entries = request.session.get('answered', [])
+    answered = expand_answered(answered_entries)
+    current_id = request.session.get('current_question')
+    current_q = get_question(current_id) if current_id is not None else None
+    pool = request.session.get('question_pool')
+    if pool is None:
+        # Session started before pools existed: build one now and keep it
+        pool = build_adaptive_pool(skills, per_level=target_total * 2)
+
+    # If no current question (e.g., direct navigation), fetch one
+    if not current_q:
+        current_q = get_adaptive_questions(skills, answered, target_total=target_total, base_level=base_level, pool=pool)
+        request.session['question_pool'] = pool
+        if not current_q:
+            return None
+        request.session['current_question'] = current_q['id']
+
+    return {
+        'skills': skills,
+        'base_level': base_level,
+        'target_total': target_total,
+        'answered_entries': answered_entries,
+        'answered': answered,
+        'current_q': current_q,
+        'pool': pool,
+    }
+
+
+def _scoring_kwargs(question):
+    """composite_answer_score arguments for an answer to ``question`` (picklable, for run_cpu)."""
+    return {
+        'correct_keywords': question.get('keywords', []),
+        'level': question.get('level', 'beginner'),
+        'pre_tokenized': question.get('tokens', None),  # Use pre-tokenized if available
+        'question_id': question['id'],
+    }
+
+
+def _record_adaptive_answer(request, state, answer_text, score):
+    """Store a scored answer in the session; True when the interview is complete."""
+    current_q = state['current_q']
+    answered_entries = state['answered_entries']
+    # Update answered entries (the selector's view is rebuilt from them)
+    answered_entries.append([current_q['id'], round(score, 2), answer_text])
+    request.session['answered'] = answered_entries
+    state['answered'].append({
+        'question_text': current_q.get('question_text',''),
+        'level': current_q.get('level','beginner'),
+        'score': round(score, 2),
+    })
+
+    # Progress index
+    request.session['current_question_index'] = len(answered_entries)
+    return len(answered_entries) >= state['target_total']
+
+
+def _next_adaptive_question(request, state):
+    next_q = get_adaptive_questions(state['skills'], state['answered'], target_total=state['target_total'],
+                                    base_level=state['base_level'], pool=state['pool'])
+    request.session['question_pool'] = state['pool']
+    request.session['current_question'] = next_q['id'] if next_q else None
+
+
+def _adaptive_question_context(state):
+    current_q = state['current_q']
+    return {
+        'question': {'text': current_q.get('question_text','')},
+        'question_number': len(state['answered_entries']) + 1,
+        'total_questions': state['target_total'],
+        'current_level': current_q.get('level','beginner'),
+        'interview_mode': 'adaptive',
+    }
+
+
+def _load_fixed_interview(request):
+    """Fixed interview state from the session, or None when it has no question left."""
+    question_ids = request.session.get('interview_questions', [])
+    current_index = request.session.get('current_question_index', 0)
+    if not question_ids or current_index >= len(question_ids):
+        return None
+    return {
+        'question_ids': question_ids,
+        'current_index': current_index,
+        # Answers keyed by str(question_id)
+        'user_answers': request.session.get('user_answers', {}),
+        'interview_level': request.session.get('interview_level', 'beginner'),
+    }
+
+
+def _record_fixed_answer(request, state, answer_text):
+    """Store an answer in the session; True when it was the last question."""
+    question_ids = state['question_ids']
+    state['user_answers'][str(question_ids[state['current_index']])] = answer_text
+    request.session['user_answers'] = state['user_answers']
+    next_index = state['current_index'] + 1
+    request.session['current_question_index'] = next_index
+    return next_index >= len(question_ids)
+
+
+def _fixed_question_context(state, question):
+    return {
+        'question': {'text': question.get('question_text','')},
+        'question_number': state['current_index'] + 1,
+        'total_questions': len(state['question_ids']),
+        'current_level': state['interview_level'],
         'interview_mode': 'fixed',
     }
-    return render(request, 'interview/question_page.html', context)
 
 
+# Every session key an interview in progress may use (current and older layouts)
+INTERVIEW_SESSION_KEYS = [
+    'interview_mode', 'skills', 'target_total', 'answered', 'question_pool', 'current_question',
+    'current_question_index', 'interview_questions', 'user_answers', 'scored_answers',
+    'interview_level', 'instructions_pending',
+]
+
+
+def _restart_legacy_interview(request, mode):
+    """Drop an interview saved in the old session layout and start a fresh one in the same mode."""
+    for key in INTERVIEW_SESSION_KEYS:
+        if key in request.session:
+            del request.session[key]
+    messages.info(request, "Your interview was started before an update and could not be resumed, so a new one has been started.")
+    url = reverse('start_interview')
+    return redirect(url + '?mode=fixed' if mode == 'fixed' else url)
+
+
+def _complete_adaptive_interview(request, skills, base_level, answered_entries):
+    """Evaluate and save a finished adaptive interview; redirect to its results."""
+    profile = request.nexora.profile
+
+    # Breakdowns, echo flags and categories are stored now so results_view only reads
+    skill_to_category = skill_category_map(request.nexora.latest_resume)
+    scored_answers = build_scored_answers(answered_entries, skill_to_category)
+    total_score = sum(entry[1] for entry in answered_entries)
+    avg_score = total_score / len(answered_entries) if answered_entries else 0
+
+    from .utils import evaluate_interview_answers
+    user_answers_for_eval = {qt: meta['answer'] for qt, meta in scored_answers.items()}
+    try:
+        eval_results = evaluate_interview_answers(
+            user_id=profile.unique_user_id,
+            field='general',
+            current_level=base_level,
+            user_answers=user_answers_for_eval
+        )
+    except Exception as e:
+        print(f"Evaluation error: {e}")
+        eval_results = None
+
+    from .models import InterviewSession as InterviewSessionModel
+    from django.utils.crypto import get_random_string
+    session_id = get_random_string(12)
+    interview_session = InterviewSessionModel(
+        session_id=session_id,
+        username=request.user.username,
+        skills=skills,  # from the resume read when the interview started
+        answers=scored_answers,
+        score=round(avg_score, 2),
+        current_level=base_level,
+        recommended_next_level=eval_results['recommended_next_level'] if eval_results else base_level,
+        evaluation_flag=eval_results['overall_flag'] if eval_results else 'Same',
+        flag_records=eval_results['flag_record'] if eval_results else {}
+    )
+    interview_session.save()
+
+    if eval_results and eval_results['recommended_next_level'] != base_level:
+        profile.current_level = eval_results['recommended_next_level']
+        # The profile may come from the request.nexora cache; write only the level
+        profile.save(update_fields=['current_level'])
+
+    messages.success(request, f"Interview completed! Your score: {round(avg_score*100,1)}%")
+
+    # Clear session keys
+    for key in ['interview_mode','skills','target_total','answered','question_pool','current_question','current_question_index','interview_level']:
+        if key in request.session:
+            del request.session[key]
+    return redirect('interview_results', session_id=session_id)
+
+
+def _complete_fixed_interview(request, question_ids, user_answers, interview_level):
+    """Score, evaluate and save a finished fixed-mode interview; redirect to its results."""
+    latest_resume = request.nexora.latest_resume
+    profile = request.nexora.profile
+
+    entries = []
+    questions = []
+    for qid in question_ids:
+        q = get_question(qid)
+        if q is None:
+            continue
+        entries.append([qid, 0.0, user_answers.get(str(qid), '')])
+        # Use pre-tokenized keywords if available
+        questions.append({'keywords': q.get('keywords', []), 'tokens': q.get('tokens', None), 'id': qid})
+
+    # Scores and result-page breakdowns for every answer in one composite scoring pass
+    scored = composite_scores_and_breakdowns([entry[2] for entry in entries], questions)
+    total_score = 0
+    for entry, (score, _) in zip(entries, scored):
+        total_score += score
+        entry[1] = round(score, 2)
+    scored_answers = build_scored_answers(
+        entries,
+        skill_category_map(latest_resume),
+        breakdowns=[bd for _, bd in scored],
+    )
+    avg_score = total_score / len(question_ids) if question_ids else 0
+
+    from .utils import evaluate_interview_answers
+    user_answers_for_eval = {q_text: data['answer'] for q_text, data in scored_answers.items()}
+    try:
+        eval_results = evaluate_interview_answers(
+            user_id=profile.unique_user_id,
+            field='general',
+            current_level=interview_level,
+            user_answers=user_answers_for_eval
+        )
+    except Exception as e:
+        print(f"Evaluation error: {e}")
+        eval_results = None
+
+    from .models import InterviewSession as InterviewSessionModel
+    from django.utils.crypto import get_random_string
+    session_id = get_random_string(12)
+    interview_session = InterviewSessionModel(
+        session_id=session_id,
+        username=request.user.username,
+        skills=latest_resume.skills if latest_resume else [],
+        answers=scored_answers,
+        score=round(avg_score,2),
+        current_level=interview_level,
+        recommended_next_level=eval_results['recommended_next_level'] if eval_results else interview_level,
+        evaluation_flag=eval_results['overall_flag'] if eval_results else 'Same',
+        flag_records=eval_results['flag_record'] if eval_results else {}
+    )
+    interview_session.save()
+
+    if eval_results and eval_results['recommended_next_level'] != interview_level:
+        profile.current_level = eval_results['recommended_next_level']
+        # The profile may come from the request.nexora cache; write only the level
+        profile.save(update_fields=['current_level'])
+
+    messages.success(request, f"Interview completed! Your score: {round(avg_score*100,1)}%")
+
+    # Clear session keys
+    for key in ['interview_mode','interview_questions','current_question_index','user_answers','interview_level']:
+        if key in request.session:
+            del request.session[key]
+    return redirect('interview_results', session_id=session_id)
+
+
+def _legacy_answers(answers):
+    """(question text, meta) pairs for answers stored without breakdown/echo_answer/categories."""
+    return [(q_text, meta) for q_text, meta in answers.items()
+            if isinstance(meta, dict) and 'breakdown' not in meta]
+
+
+def _legacy_scoring_inputs(legacy):
+    """composite_scores_and_breakdowns arguments for the legacy answers."""
+    return (
+        [meta.get('answer') or '' for _, meta in legacy],
+        [{'keywords': meta.get('keywords') or [], 'tokens': meta.get('tokens') or None} for _, meta in legacy],
+    )
+
+
+def _apply_legacy_analytics(legacy, scored, skill_to_category):
+    for (q_text, meta), (_, bd) in zip(legacy, scored):
+        meta['breakdown'] = bd
+        meta['echo_answer'] = is_echo_answer(q_text, meta.get('answer') or '')
+        meta['categories'] = keyword_categories(meta.get('keywords') or [], skill_to_category)
+
+
+def _fill_legacy_answer_analytics(request, answers):
+    """Add breakdown/echo_answer/categories to answers stored without them."""
+    legacy = _legacy_answers(answers)
+    if not legacy:
+        return
+    skill_to_category = {}
+    try:
+        skill_to_category = skill_category_map(request.nexora.latest_resume)
+    except Exception as e:
+        print(f"Error loading skill categories: {e}")
+    scored = composite_scores_and_breakdowns(*_legacy_scoring_inputs(legacy))
+    _apply_legacy_analytics(legacy, scored, skill_to_category)
+
 
 @login_required(login_url='/login/')
 def results_view(request, session_id):
@@ -969,18 +1056,21 @@ def results_view(request, session_id):
     if session_data['username'] != request.user.username:
         return redirect('interview_dashboard')
     
-    # Get the InterviewSession object for level information
-    try:
-        from .models import InterviewSession
-        interview_session = InterviewSession.objects.get(session_id=session_id)
-    except InterviewSession.DoesNotExist:
-        interview_session = None
-    
+    answers = session_data['answers'] if isinstance(session_data.get('answers'), dict) else {}
+    # Breakdowns, echo flags and categories are stored when the interview is
+    # submitted; only sessions saved before that need them worked out here
+    _fill_legacy_answer_analytics(request, answers)
+
+    context = _results_context(session_id, session_data, answers)
+    return render(request, 'interview/results_page.html', context)
+
+
+def _results_context(session_id, session_data, answers):
+    """Results template context (no database access; shared with async_views)."""
     # Calculate detailed scores
-    score_details = calculate_interview_score(session_id)
+    score_details = calculate_interview_score(session_id, session_data=session_data)
 
     # Compute marks and performance level using answer_evaluation.evaluate_interview_complete
-    answers = session_data['answers'] if isinstance(session_data.get('answers'), dict) else {}
     try:
         from .answer_evaluation import evaluate_interview_complete
         user_answers_map = {qt: (meta.get('answer') if isinstance(meta, dict) else '') for qt, meta in answers.items()}
@@ -999,43 +1089,14 @@ def results_view(request, session_id):
     kw_counter = Counter()
     weak_kw_counter = Counter()
 
-    # Build skill -> category mapping from resume
-    skill_to_category = {}
     category_scores = defaultdict(list)
-    try:
-        from .models import Resume
-        latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
-        if latest_resume and isinstance(latest_resume.skill_categories, dict) and latest_resume.skill_categories:
-            for cat, skills_list in latest_resume.skill_categories.items():
-                if isinstance(skills_list, list):
-                    for skill in skills_list:
-                        skill_to_category[skill.lower().strip()] = cat
-    except Exception as e:
-        print(f"Error loading skill categories: {e}")
-
-    # recompute composite breakdown per answer for transparency
-    from .answer_evaluation import composite_breakdown
 
     for q_text, meta in answers.items():
         try:
             s = float(meta.get('score', 0))
         except Exception:
             s = 0.0
-        # compute breakdown based on saved level/keywords
-        level = (meta.get('level') or 'beginner') if isinstance(meta, dict) else 'beginner'
         kws = (meta.get('keywords') or []) if isinstance(meta, dict) else []
-        tokens = (meta.get('tokens') or None) if isinstance(meta, dict) else None  # Get pre-tokenized
-        ans_text = (meta.get('answer') or '') if isinstance(meta, dict) else ''
-        # flag if answer just echoes the question
-        try:
-            import re
-            norm_q = re.sub(r"\W+", "", (q_text or '').lower())
-            norm_a = re.sub(r"\W+", "", (ans_text or '').lower())
-            meta['echo_answer'] = bool(norm_q and norm_q == norm_a)
-        except Exception:
-            meta['echo_answer'] = False
-        bd = composite_breakdown(ans_text, kws, level=level, pre_tokenized=tokens)
-        meta['breakdown'] = bd
 
         total_score += s
         if s >= 0.75:
@@ -1051,12 +1112,8 @@ def results_view(request, session_id):
                 kw_counter[kw] += 1
                 if s < 0.5:
                     weak_kw_counter[kw] += 1
-                
-                # Map keyword to category and track scores
-                kw_clean = kw.lower().strip()
-                if kw_clean in skill_to_category:
-                    category = skill_to_category[kw_clean]
-                    category_scores[category].append(s)
+        for category in ((meta.get('categories') or []) if isinstance(meta, dict) else []):
+            category_scores[category].append(s)
 
     avg_pct = round((total_score / total_q) * 100, 1) if total_q else 0
     breakdown_overall = {}  # No longer calculating average coverage/depth
@@ -1100,9 +1157,9 @@ def results_view(request, session_id):
         'session': {
             'final_score': session_data['score'],
             'username': session_data['username'],
-            'current_level': interview_session.current_level if interview_session else 'beginner',
-            'recommended_next_level': interview_session.recommended_next_level if interview_session else None,
-            'evaluation_flag': interview_session.evaluation_flag if interview_session else None,
+            'current_level': session_data.get('current_level') or 'beginner',
+            'recommended_next_level': session_data.get('recommended_next_level'),
+            'evaluation_flag': session_data.get('evaluation_flag'),
         },
         'answers': answers,
         'skills': skills_list,
@@ -1110,5 +1167,4 @@ def results_view(request, session_id):
         'analytics': analytics,
         'marks': eval_summary if eval_summary else None,
     }
-    
-    return render(request, 'interview/results_page.html', context)
+    return context
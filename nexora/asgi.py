@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nexora.settings')
+# Serve the interview flow's hot views with interview.async_views (see NEXORA_ASYNC)
+os.environ.setdefault('NEXORA_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -47,6 +48,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'interview.request_context.NexoraContextMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -134,4 +136,75 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Media files (for user uploads like resumes)
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Nexora interview engine
+# Fuzzy keyword matcher used by answer scoring: "fast" or "difflib" (reference)
+NEXORA_FUZZY_ENGINE = 'fast'
+
+# Compiled question bank shared by all workers through mmap, e.g.
+# BASE_DIR / 'question_bank.snapshot': question selection reads it instead of
+# querying MongoDB. Built by build_question_snapshot, import_questions and
+# tokenize_questions only; a Question save/delete marks it stale and workers
+# use the database index until it is rebuilt. None = always use the database.
+NEXORA_QUESTION_SNAPSHOT = None
+
+# Seconds request.nexora.profile / latest_resume are reused across requests
+# (Django's default cache; 0 = look them up once per request only)
+NEXORA_CONTEXT_CACHE_TTL = 30
+
+# ASGI request path (nexora/asgi.py sets NEXORA_ASYNC_VIEWS=1): dashboard,
+# interview question and results pages run as async views. Reads use motor
+# when it is installed (MOTOR), otherwise pymongo on DB_THREADS threads;
+# answer scoring runs in CPU_WORKERS processes (0 = on those threads).
+NEXORA_ASYNC = {
+    'VIEWS': os.environ.get('NEXORA_ASYNC_VIEWS') == '1',
+    'MOTOR': True,
+    'DB_THREADS': 32,
+    'CPU_WORKERS': 2,
+}
+
+# spaCy model for resume parsing; loaded on first use unless NEXORA_WARM_NLP is set
+NEXORA_SPACY_MODEL = 'en_core_web_sm'
+# Pipeline components not loaded at all (resume parsing only needs tokenizer + NER)
+NEXORA_SPACY_DISABLED_COMPONENTS = ('tagger', 'parser', 'attribute_ruler', 'lemmatizer')
+# Load the model in InterviewConfig.ready() instead of on the first upload
+NEXORA_WARM_NLP = False
+
+# Scanned-PDF OCR: pages are rendered and read one per pool worker (None = min(4, cores)).
+# Resume-queue parser processes use NEXORA_RESUME_QUEUE OCR_PROCESSES instead.
+NEXORA_OCR_PROCESSES = None
+NEXORA_OCR_DPI = 200
+
+# Resume PDF text extraction stops at whichever limit it hits first and the
+# parse uses the text read so far (0 = no limit). The time budget is in
+# seconds, checked between pages, and includes the OCR fallback.
+NEXORA_PDF_MAX_PAGES = 20
+NEXORA_PDF_MAX_CHARS = 200000
+NEXORA_PDF_TIME_BUDGET = 30
+
+# Resume uploads are stored as PATH/<hash[:2]>/<sha256><ext> (identical files
+# share one copy) and their parses cached per hash and parser version under
+# CACHE_PATH. `manage.py collect_resume_files` removes unreferenced files.
+NEXORA_RESUME_STORE = {
+    'PATH': MEDIA_ROOT / 'resumes',
+    'CACHE_PATH': MEDIA_ROOT / 'resume_cache',
+}
+
+# Resume parsing queue. Uploads return at once with a job id; parsing (text,
+# OCR, NLP) runs in a process pool. BACKEND: 'filesystem' (job files under
+# PATH), 'mongo' (COLLECTION in the default database) or 'inline' (parse in
+# the request, the old behaviour). With AUTOSTART each web process parses in
+# a pool of its own; set it to False in deployments that run
+# `manage.py process_resume_jobs` as a separate worker.
+# Each parser process OCRs with OCR_PROCESSES workers of its own.
+# Finished jobs are kept for KEEP_FINISHED seconds.
+NEXORA_RESUME_QUEUE = {
+    'BACKEND': 'filesystem',
+    'PATH': MEDIA_ROOT / 'resume_jobs',
+    'COLLECTION': 'interview_resumejob',
+    'PROCESSES': 2,
+    'OCR_PROCESSES': 1,
+    'AUTOSTART': True,
+    'KEEP_FINISHED': 86400,
+}